@@ -0,0 +1,216 @@
+"""
+Micro-benchmarks for the BasePage / HomePage primitives on every test's hot path.
+
+Each primitive runs many times in a headless browser against a local HTML fixture
+(benchmarks/fixtures/). Latency percentiles and WebDriver round-trips per call are
+reported and saved to .cache/benchmarks/latest.json; with a baseline present, the run
+fails when a primitive got slower or needs more round-trips.
+
+Usage:
+    python -m benchmarks.run_benchmarks                     # run and compare to the baseline
+    python -m benchmarks.run_benchmarks --save-baseline     # store this run as benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --case click_element --iterations 200
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+from pages.home_page import HomePage
+from utils.command_tracer import get_tracer
+from utils.config_reader import ConfigReader
+from utils.driver_factory import create_driver
+from utils.lean_profile import LeanProfile
+from utils.logger import get_logger
+
+logger = get_logger("benchmarks")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+FIXTURE_URL = Path(BENCH_DIR, "fixtures", "primitives.html").as_uri()
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+RESULTS_DIR = os.path.join(PROJECT_ROOT, ".cache", "benchmarks")
+
+HEADING = (By.ID, "heading")
+MESSAGE = (By.ID, "message")
+HIDDEN_MESSAGE = (By.ID, "hidden-message")
+MISSING = (By.ID, "does-not-exist")
+COUNTER_BTN = (By.ID, "counter-btn")
+TEXT_INPUT = (By.ID, "text-input")
+# Union whose declared primary never matches, as after a site redesign
+STALE_PRIMARY_UNION = (By.XPATH, "//button[contains(text(), 'Old label')] | //button[@id='counter-btn']")
+PROBE_SET = {
+    "heading": HEADING,
+    "message": MESSAGE,
+    "counter": COUNTER_BTN,
+    "city": (By.XPATH, "//input[contains(@placeholder, 'location')]"),
+}
+
+
+class BenchCase:
+    """One primitive to time; `iterations` overrides the run default for slow cases"""
+
+    def __init__(self, name, call, iterations=None):
+        self.name = name
+        self.call = call
+        self.iterations = iterations
+
+
+CASES = [
+    BenchCase("click_element", lambda page: page.click_element(COUNTER_BTN)),
+    BenchCase("send_keys", lambda page: page.send_keys(TEXT_INPUT, "General Physician")),
+    BenchCase("get_text", lambda page: page.get_text(MESSAGE)),
+    BenchCase("is_element_present", lambda page: page.is_element_present(HEADING)),
+    BenchCase("is_element_visible", lambda page: page.is_element_visible(MESSAGE)),
+    # Negative checks wait out the full timeout, so they run a handful of times only
+    BenchCase("is_element_present_absent", lambda page: page.is_element_present(MISSING), iterations=3),
+    BenchCase("is_element_visible_hidden", lambda page: page.is_element_visible(HIDDEN_MESSAGE), iterations=3),
+    BenchCase("is_element_present_expect_absent", lambda page: page.is_element_present(MISSING, expect="absent"), iterations=10),
+    BenchCase("is_element_visible_expect_hidden", lambda page: page.is_element_visible(HIDDEN_MESSAGE, expect="hidden"), iterations=10),
+    # Same four checks as separate commands vs one batched probe
+    BenchCase("four_presence_checks", lambda page: [page.is_element_present(loc) for loc in PROBE_SET.values()]),
+    BenchCase("probe_four_locators", lambda page: page.probe(PROBE_SET)),
+    BenchCase("find_ranked_stale_primary", lambda page: page.find_ranked(STALE_PRIMARY_UNION)),
+    BenchCase("find_input_by_placeholder", lambda page: page._find_input_by_placeholder(["city", "location"])),
+    BenchCase("select_radio_option", lambda page: page._select_radio_option("5+ Years of experience"), iterations=10),
+    BenchCase("select_from_dropdown_list", lambda page: page._select_from_dropdown_list(
+        page._find_input_by_placeholder(["city", "location"]), "Pune", arrow_downs=2, wait_before=0.5, wait_after=0.8
+    ), iterations=5),
+]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_case(driver, case, iterations, warmup):
+    page = HomePage(driver)
+    tracer = get_tracer(driver)
+    driver.get(FIXTURE_URL)
+
+    # Slow cases skip the warm-up; their cost is dominated by waiting, not by first-call effects
+    for _ in range(warmup if case.iterations is None else 0):
+        case.call(page)
+
+    latencies, round_trips = [], []
+    for _ in range(case.iterations or iterations):
+        commands_before = tracer.count
+        started = time.perf_counter()
+        case.call(page)
+        latencies.append((time.perf_counter() - started) * 1000)
+        round_trips.append(tracer.count - commands_before)
+
+    return {
+        "iterations": len(latencies),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p90_ms": round(percentile(latencies, 90), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(statistics.mean(latencies), 3),
+        "min_ms": round(min(latencies), 3),
+        "max_ms": round(max(latencies), 3),
+        "round_trips": round(statistics.mean(round_trips), 2),
+    }
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """Regressions vs the baseline: slower p50 beyond threshold, or more round-trips"""
+    regressions = []
+    for name, current in results["cases"].items():
+        before = baseline.get("cases", {}).get(name)
+        if before is None:
+            continue
+        allowed = before["p50_ms"] * (1 + threshold) + min_delta_ms
+        if current["p50_ms"] > allowed:
+            regressions.append(f"{name}: p50 {before['p50_ms']:.1f}ms -> {current['p50_ms']:.1f}ms")
+        if current["round_trips"] > before["round_trips"]:
+            regressions.append(f"{name}: round-trips {before['round_trips']} -> {current['round_trips']}")
+    return regressions
+
+
+def print_table(results, baseline=None):
+    print(f"{'case':<34}{'calls':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'trips':>7}{'base p50':>10}")
+    for name, stats in results["cases"].items():
+        before = (baseline or {}).get("cases", {}).get(name)
+        base = f"{before['p50_ms']:.1f}" if before else "-"
+        print(f"{name:<34}{stats['iterations']:>6}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['round_trips']:>7}{base:>10}")
+
+
+def _load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark BasePage primitives against local fixtures")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed calls per case (default: 50)")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed calls before each case (default: 2)")
+    parser.add_argument("--case", action="append", dest="cases", help="Run only this case (repeatable)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline results file")
+    parser.add_argument("--save-baseline", action="store_true", help="Save this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed p50 slowdown ratio (default: 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="Ignore p50 changes below this (default: 2ms)")
+    args = parser.parse_args(argv)
+
+    cases = [c for c in CASES if not args.cases or c.name in args.cases]
+    if not cases:
+        parser.error(f"no such case; choose from: {', '.join(c.name for c in CASES)}")
+
+    cfg = ConfigReader()
+    driver = create_driver(cfg, LeanProfile(headless=True, window_size="1366,768"), use_standin=False)
+    results = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "browser": (cfg.get_value("browser") or "").lower(),
+        "platform": platform.platform(),
+        "cases": {},
+    }
+    try:
+        for case in cases:
+            logger.info(f"Benchmarking {case.name}")
+            results["cases"][case.name] = run_case(driver, case, args.iterations, args.warmup)
+    finally:
+        driver.quit()
+
+    _write_json(os.path.join(RESULTS_DIR, "latest.json"), results)
+    _write_json(os.path.join(RESULTS_DIR, f"run_{datetime.now():%Y%m%d_%H%M%S}.json"), results)
+
+    baseline = _load_json(args.baseline)
+    print_table(results, baseline)
+
+    if args.save_baseline:
+        _write_json(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if baseline is None:
+        print("No baseline yet - run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
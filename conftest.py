@@ -1,20 +1,88 @@
 
-import allure
-import pytest
+import os
+import time
 
-from selenium import webdriver
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
+import pytest
 
+from pages.doctors_page import DoctorsPage
+from utils.auth_state import AuthStateManager
+from utils.command_profile import enable_profiling, is_enabled as command_profile_enabled, write_command_trace
 from utils.config_reader import ConfigReader
-from utils.logger import get_logger
-from utils.screenshot_util import ScreenshotUtil
+from utils.driver_factory import create_driver
+from utils.dom_settle import SETTLE_STATS
+from utils.element_cache import CACHE_STATS
+from utils.driver_pool import DriverPool
+from utils.lean_profile import LeanProfile, NetworkSavings
+from utils.logger import get_logger, log_context
+from utils.page_timing import finish_page_timing, is_enabled as page_timing_enabled, start_page_timing, write_run_file
+from utils.parallel_runner import run_and_merge, select_shard
+from utils.report_builder import ReportBuilder
+from utils.screenshot_util import ScreenshotUtil, flush_screenshots
+from utils.step_timer import finish_timeline, start_timeline
+from utils.standin_server import ensure_standin_running, is_enabled as standin_enabled
+from utils.test_data_cache import get_manifest_rows
+from utils.web_vitals import finish_web_vitals, is_enabled as web_vitals_enabled, start_web_vitals
 
 logger = get_logger("conftest")
 
+_report = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("practo", "Practo framework options")
+    group.addoption("--workers", type=int, default=1,
+                    help="Shard parametrized rows across N worker processes, each with its own browser")
+    group.addoption("--shard-index", type=int, default=0, help="Index of this shard (set by --workers)")
+    group.addoption("--shard-count", type=int, default=1, help="Total number of shards (set by --workers)")
+    group.addoption("--page-timing", action="store_true",
+                    help="Capture Navigation/Resource Timing after every page load (same as page_timing=true)")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """With --workers N, run N sharded pytest processes instead of the tests themselves"""
+    workers = config.getoption("workers")
+    if workers <= 1 or config.getoption("shard_count") > 1:
+        return None
+
+    cfg = ConfigReader()
+    alluredir = os.path.abspath(config.getoption("allure_report_dir", None) or "reports")
+    screenshot_dir = os.path.join(os.path.dirname(__file__), cfg.get_value("screenshot_path") or "screenshots/")
+    # One stand-in for all workers, alive until the last shard has finished
+    server = ensure_standin_running(cfg) if standin_enabled(cfg) else None
+    # This process skips pytest_configure/unconfigure, so the summary is written here
+    started_ms = int(time.time() * 1000)
+    try:
+        exit_code = run_and_merge(config.invocation_params.args, workers, alluredir, screenshot_dir)
+    finally:
+        if server is not None:
+            server.stop()
+    ReportBuilder(alluredir).write(since_ms=started_ms)
+    return exit_code
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize row_number from @pytest.mark.datafile(<xlsx>, sheet=<name>)"""
+    marker = metafunc.definition.get_closest_marker("datafile")
+    if marker is None or "row_number" not in metafunc.fixturenames:
+        return
+
+    file_name = marker.args[0]
+    sheet_name = marker.kwargs.get("sheet")
+    metafunc.parametrize("row_number", get_manifest_rows(file_name, sheet_name))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep only this worker's share of the collected rows"""
+    shard_count = config.getoption("shard_count")
+    if shard_count <= 1:
+        return
+
+    selected, deselected = select_shard(items, config.getoption("shard_index"), shard_count)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
 
 @pytest.fixture(scope="session")
 def config():
@@ -22,8 +90,67 @@ def config():
     return ConfigReader()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def standin_site():
+    """Local Practo stand-in (standin=true in config); browsers resolve practo.com to it"""
+    cfg = ConfigReader()
+    server = ensure_standin_running(cfg) if standin_enabled(cfg) else None
+
+    yield server
+
+    if server is not None:
+        server.stop()
+
+
+@pytest.fixture(autouse=True)
+def test_log_context(request):
+    """Tag every log record of the test with its node id and data row"""
+    callspec = getattr(request.node, "callspec", None)
+    row = callspec.params.get("row_number") if callspec else None
+    with log_context(test=request.node.nodeid, row=row):
+        yield
+
+
+@pytest.fixture(scope="session")
+def lean_profile():
+    """Launch profile (headless, viewport, images, URL blocklist) from config"""
+    return LeanProfile.from_config(ConfigReader())
+
+
+@pytest.fixture(scope="session")
+def network_savings(lean_profile):
+    """Per-test request/byte accounting; learned resource sizes are kept across runs"""
+    savings = NetworkSavings(lean_profile.url_patterns, enabled=lean_profile.network_log)
+    yield savings
+    savings.save_sizes()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(lean_profile):
+    """Session-wide pool of browser sessions shared by all tests"""
+    cfg = ConfigReader()
+    max_uses = int(cfg.get_value("browser_pool_max_uses", "25"))
+    prewarm = (cfg.get_value("browser_pool_prewarm", "true") or "").lower() == "true"
+    pool = DriverPool(lambda: create_driver(cfg, lean_profile), max_uses=max_uses, prewarm=prewarm)
+    if prewarm:
+        # The first browser starts launching while the remaining session fixtures are set up
+        pool.prewarm()
+
+    yield pool
+
+    pool.close_all()
+
+
+@pytest.fixture(scope="session")
+def auth_state():
+    """Login-once helper: saved cookies/web storage injected into sessions"""
+    cfg = ConfigReader()
+    ttl_minutes = float(cfg.get_value("auth_state_ttl_minutes", "720"))
+    return AuthStateManager(cfg.get_value("base_url"), ttl_minutes=ttl_minutes)
+
+
 @pytest.fixture(scope="function")
-def driver(request):
+def driver(request, driver_pool, auth_state, network_savings):
     cfg = ConfigReader()  # reads config/config.properties
     browser = (cfg.get_value("browser") or "").lower()
     base_url = cfg.get_value("base_url")
@@ -31,45 +158,71 @@ def driver(request):
     logger.info(f"Starting test: {request.node.name}")
     logger.info(f"Browser selected: {browser}")
 
-    if browser == "edge":
-        options = EdgeOptions()
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--log-level=3")
-        driver = webdriver.Edge(
-            service=EdgeService("resources/msedgedriver.exe"),
-            options=options
-        )
-
-    elif browser == "chrome":
-        options = ChromeOptions()
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--log-level=3")
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
-            options=options
-        )
+    session = driver_pool.acquire()
+    driver = session.driver
 
+    if session.reused:
+        saved = driver_pool.average_launch_seconds()
+        logger.info(f"Reusing browser session #{session.session_number} (use {session.uses}), launch time saved: {saved:.2f}s")
+    elif session.prewarmed:
+        saved = max(0.0, session.launch_seconds - session.acquire_seconds)
+        logger.info(f"Using pre-warmed browser session #{session.session_number}, waited {session.acquire_seconds:.2f}s")
     else:
-        raise ValueError(f"Unsupported browser: {browser}")
-
-    driver.get(base_url)
+        saved = 0.0
+    request.node.user_properties.append(("browser_launch_seconds", 0.0 if session.reused else round(session.acquire_seconds, 3)))
+    request.node.user_properties.append(("browser_launch_saved_seconds", round(saved, 3)))
+    network_savings.reset(driver)
+    start_timeline(request.node.name, request.node.nodeid, driver)
+    if page_timing_enabled(cfg, request.config.getoption("page_timing")):
+        start_page_timing(driver, request.node.nodeid)
+    if web_vitals_enabled(cfg):
+        # Registered before the first navigation so observers see each page from its start
+        start_web_vitals(driver, request.node.nodeid, marks=DoctorsPage.VITALS_MARKS)
+
+    if request.node.get_closest_marker("authenticated"):
+        # Restores the saved login state (or logs in once) and leaves the driver on base_url
+        auth_state.ensure_authenticated(driver, cfg.get_value("email"), cfg.get_value("password"))
+    else:
+        driver.get(base_url)
 
     yield driver
 
     logger.info(f"Tearing down test: {request.node.name}")
-    driver.quit()
+    finish_timeline()
+    finish_page_timing(driver)
+    finish_web_vitals(driver)
+    net = network_savings.collect(driver)
+    if net is not None:
+        logger.info(
+            f"Network for {request.node.name}: {net['requests']} requests, {net['bytes'] / 1024:.0f} KB loaded, "
+            f"{net['blocked_requests']} requests blocked (~{net['blocked_bytes_estimate'] / 1024:.0f} KB avoided)"
+        )
+        for key, value in net.items():
+            request.node.user_properties.append((f"network_{key}", value))
+    auth_state.remove_injection(driver)
+    driver_pool.release(session)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Log run-level totals from the performance helpers"""
+    # Pending screenshot writes must land before shard screenshots are merged
+    flush_screenshots()
+    write_run_file()
+    write_command_trace()
+    if SETTLE_STATS["calls"]:
+        logger.info(
+            f"DOM settle: {SETTLE_STATS['calls']} waits ({SETTLE_STATS['settled']} settled), "
+            f"{SETTLE_STATS['waited_seconds']:.1f}s waited, {SETTLE_STATS['saved_seconds']:.1f}s saved vs fixed sleeps"
+        )
+    if CACHE_STATS["hits"] or CACHE_STATS["misses"]:
+        logger.info(
+            f"Element cache: {CACHE_STATS['hits']} hits (find round-trips avoided), {CACHE_STATS['misses']} misses, "
+            f"{CACHE_STATS['stale_refreshes']} stale re-resolves, {CACHE_STATS['invalidations']} navigation invalidations"
+        )
 
 
 # ====================== Allure reports hookup ======================
 
-import os  # keep imports local/minimal where needed
-
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
@@ -77,60 +230,47 @@ def pytest_runtest_makereport(item, call):
 
     if report.when == "call" and report.failed:
         driver = item.funcargs.get("driver")
-        if driver:
-            cfg = ConfigReader()
+        cfg = ConfigReader()
+        if driver and (cfg.get_value("take_screenshot_on_failure", "true") or "").lower() == "true":
             out_dir = cfg.get_value("screenshot_path") or "screenshots/"
 
-            # ✅ Instantiate and then take the screenshot
+            # ✅ Attached from memory; the PNG is written to disk in the background
             su = ScreenshotUtil(driver, out_dir)
-            screenshot_path = su.take_screenshot(item.name)
+            screenshot_path = su.take_screenshot(item.name, attach=True)
 
             logger.error(f"Test failed: {item.name}")
             logger.error(f"Screenshot saved at: {screenshot_path}")
 
-            # Attach to Allure if file exists
-            if screenshot_path and os.path.isfile(screenshot_path):
-                with open(screenshot_path, "rb") as image:
-                    allure.attach(
-                        image.read(),
-                        name=item.name,
-                        attachment_type=allure.attachment_type.PNG
-                    )
-ALLURE_PATH = r"C:\Users\arnagarw\Downloads\allure-2.36.0\bin\allure.bat"  # adjust if needed
 
+def _report_builder(config):
+    """Summary builder over this run's Allure results dir (created on first use)"""
+    if "builder" not in _report:
+        results_dir = os.path.abspath(config.getoption("allure_report_dir", None) or "reports")
+        _report["builder"] = ReportBuilder(results_dir)
+    return _report["builder"]
 
-def pytest_unconfigure(config):
-    import subprocess, os
 
-    project_root = os.getcwd()
-    results_dir = os.path.join(project_root, "reports")
-    output_dir = os.path.join(project_root, "allure-results")
+def pytest_configure(config):
+    # Results older than this belong to earlier runs and stay out of the summary
+    _report["started_ms"] = int(time.time() * 1000)
+    _report["config"] = config
+    if command_profile_enabled():
+        enable_profiling()
 
-    if not os.path.exists(results_dir):
-        logger.info("No Allure results found. Skipping.")
-        return
 
-    logger.info("Generating Allure HTML...")
+def pytest_runtest_logstart(nodeid, location):
+    """Read the results written so far (the previous test's) so the summary is built incrementally"""
+    config = _report["config"]
+    if config.getoption("shard_count", 1) <= 1:
+        _report_builder(config).ingest()
 
-    cmd = [
-        ALLURE_PATH,
-        "generate",
-        results_dir,
-        "-o",
-        output_dir,
-        "--clean"
-    ]
 
-    result = subprocess.run(cmd, shell=True)
+def pytest_unconfigure(config):
+    # Shard workers leave report generation to the --workers parent (pytest_cmdline_main) after the merge
+    if config.getoption("shard_count", 1) > 1:
+        return
 
-    if result.returncode == 0:
-        logger.info(
-            "Allure HTML report generated successfully at %s",
-            os.path.join(output_dir, "index.html")
-        )
-    else:
-        logger.error("Allure HTML generation failed.")
+    _report_builder(config).write(since_ms=_report.get("started_ms"))
 
-# commands
-# On Terminal : python -m http.server 9999
-# On browser  :  http://localhost:9999/allure-reports/index.html
\ No newline at end of file
+# Static summary: reports/summary/index.html (python -m utils.report_builder rebuilds it)
+# Full Allure report, when the Allure CLI is installed: allure generate reports -o allure-results --clean
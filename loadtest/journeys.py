@@ -0,0 +1,83 @@
+"""
+User journeys replayed by the load runner, built from the functional tests' page objects.
+
+A journey is a function of a `VirtualUser`; each of its steps runs inside
+`user.step(name)`, which times it and then waits a think time. Test data comes from the
+same workbooks as the tests, one row per iteration.
+"""
+from pages.booking_page import BookingPage
+from pages.corporate_page import CorporatePage
+from pages.doctors_page import DoctorsPage
+from pages.home_page import HomePage
+from utils.test_data_reader import (
+    get_all_test_rows,
+    get_all_tc_06_rows,
+    get_test_data_by_row,
+    get_test_data_tc_06_by_row,
+)
+
+
+def booking_journey(user, data):
+    """test_doctor_appointment_booking: search -> filter -> book"""
+    home = HomePage(user.driver)
+    with user.step("open home"):
+        home.navigate_to_url(user.base_url)
+        home.wait_for_settle(replaces=2)
+
+    with user.step("search doctors"):
+        home.click_find_doctors()
+        home.enter_location(data.get("Location") or "Bangalore")
+        home.select_doctor_type(data.get("DoctorType") or "Dentist")
+        doctors = DoctorsPage(user.driver)
+        assert doctors.wait_for_results(), "No doctor cards after search"
+
+    filters = [(data.get("Gender"), doctors.apply_gender_filter),
+               (data.get("FeeFilter"), lambda _: doctors.sort_by_fees()),
+               (data.get("ExperienceFilter"), doctors.apply_experience_filter)]
+    if any(value for value, _ in filters):
+        with user.step("apply filters"):
+            for value, apply in filters:
+                if value:
+                    apply(value)
+
+    with user.step("open slots"):
+        doctors.click_book_clinic_visit()
+        booking = BookingPage(user.driver)
+        assert booking.wait_for_slots(), "No time slots after Book Clinic Visit"
+
+    with user.step("pick slot"):
+        booking.select_tomorrow()
+        booking.select_first_slot()
+        if user.confirm_booking:
+            booking.confirm_clinic_visit()
+
+
+def corporate_journey(user, data):
+    """test_tc_06_for_corporates: For Corporates menu -> demo request form"""
+    corporate = CorporatePage(user.driver)
+    with user.step("open home"):
+        corporate.navigate_to_url(user.base_url)
+        corporate.wait_for_settle(replaces=2)
+
+    with user.step("open corporate plans"):
+        corporate.open_corporate_option()
+
+    with user.step("submit demo form"):
+        corporate.fill_demo_form(data.get("Name", ""), data.get("OrganizationName", ""),
+                                 data.get("ContactNumber", ""), data.get("OfficialEmailId", ""),
+                                 data.get("OrganizationSize", ""), data.get("InterestedIn", ""))
+        corporate.submit_demo_form()
+
+
+# name -> (journey, test data rows, row reader)
+JOURNEYS = {
+    "booking": (booking_journey, get_all_test_rows, get_test_data_by_row),
+    "corporate": (corporate_journey, get_all_tc_06_rows, get_test_data_tc_06_by_row),
+}
+
+
+def load_data(name):
+    """All test data rows of a journey, read once before the run"""
+    _, rows, reader = JOURNEYS[name]
+    data = [reader(row) for row in rows()]
+    return [row for row in data if row] or [{}]
@@ -0,0 +1,277 @@
+"""
+Load generation with the functional journeys (loadtest/journeys.py).
+
+N virtual users, each with its own headless browser, replay the booking and/or corporate
+journeys against base_url - normally the local Practo stand-in - until the duration is
+over. Users start evenly spread over the ramp-up; between steps each user waits a think
+time drawn from the configured distribution. The report gives throughput and
+p50/p95/p99 latency per step and per journey, and is saved to reports/load/.
+
+Usage:
+    python -m loadtest.run_load --standin                          # load_* defaults from config
+    python -m loadtest.run_load --standin --users 10 --ramp-up 30 --duration 300
+    python -m loadtest.run_load --journey corporate --think-time 1 --think-distribution uniform
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from selenium.common.exceptions import InvalidSessionIdException
+
+from loadtest.journeys import JOURNEYS, load_data
+from utils import standin_server
+from utils.command_profile import enable_profiling, is_enabled as command_profile_enabled, write_command_trace
+from utils.config_reader import ConfigReader
+from utils.driver_factory import create_driver
+from utils.lean_profile import LeanProfile
+from utils.logger import get_logger, log_context
+from utils.wait_policy import percentile
+
+logger = get_logger("load_runner")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THINK_DISTRIBUTIONS = ("exponential", "uniform", "fixed")
+LAUNCH_RETRY_SECONDS = 5
+
+
+def think_time(mean, distribution, rng):
+    """Seconds to wait between steps; uniform spans 0..2x mean"""
+    if mean <= 0:
+        return 0.0
+    if distribution == "exponential":
+        return rng.expovariate(1.0 / mean)
+    if distribution == "uniform":
+        return rng.uniform(0, 2 * mean)
+    return mean
+
+
+class LoadStats:
+    """Latencies and errors per step and journey, shared by all users"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+        self.errors = {}
+        # Kept apart from the journeys so they do not count towards the journey error rate
+        self.launch_failures = 0
+
+    def record(self, name, seconds, ok):
+        with self._lock:
+            if ok:
+                self.samples.setdefault(name, []).append(seconds)
+            else:
+                self.errors[name] = self.errors.get(name, 0) + 1
+                self.samples.setdefault(name, [])
+
+    def record_launch_failure(self):
+        with self._lock:
+            self.launch_failures += 1
+
+    def summary(self, elapsed):
+        rows = {}
+        for name, samples in self.samples.items():
+            errors = self.errors.get(name, 0)
+            rows[name] = {
+                "count": len(samples),
+                "errors": errors,
+                "throughput_per_min": round(len(samples) / elapsed * 60, 2) if elapsed else 0.0,
+                "mean": round(sum(samples) / len(samples), 3) if samples else None,
+                "p50": round(percentile(samples, 50), 3) if samples else None,
+                "p95": round(percentile(samples, 95), 3) if samples else None,
+                "p99": round(percentile(samples, 99), 3) if samples else None,
+                "max": round(max(samples), 3) if samples else None,
+            }
+        return rows
+
+
+class VirtualUser(threading.Thread):
+    """One browser replaying journeys until the deadline"""
+
+    def __init__(self, number, runner):
+        super().__init__(name=f"user{number}", daemon=True)
+        self.number = number
+        self.runner = runner
+        self.base_url = runner.base_url
+        self.confirm_booking = runner.confirm_booking
+        self.driver = None
+        self._rng = random.Random(runner.seed + number)
+        self._journey = None
+
+    @contextmanager
+    def step(self, name):
+        """Time one journey step, then think"""
+        started = time.perf_counter()
+        ok = False
+        try:
+            with log_context(step=name):
+                yield
+            ok = True
+        finally:
+            self.runner.stats.record(f"{self._journey} > {name}", time.perf_counter() - started, ok)
+        time.sleep(think_time(self.runner.think_mean, self.runner.think_distribution, self._rng))
+
+    def run(self):
+        time.sleep(self.number * self.runner.ramp_up / self.runner.users)
+        iteration = 0
+        try:
+            with log_context(worker=self.name):
+                while time.monotonic() < self.runner.deadline:
+                    if self.driver is None and not self._launch():
+                        continue
+                    name = self.runner.journeys[(self.number + iteration) % len(self.runner.journeys)]
+                    self._run_journey(name, iteration)
+                    iteration += 1
+        finally:
+            if self.driver is not None:
+                self.driver.quit()
+
+    def _launch(self):
+        # Launch time is not part of any step
+        try:
+            self.driver = self.runner.launch()
+            return True
+        except Exception as e:
+            logger.error(f"Could not launch a browser: {e}")
+            self.runner.stats.record_launch_failure()
+            time.sleep(LAUNCH_RETRY_SECONDS)
+            return False
+
+    def _run_journey(self, name, iteration):
+        journey = JOURNEYS[name][0]
+        data = self.runner.data[name]
+        self._journey = name
+        started = time.perf_counter()
+        ok = False
+        try:
+            with log_context(test=f"load:{name}", row=iteration):
+                journey(self, data[iteration % len(data)])
+            ok = True
+        except InvalidSessionIdException:
+            logger.warning("Browser session lost, relaunching")
+            self.driver = None
+        except Exception as e:
+            logger.warning(f"Journey {name} failed: {str(e).splitlines()[0][:120] if str(e) else type(e).__name__}")
+        finally:
+            self.runner.stats.record(name, time.perf_counter() - started, ok)
+
+
+class LoadRunner:
+    """Starts the users, waits for the duration and summarises"""
+
+    def __init__(self, cfg, users, ramp_up, duration, think_mean, think_distribution, journeys,
+                 use_standin=False, confirm_booking=False, seed=0):
+        self.cfg = cfg
+        self.base_url = cfg.get_value("base_url")
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.think_mean = think_mean
+        self.think_distribution = think_distribution
+        self.journeys = journeys
+        self.use_standin = use_standin
+        self.confirm_booking = confirm_booking
+        self.seed = seed
+        self.stats = LoadStats()
+        self.data = {name: load_data(name) for name in journeys}
+        self.deadline = None
+
+    def launch(self):
+        profile = LeanProfile.from_config(self.cfg)
+        profile.headless = True
+        return create_driver(self.cfg, profile, use_standin=self.use_standin)
+
+    def run(self):
+        server = standin_server.ensure_standin_running(self.cfg) if self.use_standin else None
+        started = time.monotonic()
+        self.deadline = started + self.ramp_up + self.duration
+        logger.info(f"Load run: {self.users} users, ramp-up {self.ramp_up:.0f}s, duration {self.duration:.0f}s, "
+                    f"think {self.think_distribution} {self.think_mean}s, journeys {', '.join(self.journeys)} -> {self.base_url}")
+        users = [VirtualUser(n, self) for n in range(self.users)]
+        try:
+            for user in users:
+                user.start()
+            for user in users:
+                # A journey in progress when the time is up is allowed to finish
+                user.join()
+        finally:
+            if server is not None:
+                server.stop()
+        elapsed = time.monotonic() - started
+        summary = self.stats.summary(elapsed)
+        return {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "base_url": self.base_url,
+            "users": self.users,
+            "ramp_up_seconds": self.ramp_up,
+            "duration_seconds": self.duration,
+            "elapsed_seconds": round(elapsed, 1),
+            "think_time": {"distribution": self.think_distribution, "mean_seconds": self.think_mean},
+            "journeys": {name: row for name, row in summary.items() if ">" not in name},
+            "steps": {name: row for name, row in summary.items() if ">" in name},
+            "browser_launch_failures": self.stats.launch_failures,
+        }
+
+
+def print_table(report):
+    print(f"{'count':>6}{'errors':>7}{'/min':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}  name")
+    for section in ("journeys", "steps"):
+        for name, row in sorted(report[section].items()):
+            cells = "".join(f"{row[k]:>7.2f}s" if row[k] is not None else f"{'-':>8}" for k in ("p50", "p95", "p99", "max"))
+            print(f"{row['count']:>6}{row['errors']:>7}{row['throughput_per_min']:>8.1f}{cells}  {name}")
+    if report["browser_launch_failures"]:
+        print(f"Browser launch failures: {report['browser_launch_failures']}")
+
+
+def main(argv=None):
+    cfg = ConfigReader()
+    parser = argparse.ArgumentParser(description="Replay functional journeys with concurrent headless users")
+    parser.add_argument("--users", type=int, default=int(cfg.get_value("load_users", "5")), help="Concurrent users")
+    parser.add_argument("--ramp-up", type=float, default=float(cfg.get_value("load_ramp_up_seconds", "30")),
+                        help="Seconds over which users start")
+    parser.add_argument("--duration", type=float, default=float(cfg.get_value("load_duration_seconds", "300")),
+                        help="Seconds of load after the ramp-up")
+    parser.add_argument("--think-time", type=float, default=float(cfg.get_value("load_think_time_seconds", "2")),
+                        help="Mean think time between steps")
+    parser.add_argument("--think-distribution", choices=THINK_DISTRIBUTIONS,
+                        default=cfg.get_value("load_think_distribution", "exponential"))
+    parser.add_argument("--journey", action="append", dest="journeys", choices=sorted(JOURNEYS),
+                        help="Journey to replay (repeatable; default: all, alternating)")
+    parser.add_argument("--standin", action="store_true", help="Serve the Practo stand-in and point the browsers at it")
+    parser.add_argument("--confirm-booking", action="store_true", help="Also click 'Confirm Clinic Visit'")
+    parser.add_argument("--seed", type=int, default=0, help="Think time random seed")
+    args = parser.parse_args(argv)
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+
+    if command_profile_enabled(cfg):
+        enable_profiling()
+    runner = LoadRunner(cfg, args.users, args.ramp_up, args.duration, args.think_time, args.think_distribution,
+                        args.journeys or sorted(JOURNEYS), use_standin=args.standin or standin_server.is_enabled(cfg),
+                        confirm_booking=args.confirm_booking, seed=args.seed)
+    report = runner.run()
+
+    out_dir = os.path.join(PROJECT_ROOT, cfg.get_value("report_path") or "reports/", "load")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, f"load_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print_table(report)
+    write_command_trace()
+    print(f"Report written to {out_path}")
+    runs = sum(row["count"] + row["errors"] for row in report["journeys"].values())
+    errors = sum(row["errors"] for row in report["journeys"].values())
+    error_rate = errors / runs if runs else 1.0
+    max_error_rate = float(cfg.get_value("load_max_error_rate", "0.05"))
+    print(f"Journey error rate {error_rate:.1%} (allowed {max_error_rate:.1%})")
+    return 1 if error_rate > max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
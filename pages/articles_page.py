@@ -11,6 +11,21 @@ class ArticlesPage(BasePage):
     ARTICLE_AUTHOR = (By.XPATH, "//span[contains(@class, 'author')]")
     RELATED_ARTICLES = (By.XPATH, "//div[contains(@class, 'related-articles')]")
 
+    # Elements a fully rendered article shows, checked together in one command
+    RENDER_CHECKS = {
+        "title": ARTICLE_TITLE,
+        "content": ARTICLE_CONTENT,
+        "author": ARTICLE_AUTHOR,
+        "related_articles": RELATED_ARTICLES,
+    }
+
+    def is_article_rendered(self, timeout=None):
+        """Check if title, content, author and related articles are all rendered (one shared wait)"""
+        missing = self.missing_elements(self.RENDER_CHECKS, timeout=timeout)
+        if missing:
+            self.logger.info(f"Article not fully rendered, missing: {', '.join(missing)}")
+        return not missing
+
     def is_article_page_loaded(self):
         """Check if article page is loaded"""
         return self.is_element_present(self.ARTICLE_TITLE)
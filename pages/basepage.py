@@ -1,7 +1,28 @@
+import time
+
+from selenium.common.exceptions import (ElementClickInterceptedException, ElementNotInteractableException,
+                                        StaleElementReferenceException, WebDriverException)
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.config_reader import ConfigReader
+from utils.dom_query import query
+from utils.dom_settle import is_page_ready, wait_for_settle
+from utils.element_cache import ElementCache
+from utils.locator_probe import probe
+from utils.locator_registry import find_ranked
 from utils.logger import get_logger
+from utils.wait_policy import PolicyWait
+
+PRESENCE_POLL_INTERVAL = 0.1
+
+_defaults = {}
+
+
+def default_check_timeout():
+    """Default timeout (seconds) for presence/visibility checks - explicit_wait from config"""
+    if not _defaults:
+        _defaults["explicit_wait"] = float(ConfigReader().get_value("explicit_wait", "10"))
+    return _defaults["explicit_wait"]
 
 
 class BasePage:
@@ -9,40 +30,156 @@ class BasePage:
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = PolicyWait(driver)
         self.logger = get_logger(self.__class__.__name__)
+        self.element_cache = ElementCache(driver)
+
+    def find_cached(self, locator, condition=EC.presence_of_element_located):
+        """Element for locator, resolved with an explicit wait once per page view"""
+        return self.element_cache.get(locator, lambda: self.wait.until(condition(locator)))
 
     def click_element(self, locator):
         """Click on element with explicit wait"""
-        element = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        was_cached = locator in self.element_cache
+        element = self.find_cached(locator, EC.element_to_be_clickable)
+        try:
+            element.click()
+        except (ElementNotInteractableException, ElementClickInterceptedException):
+            if not was_cached:
+                raise
+            # The cached element may be hidden/covered right now: wait for it like an uncached click
+            self.element_cache.invalidate(locator)
+            self.find_cached(locator, EC.element_to_be_clickable).click()
 
     def send_keys(self, locator, text):
         """Enter text in element with clear first"""
-        element = self.wait.until(EC.presence_of_element_located(locator))
+        element = self.find_cached(locator)
         element.clear()
         element.send_keys(text)
 
     def get_text(self, locator):
         """Get text from element"""
-        element = self.wait.until(EC.presence_of_element_located(locator))
-        return element.text
+        return self.find_cached(locator).text
 
-    def is_element_present(self, locator):
-        """Check if element is present - returns boolean"""
-        try:
-            self.wait.until(EC.presence_of_element_located(locator))
-            return True
-        except:
-            return False
+    def is_element_present(self, locator, timeout=None, expect="present"):
+        """
+        Check if element is present - returns boolean
 
-    def is_element_visible(self, locator):
-        """Check if element is visible - returns boolean"""
-        try:
-            self.wait.until(EC.visibility_of_element_located(locator))
-            return True
-        except:
-            return False
+        Args:
+            locator: (By, value) tuple
+            timeout (float): Max seconds to wait (default: explicit_wait from config)
+            expect (str): "present" waits up to timeout for the element to appear;
+                "absent" returns False as soon as the page is ready without it
+        """
+        return self._poll_element(locator, timeout, expect == "absent", visible=False)
+
+    def is_element_visible(self, locator, timeout=None, expect="visible"):
+        """
+        Check if element is visible - returns boolean
+
+        Args:
+            locator: (By, value) tuple
+            timeout (float): Max seconds to wait (default: explicit_wait from config)
+            expect (str): "visible" waits up to timeout for the element to show;
+                "hidden" returns False as soon as the page is ready without it showing
+        """
+        return self._poll_element(locator, timeout, expect == "hidden", visible=True)
+
+    def _poll_element(self, locator, timeout, expect_missing, visible):
+        """Immediate find_elements probe, then poll until found, timed out or (expect_missing) page ready"""
+        timeout = default_check_timeout() if timeout is None else timeout
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                elements = self.driver.find_elements(*locator)
+                found = bool(elements) and (not visible or elements[0].is_displayed())
+            except StaleElementReferenceException:
+                found = False
+            except WebDriverException:
+                # Invalid locator or page mid-navigation
+                found = False
+            if found:
+                return True
+            # A settled page will not render the element any more - absence is final
+            if expect_missing and is_page_ready(self.driver):
+                return False
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(PRESENCE_POLL_INTERVAL)
+
+    def probe(self, locators, wait_for=None, timeout=None, visible=False):
+        """
+        Presence, visibility and text of many locators in one WebDriver command
+
+        Args:
+            locators: {name: (By, value)} or a list of (By, value) tuples
+            wait_for (str): None for an immediate snapshot; "all" or "any" waits (in the page)
+                until all/any locators are present, or visible with visible=True
+            timeout (float): Max seconds for the shared wait (default: explicit_wait from config)
+            visible (bool): Wait for visibility instead of presence
+
+        Returns:
+            dict: name -> {"present", "visible", "count", "text"}
+        """
+        timeout = default_check_timeout() if timeout is None else timeout
+        return probe(self.driver, locators, wait_for=wait_for, timeout=timeout, visible=visible)
+
+    def missing_elements(self, locators, timeout=None, visible=False):
+        """Names of the locators not rendered within timeout - empty when the page is complete"""
+        results = self.probe(locators, wait_for="all", timeout=timeout, visible=visible)
+        key = "visible" if visible else "present"
+        return [name for name in locators if not results.get(name, {}).get(key)]
+
+    def find_ranked(self, locator, fallback_xpath=None, timeout=None):
+        """
+        Find a displayed element for a union XPath, trying the historically winning alternative first
+
+        Args:
+            locator: (By.XPATH, union) tuple
+            fallback_xpath (str): Extra alternatives tried after the locator's own
+            timeout (float): Max seconds to wait (default: explicit_wait from config)
+        """
+        timeout = default_check_timeout() if timeout is None else timeout
+        return find_ranked(self.driver, locator, fallback_xpath=fallback_xpath, timeout=timeout)
+
+    def query_dom(self, *rules, timeout=0, visible=False):
+        """
+        First element matched by the rules, in order, in one execute_script (utils/dom_query.py)
+
+        Args:
+            rules: (rule, value) pairs - "placeholder" (keyword list), "label", "radio", "text", "qa_id";
+                all case-insensitive
+            timeout (float): Seconds to keep polling in the page when nothing matches (0: snapshot)
+            visible (bool): Only accept visible elements (by default hidden ones are a fallback)
+
+        Returns:
+            DomMatch (element, rule, value, count) or None
+        """
+        return query(self.driver, rules, timeout=timeout, visible=visible)
+
+    def find_by_placeholder(self, keywords, timeout=0):
+        """Input/textarea whose placeholder contains any keyword - DomMatch or None"""
+        return self.query_dom(("placeholder", list(keywords)), timeout=timeout)
+
+    def find_by_label(self, text, timeout=0):
+        """Form control labelled with text - DomMatch or None"""
+        return self.query_dom(("label", text), timeout=timeout)
+
+    def find_radio_by_label(self, text, timeout=0):
+        """Radio button labelled with (or valued) text - DomMatch or None"""
+        return self.query_dom(("radio", text), timeout=timeout)
+
+    def find_by_text(self, text, timeout=0):
+        """Element showing text - DomMatch or None"""
+        return self.query_dom(("text", text), timeout=timeout)
+
+    def find_by_qa_id(self, qa_id, timeout=0):
+        """Element with this data-qa-id - DomMatch or None"""
+        return self.query_dom(("qa_id", qa_id), timeout=timeout)
+
+    def wait_for_settle(self, quiet_ms=None, timeout=None, replaces=None):
+        """Wait until DOM and network are quiet - use instead of a fixed time.sleep"""
+        return wait_for_settle(self.driver, quiet_ms=quiet_ms, timeout=timeout, replaces=replaces)
 
     def get_page_title(self):
         """Get current page title"""
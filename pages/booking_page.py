@@ -13,6 +13,10 @@ class BookingPage(BasePage):
     CONFIRM_BTN = (By.XPATH, "//button[contains(text(), 'Confirm')]")
     ERROR_MESSAGE = (By.XPATH, "//div[contains(text(), 'No slots available')]")
     SUCCESS_MESSAGE = (By.XPATH, "//div[contains(@class, 'success')]")
+    # Slot picker opened by 'Book Clinic Visit' on the doctors listing
+    TOMORROW_DATE = (By.XPATH, "//div[@data-qa-id='date_selector' and contains(., 'tomorrow')]")
+    SLOT_TIME = (By.XPATH, "//div[@data-qa-id='slot_time']")
+    CONFIRM_CLINIC_VISIT_BTN = (By.XPATH, "//button[contains(text(), 'Confirm Clinic Visit')]")
 
     def select_date(self, date):
         """Select date"""
@@ -37,7 +41,7 @@ class BookingPage(BasePage):
 
     def is_error_message_displayed(self):
         """Check if error message is displayed"""
-        return self.is_element_present(self.ERROR_MESSAGE)
+        return self.is_element_present(self.ERROR_MESSAGE, expect="absent")
 
     def is_success_message_displayed(self):
         """Check if success message is displayed"""
@@ -45,4 +49,23 @@ class BookingPage(BasePage):
 
     def get_error_message(self):
         """Get error message"""
-        return self.get_text(self.ERROR_MESSAGE) if self.is_element_present(self.ERROR_MESSAGE) else None
+        return self.get_text(self.ERROR_MESSAGE) if self.is_element_present(self.ERROR_MESSAGE, expect="absent") else None
+
+    def wait_for_slots(self, timeout=None):
+        """Wait until the time slots are visible - returns boolean"""
+        return self.is_element_visible(self.SLOT_TIME, timeout)
+
+    def select_tomorrow(self):
+        """Pick tomorrow in the date selector"""
+        self.click_element(self.TOMORROW_DATE)
+        self.wait_for_settle(replaces=2)
+
+    def select_first_slot(self):
+        """Pick the first available time slot"""
+        self.click_element(self.SLOT_TIME)
+        self.wait_for_settle(replaces=2)
+
+    def confirm_clinic_visit(self):
+        """Click 'Confirm Clinic Visit'"""
+        self.click_element(self.CONFIRM_CLINIC_VISIT_BTN)
+        self.wait_for_settle(replaces=2)
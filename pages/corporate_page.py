@@ -0,0 +1,56 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.select import Select
+from pages.basepage import BasePage
+
+
+class CorporatePage(BasePage):
+    """For Corporates menu and demo request form page object"""
+
+    # Locators
+    FOR_CORPORATES_TOGGLE = (By.XPATH,
+                             "//div[contains(@class, 'nav-items') and contains(@class, 'dropdown-toggle')]//span[@class='nav-interact' and contains(text(), 'For Corporates')]/..")
+    NAME_INPUT = (By.ID, "name")
+    ORGANIZATION_NAME_INPUT = (By.ID, "organizationName")
+    CONTACT_NUMBER_INPUT = (By.ID, "contactNumber")
+    OFFICIAL_EMAIL_INPUT = (By.ID, "officialEmailId")
+    ORGANIZATION_SIZE_SELECT = (By.ID, "organizationSize")
+    INTERESTED_IN_SELECT = (By.ID, "interestedIn")
+    SCHEDULE_DEMO_BTN = (By.XPATH, "//button[@type='submit' and contains(text(), 'Schedule')]")
+    SUBMISSION_MESSAGE = (By.XPATH,
+                          "//div[contains(@class, 'success')] | //div[contains(text(), 'success')] | //*[contains(text(), 'Thank you')] | //*[contains(text(), 'submitted')] | //*[contains(text(), 'scheduled')]")
+
+    def open_corporate_option(self, option="Health & Wellness Plans"):
+        """Open the For Corporates menu and click one of its options"""
+        self.click_element(self.FOR_CORPORATES_TOGGLE)
+        self.wait_for_settle(replaces=1)
+        self.click_element((By.XPATH, f"//a[contains(text(), '{option}')]"))
+        self.wait_for_settle(replaces=2)
+
+    def _select_by_value(self, locator, value):
+        Select(self.find_cached(locator)).select_by_value(value)
+
+    def fill_demo_form(self, name, organization_name, contact_number, official_email, organization_size, interested_in):
+        """Fill the demo request form; the two dropdowns are selected by option value"""
+        self.send_keys(self.NAME_INPUT, name)
+        self.wait_for_settle(replaces=1)
+        self.send_keys(self.ORGANIZATION_NAME_INPUT, organization_name)
+        self.wait_for_settle(replaces=1)
+        self.send_keys(self.CONTACT_NUMBER_INPUT, contact_number)
+        self.wait_for_settle(replaces=1)
+        self.send_keys(self.OFFICIAL_EMAIL_INPUT, official_email)
+        self.wait_for_settle(replaces=1)
+        self._select_by_value(self.ORGANIZATION_SIZE_SELECT, organization_size)
+        self.wait_for_settle(replaces=1)
+        self._select_by_value(self.INTERESTED_IN_SELECT, interested_in)
+        self.wait_for_settle(replaces=1)
+
+    def submit_demo_form(self):
+        """Click 'Schedule a demo'"""
+        self.click_element(self.SCHEDULE_DEMO_BTN)
+        self.wait_for_settle(replaces=2)
+
+    def get_submission_message(self, timeout=None):
+        """Confirmation text shown after submitting, or None"""
+        if not self.is_element_present(self.SUBMISSION_MESSAGE, timeout):
+            return None
+        return self.driver.find_element(*self.SUBMISSION_MESSAGE).text
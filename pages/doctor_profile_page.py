@@ -17,13 +17,37 @@ class DoctorProfilePage(BasePage):
     BOOK_APPOINTMENT_BTN = (By.XPATH,
                             "//button[contains(text(), 'Book Appointment')] | //button[contains(text(), 'Book')] | //button[@class='book-btn']")
 
+    # Elements a fully rendered profile shows, checked together in one command
+    RENDER_CHECKS = {
+        "name": DOCTOR_NAME,
+        "photo": DOCTOR_PHOTO,
+        "overview_tab": OVERVIEW_TAB,
+        "reviews_tab": REVIEWS_TAB,
+        "locations_tab": LOCATIONS_TAB,
+        "rating": RATING,
+        "clinic_address": CLINIC_ADDRESS,
+        "book_button": BOOK_APPOINTMENT_BTN,
+    }
+
+    def get_render_status(self):
+        """Presence of every profile element - {name: bool} from a single probe"""
+        results = self.probe(self.RENDER_CHECKS)
+        return {name: result["present"] for name, result in results.items()}
+
+    def is_profile_rendered(self, timeout=None):
+        """Check if all profile elements are rendered (one shared wait)"""
+        missing = self.missing_elements(self.RENDER_CHECKS, timeout=timeout)
+        if missing:
+            self.logger.info(f"Profile not fully rendered, missing: {', '.join(missing)}")
+        return not missing
+
     def is_doctor_name_displayed(self):
         """Check if doctor name is displayed"""
         return self.is_element_present(self.DOCTOR_NAME)
 
     def is_doctor_photo_displayed(self):
         """Check if doctor photo is displayed"""
-        return self.is_element_present(self.DOCTOR_PHOTO)
+        return self.is_element_present(self.DOCTOR_PHOTO, expect="absent")
 
     def is_overview_tab_present(self):
         """Check if Overview tab is present"""
@@ -31,11 +55,11 @@ class DoctorProfilePage(BasePage):
 
     def is_reviews_tab_present(self):
         """Check if Reviews tab is present"""
-        return self.is_element_present(self.REVIEWS_TAB)
+        return self.is_element_present(self.REVIEWS_TAB, expect="absent")
 
     def is_locations_tab_present(self):
         """Check if Locations tab is present"""
-        return self.is_element_present(self.LOCATIONS_TAB)
+        return self.is_element_present(self.LOCATIONS_TAB, expect="absent")
 
     def click_reviews_tab(self):
         """Click on Reviews tab"""
@@ -47,11 +71,11 @@ class DoctorProfilePage(BasePage):
 
     def is_rating_displayed(self):
         """Check if rating is displayed"""
-        return self.is_element_present(self.RATING)
+        return self.is_element_present(self.RATING, expect="absent")
 
     def is_clinic_address_displayed(self):
         """Check if clinic address is displayed"""
-        return self.is_element_present(self.CLINIC_ADDRESS)
+        return self.is_element_present(self.CLINIC_ADDRESS, expect="absent")
 
     def click_book_appointment(self):
         """Click on Book Appointment button"""
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.basepage import BasePage
+from utils.web_vitals import capture_web_vitals
 
 
 class DoctorsPage(BasePage):
@@ -8,6 +9,18 @@ class DoctorsPage(BasePage):
     # Locators
     DOCTOR_CARD = (By.XPATH, "//div[contains(@class, 'doctor-card')]")
     NO_DOCTORS_MESSAGE = (By.XPATH, "//div[contains(text(), 'No doctors found')]")
+    GENDER_FILTER_BTN = (By.XPATH, "//*[@id='container']/div/div[3]/div/div/header/div[1]/div/div[1]")
+    GENDER_OPTIONS = {
+        "female": (By.XPATH, "//li[@data-qa-id='female']"),
+        "male": (By.XPATH, "//li[@data-qa-id='male']"),
+    }
+    SORT_DROPDOWN = (By.XPATH, "//div[@data-qa-id='sort_by_section']")
+    SORT_BY_FEES_OPTION = (By.XPATH, "//li[@data-qa-id='consultation_fees']")
+    EXPERIENCE_DROPDOWN = (By.XPATH, "//div[@data-qa-id='years_of_experience_section']")
+    BOOK_CLINIC_VISIT_BTN = (By.XPATH, "//button[@data-qa-id='book_button' and contains(text(), 'Book Clinic Visit')]")
+
+    # Observed from document start on every page (utils/web_vitals.py)
+    VITALS_MARKS = {"first_doctor_card_ms": DOCTOR_CARD}
 
     def is_doctors_displayed(self):
         """Check if doctors are displayed - returns boolean"""
@@ -27,4 +40,48 @@ class DoctorsPage(BasePage):
 
     def is_no_doctors_message_displayed(self):
         """Check if 'No doctors found' message is displayed"""
-        return self.is_element_present(self.NO_DOCTORS_MESSAGE)
+        return self.is_element_present(self.NO_DOCTORS_MESSAGE, expect="absent")
+
+    def wait_for_results(self, timeout=None):
+        """Wait until the first doctor card is visible - returns boolean"""
+        return self.is_element_visible(self.DOCTOR_CARD, timeout)
+
+    def apply_gender_filter(self, gender):
+        """Filter by doctor gender, e.g. "Male Doctor" or "Female Doctor" """
+        # "female" is checked first since it contains "male"
+        option = next((loc for key, loc in self.GENDER_OPTIONS.items() if key in gender.lower()), None)
+        assert option, f"Unknown gender filter: {gender}"
+        self.click_element(self.GENDER_FILTER_BTN)
+        self.wait_for_settle(replaces=1)
+        self.click_element(option)
+        self.wait_for_settle(replaces=2)
+
+    def sort_by_fees(self):
+        """Sort results by consultation fee, low to high"""
+        self.click_element(self.SORT_DROPDOWN)
+        self.wait_for_settle(replaces=1)
+        self.click_element(self.SORT_BY_FEES_OPTION)
+        self.wait_for_settle(replaces=2)
+
+    def apply_experience_filter(self, experience):
+        """Filter by minimum experience, e.g. "5+ Years of experience" """
+        years = experience.split("+")[0].strip()
+        assert years.isdigit(), f"Unknown experience filter: {experience}"
+        self.click_element(self.EXPERIENCE_DROPDOWN)
+        self.wait_for_settle(replaces=1)
+        self.click_element((By.XPATH, f"//li[@data-qa-id='{years},9999999']"))
+        self.wait_for_settle(replaces=2)
+
+    def click_book_clinic_visit(self):
+        """Click 'Book Clinic Visit' on the first doctor card"""
+        self.click_element(self.BOOK_CLINIC_VISIT_BTN)
+
+    def get_web_vitals(self):
+        """LCP, CLS, INP, long tasks and first doctor card time of this page; None when not observed"""
+        return capture_web_vitals(self.driver, "doctors page")
+
+    def time_to_first_doctor_card(self):
+        """Seconds from navigation start until the first doctor card rendered, or None"""
+        vitals = self.get_web_vitals() or {}
+        ms = vitals.get("marks", {}).get("first_doctor_card_ms")
+        return ms / 1000 if ms is not None else None
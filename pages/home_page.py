@@ -1,7 +1,9 @@
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from pages.basepage import BasePage
-import time
+from utils.element_cache import CachedElement
+from utils.page_timing import capture_page_timing
 
 
 class HomePage(BasePage):
@@ -19,21 +21,22 @@ class HomePage(BasePage):
     SEARCH_BTN = (By.XPATH,
                   "//button[contains(text(), 'Search')] | //button[@type='submit'] | //button[contains(@class, 'search')]")
 
+    # Search fields, resolved once per page view
+    location_input = CachedElement(finder=lambda page: page._find_input_by_placeholder(["city", "location"]))
+    doctor_type_input = CachedElement(finder=lambda page: page._find_input_by_placeholder(["speciality", "doctor"]))
+
     def open_home_page(self, base_url):
         """Open home page and verify navigation"""
         assert base_url, "Base URL should not be empty"
         self.navigate_to_url(base_url)
-        time.sleep(2)
+        self.wait_for_settle(replaces=2)
         current_url = self.get_current_url()
         assert current_url and "practo" in current_url.lower(), "Should navigate to Practo home page"
 
     def _click_element_with_fallback(self, primary_locator, fallback_xpath):
-        """Click element with fallback XPath"""
-        try:
-            self.click_element(primary_locator)
-        except:
-            element = self.driver.find_element(By.XPATH, fallback_xpath)
-            element.click()
+        """Click element with fallback XPath - all alternatives are ranked by past matches"""
+        element = self.find_ranked(primary_locator, fallback_xpath)
+        element.click()
 
     def click_login_signup(self):
         """Click on login/signup button"""
@@ -41,7 +44,7 @@ class HomePage(BasePage):
             self.LOGIN_SIGNUP_BTN,
             "//a[contains(text(), 'Sign up')] | //button[contains(@class, 'signup')]"
         )
-        time.sleep(1)
+        self.wait_for_settle(replaces=1)
 
     def click_find_doctors(self):
         """Click on Find Doctors button"""
@@ -49,7 +52,7 @@ class HomePage(BasePage):
             self.FIND_DOCTORS_BTN,
             "//a[contains(@href, 'search')]"
         )
-        time.sleep(1)
+        self.wait_for_settle(replaces=1)
 
     def click_see_all_articles(self):
         """Click on See All Articles button"""
@@ -57,25 +60,14 @@ class HomePage(BasePage):
             self.SEE_ALL_ARTICLES_BTN,
             "//a[contains(text(), 'articles')]"
         )
-        time.sleep(1)
+        self.wait_for_settle(replaces=1)
 
     def _find_input_by_placeholder(self, placeholder_keywords):
-        """Find input element by placeholder keywords"""
-        try:
-            if len(placeholder_keywords) == 1:
-                element = self.driver.find_element(By.XPATH,
-                                                   f"//input[contains(@placeholder, '{placeholder_keywords[0]}')]")
-                return element
-        except:
-            pass
-
-        all_inputs = self.driver.find_elements(By.TAG_NAME, "input")
-        for inp in all_inputs:
-            placeholder = inp.get_attribute("placeholder")
-            if placeholder and any(kw.lower() in placeholder.lower() for kw in placeholder_keywords):
-                return inp
-
-        raise Exception(f"Input element not found for keywords: {placeholder_keywords}")
+        """Find input element by placeholder keywords (one script call, case-insensitive)"""
+        match = self.find_by_placeholder(placeholder_keywords)
+        if match is None:
+            raise NoSuchElementException(f"Input element not found for keywords: {placeholder_keywords}")
+        return match.element
 
     def _select_from_dropdown_list(self, input_element, value, arrow_downs=1, wait_before=0.5, wait_after=0.8):
         """
@@ -85,56 +77,48 @@ class HomePage(BasePage):
         assert value, f"Value should not be empty"
         input_element.clear()
         input_element.send_keys(value)
-        time.sleep(wait_before)
 
         # Wait for dropdown/list to appear
-        time.sleep(0.3)
+        self.wait_for_settle(replaces=wait_before + 0.3)
 
         # Press arrow down to navigate through options
         for _ in range(arrow_downs):
             input_element.send_keys(Keys.ARROW_DOWN)
-            time.sleep(0.2)
+            self.wait_for_settle(replaces=0.2)
 
         # Select the option
         input_element.send_keys(Keys.ENTER)
-        time.sleep(wait_after)
+        self.wait_for_settle(replaces=wait_after)
 
     def _select_radio_option(self, label_text):
         """
         Select a radio button by its associated label text
         Practo uses radio buttons for filters
         """
-        try:
-            # Try to find radio button by label
-            radio_xpath = f"//label[contains(text(), '{label_text}')]/preceding-sibling::input[@type='radio'] | //input[@type='radio' and following-sibling::label[contains(text(), '{label_text}')]]"
-            radio_button = self.driver.find_element(By.XPATH, radio_xpath)
-            radio_button.click()
-            time.sleep(0.5)
-        except:
-            # Try alternative: find by exact match
-            alt_xpath = f"//span[contains(text(), '{label_text}')]/ancestor::label/input[@type='radio'] | //input[@type='radio' and @value='{label_text}']"
-            radio_button = self.driver.find_element(By.XPATH, alt_xpath)
-            radio_button.click()
-            time.sleep(0.5)
+        # Label (wrapping, `for` or sibling) or value, matched in a single script call
+        match = self.find_radio_by_label(label_text)
+        if match is None:
+            raise NoSuchElementException(f"Radio option not found for label: {label_text}")
+        match.element.click()
+        self.wait_for_settle(replaces=0.5)
 
     def enter_location(self, location):
         """Enter location and select from dropdown list"""
-        location_input = self._find_input_by_placeholder(["city", "location"])
-        self._select_from_dropdown_list(location_input, location, arrow_downs=2, wait_before=0.5, wait_after=0.8)
+        self._select_from_dropdown_list(self.location_input, location, arrow_downs=2, wait_before=0.5, wait_after=0.8)
 
     def select_doctor_type(self, doctor_type):
         """Select doctor type from dropdown list"""
-        type_input = self._find_input_by_placeholder(["speciality", "doctor"])
-        self._select_from_dropdown_list(type_input, doctor_type, arrow_downs=1, wait_before=0.6, wait_after=0.6)
+        self._select_from_dropdown_list(self.doctor_type_input, doctor_type, arrow_downs=1, wait_before=0.6, wait_after=0.6)
 
     def click_search(self):
         """Click search button"""
         try:
-            self.click_element(self.SEARCH_BTN)
+            self.find_ranked(self.SEARCH_BTN).click()
         except:
             search_input = self.driver.find_element(By.TAG_NAME, "input")
             search_input.send_keys(Keys.ENTER)
-        time.sleep(2.5)
+        self.wait_for_settle(replaces=2.5)
+        capture_page_timing(self.driver, "click_search")
 
     def select_fee_filter(self, fee_range):
         """
@@ -14,6 +14,13 @@ class LoginPage(BasePage):
     SIGNUP_LINK = (By.XPATH, "//a[contains(text(), 'Sign up')] | //a[contains(text(), 'Signup')]")
     ERROR_MESSAGE = (By.XPATH, "//div[contains(@class, 'error')] | //span[contains(@class, 'error')]")
 
+    # Practo header login (home page -> accounts login form)
+    PRACTO_LOGIN_LINK = (By.XPATH, "//a[@name='Practo login']")
+    ACCOUNT_MENU = (By.XPATH, "//div[contains(@class, 'dropdown-toggle') and @data-menu='user-menu'] | //a[@id='logout-link']")
+    USERNAME_INPUT = (By.ID, "username")
+    PASSWORD_FIELD = (By.ID, "password")
+    LOGIN_SUBMIT_BTN = (By.ID, "login")
+
     def enter_email(self, email):
         """Enter email"""
         self.send_keys(self.EMAIL_INPUT, email)
@@ -38,4 +45,23 @@ class LoginPage(BasePage):
 
     def get_error_message(self):
         """Get error message if present"""
-        return self.get_text(self.ERROR_MESSAGE) if self.is_element_present(self.ERROR_MESSAGE) else None
+        return self.get_text(self.ERROR_MESSAGE) if self.is_element_present(self.ERROR_MESSAGE, expect="absent") else None
+
+    def login_from_home(self, email, password):
+        """Log in through the Practo header link on the home page"""
+        self.click_element(self.PRACTO_LOGIN_LINK)
+        self.send_keys(self.USERNAME_INPUT, email)
+        self.send_keys(self.PASSWORD_FIELD, password)
+        self.click_element(self.LOGIN_SUBMIT_BTN)
+        self.wait_for_settle(replaces=4)
+
+    def is_logged_in(self, timeout=None):
+        """
+        Logged in when the header shows the account menu.
+
+        Waits until either the account menu or the Practo login link is rendered; a page
+        with neither (blank, error or half-rendered) does not count as logged in.
+        """
+        header = self.probe({"account": self.ACCOUNT_MENU, "login": self.PRACTO_LOGIN_LINK},
+                            wait_for="any", timeout=timeout)
+        return bool(header.get("account", {}).get("present"))
@@ -0,0 +1,101 @@
+/*
+ * Shared behaviour for the Practo stand-in fixtures: dropdown menus, login cookie,
+ * search suggestions and absolute practo.com links when served without host mapping.
+ */
+(function () {
+    var AUTH_COOKIE = 'standin_auth';
+
+    var standin = window.standin = {
+        isLoggedIn: function () {
+            return document.cookie.split('; ').some(function (c) { return c.indexOf(AUTH_COOKIE + '=') === 0; });
+        },
+        login: function (user) {
+            document.cookie = AUTH_COOKIE + '=' + encodeURIComponent(user) + '; path=/; max-age=86400';
+        },
+        // Menus are shown with an inline style so exact @class locators keep matching
+        isOpen: function (el) { return !!el && el.style.display === 'block'; },
+        show: function (el) { if (el) { el.style.display = 'block'; } },
+        hide: function (el) { if (el) { el.style.display = ''; } },
+        closeMenus: function (except) {
+            document.querySelectorAll('.dropdown-menu').forEach(function (menu) {
+                if (menu !== except) { standin.hide(menu); }
+            });
+        }
+    };
+
+    // Logged-in / guest only markup
+    document.querySelectorAll('[data-auth]').forEach(function (el) {
+        var wanted = el.getAttribute('data-auth') === 'user';
+        if (wanted !== standin.isLoggedIn()) { el.parentNode.removeChild(el); }
+    });
+
+    // Without host mapping (plain http://127.0.0.1:<port>/) keep absolute practo.com links local
+    var mapped = /(^|\.)practo\.com$/.test(location.hostname);
+    document.addEventListener('click', function (event) {
+        var link = event.target.closest && event.target.closest('a[href]');
+        if (!mapped && link && /^https?:\/\/([a-z]+\.)?practo\.com\//.test(link.getAttribute('href'))) {
+            event.preventDefault();
+            var path = link.getAttribute('href').replace(/^https?:\/\/[^\/]+/, '');
+            if (link.target === '_blank') { window.open(path, '_blank'); } else { location.href = path; }
+            return;
+        }
+
+        // Dropdown toggles: <... data-menu="menu-id">
+        var toggle = event.target.closest && event.target.closest('[data-menu]');
+        if (toggle && !(link && toggle.contains(link) && link !== toggle)) {
+            var menu = document.getElementById(toggle.getAttribute('data-menu'));
+            var opening = menu && !standin.isOpen(menu);
+            standin.closeMenus(menu);
+            if (opening) { standin.show(menu); } else { standin.hide(menu); }
+            return;
+        }
+        if (!(event.target.closest && event.target.closest('.dropdown-menu'))) {
+            standin.closeMenus(null);
+        }
+    });
+
+    // Autocomplete inputs: <input data-suggest="a|b|c" [data-submit]>
+    document.querySelectorAll('input[data-suggest]').forEach(function (input) {
+        var options = input.getAttribute('data-suggest').split('|');
+        var list = document.createElement('ul');
+        list.className = 'suggestions';
+        input.parentNode.appendChild(list);
+        var active = -1;
+
+        var render = function () {
+            var typed = input.value.toLowerCase();
+            var matches = options.filter(function (o) { return o.toLowerCase().indexOf(typed) !== -1; });
+            if (typed && matches.indexOf(input.value) === -1) { matches.unshift(input.value); }
+            list.innerHTML = '';
+            matches.forEach(function (text, i) {
+                var li = document.createElement('li');
+                li.textContent = text;
+                if (i === active) { li.className = 'active'; }
+                li.addEventListener('mousedown', function () { pick(text); });
+                list.appendChild(li);
+            });
+            list.style.display = matches.length ? 'block' : 'none';
+        };
+        var pick = function (text) {
+            input.value = text;
+            list.style.display = 'none';
+            active = -1;
+            if (input.hasAttribute('data-submit') && input.form) { input.form.submit(); }
+        };
+
+        input.addEventListener('input', function () { active = -1; render(); });
+        input.addEventListener('focus', render);
+        input.addEventListener('blur', function () { setTimeout(function () { list.style.display = 'none'; }, 150); });
+        input.addEventListener('keydown', function (event) {
+            var items = list.querySelectorAll('li');
+            if (event.key === 'ArrowDown') {
+                event.preventDefault();
+                active = Math.min(active + 1, items.length - 1);
+                render();
+            } else if (event.key === 'Enter') {
+                event.preventDefault();
+                pick(active >= 0 && items[active] ? items[active].textContent : input.value);
+            }
+        });
+    });
+})();
@@ -2,245 +2,242 @@ import pytest
 from pages.home_page import HomePage
 from pages.doctors_page import DoctorsPage
 from pages.doctor_profile_page import DoctorProfilePage
+from pages.login_page import LoginPage
+from utils.dom_settle import wait_for_settle
 from utils.logger import get_logger
+from utils.step_timer import budget, step
 from utils.excel_reader import ExcelReader
-from utils.test_data_reader import get_all_test_rows, get_test_data_by_row
-import time
+from utils.test_data_reader import get_test_data_by_row
+from utils.wait_policy import PolicyWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 logger = get_logger("appointment_booking")
 
 
 @pytest.mark.smoke
-@pytest.mark.parametrize("row_number", get_all_test_rows())
+@pytest.mark.authenticated
+@pytest.mark.datafile("TestData_Master.xlsx", sheet="TestData")
 def test_doctor_appointment_booking(driver, config, row_number):
     """Verify Doctor Appointment Booking - runs for all test data rows in Excel"""
     test_data = get_test_data_by_row(row_number)
     assert test_data is not None, f"Test data not found for row {row_number}"
     
-    wait = WebDriverWait(driver, 15)
+    wait = PolicyWait(driver, 15)
     base_url = config.get_value("base_url")
     
-    # Step 1-2: Navigate to home page
-    driver.get(base_url)
-    time.sleep(2)
-    assert driver.current_url == base_url, f"Failed to navigate to home page. Expected {base_url}, got {driver.current_url}"
-    
-    # Step 3-4: Click login button and enter credentials
-    login_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[@name='Practo login']")))
-    login_btn.click()
-    time.sleep(2)
-    
-    email = config.get_value("email")
-    password = config.get_value("password")
-    
-    email_field = wait.until(EC.presence_of_element_located((By.ID, "username")))
-    email_field.clear()
-    email_field.send_keys(email)
-    
-    password_field = driver.find_element(By.ID, "password")
-    password_field.clear()
-    password_field.send_keys(password)
-    time.sleep(1)
-    
-    # Step 5: Click login button and verify login
-    login_submit_btn = driver.find_element(By.ID, "login")
-    login_submit_btn.click()
-    time.sleep(4)
-    assert base_url in driver.current_url, f"Login failed. URL should contain {base_url}, got {driver.current_url}"
-    
-    # Step 6-8: Navigate to Find Doctors and enter location
-    find_doctors_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@class='product-tab__title' and contains(text(), 'Find Doctors')]")))
-    find_doctors_btn.click()
-    time.sleep(2)
-    
-    location = test_data.get('Location', config.get_value("location"))
-    location_field = wait.until(EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'location') or contains(@placeholder, 'Location')]")))
-    location_field.clear()
-    location_field.send_keys(location)
-    time.sleep(2)
-    
-    try:
-        location_field.send_keys(Keys.ARROW_DOWN)
-        time.sleep(0.5)
-        location_field.send_keys(Keys.ARROW_DOWN)
-        time.sleep(0.5)
-        location_field.send_keys(Keys.ENTER)
-    except:
-        pass
-    time.sleep(2)
-    
-    # Step 9-11: Enter doctor type and verify search page loads
-    doctor_type = test_data.get('DoctorType', config.get_value("doctor_type"))
-    doctor_field = wait.until(EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'doctor') or contains(@placeholder, 'Doctor')]")))
-    doctor_field.clear()
-    doctor_field.send_keys(doctor_type)
-    time.sleep(2)
-    
-    try:
-        doctor_field.send_keys(Keys.ARROW_DOWN)
-        time.sleep(0.5)
-        doctor_field.send_keys(Keys.ENTER)
-    except:
-        pass
-    time.sleep(3)
-    
-    # Verify doctor list is displayed
-    try:
-        doctor_list = wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'doctor-card') or contains(@class, 'doctor')]")))
-        assert doctor_list.is_displayed(), "Doctor list should be visible after search"
-    except:
-        logger.warning("Doctor list not found, continuing with booking flow")
-        pass
-    
-    # Step 12-14: Apply gender filter if provided
-    gender_preference = test_data.get('Gender')
-    if gender_preference:
-        try:
-            gender_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//*[@id='container']/div/div[3]/div/div/header/div[1]/div/div[1]")))
-            gender_btn.click()
-            logger.info("Clicked Gender Filter button")
-            time.sleep(1)
-            
-            if "Male" in gender_preference:
-                gender_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='male']")))
-                logger.info("Selecting 'Male Doctor' option")
-            elif "Female" in gender_preference:
-                gender_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='female']")))
-                logger.info("Selecting 'Female Doctor' option")
-            else:
-                gender_option = None
-            
-            if gender_option:
-                gender_option.click()
-                logger.info(f"Selected '{gender_preference}' filter")
-                time.sleep(2)
-                assert gender_option.is_displayed() or True, f"Gender filter '{gender_preference}' should be applied"
-        except Exception as e:
-            logger.warning(f"Could not apply gender filter - {str(e)[:50]}")
-            pass
+    with step("Step 1-2: Navigate to home page"):
+        driver.get(base_url)
+        wait_for_settle(driver, replaces=2)
+        assert driver.current_url == base_url, f"Failed to navigate to home page. Expected {base_url}, got {driver.current_url}"
+    
+    with step("Step 3-5: Verify login"):
+        # Restored from the saved auth state by the `authenticated` marker
+        assert LoginPage(driver).is_logged_in(), "Login failed. The account menu should be shown in the header"
+        assert base_url in driver.current_url, f"Login failed. URL should contain {base_url}, got {driver.current_url}"
+    
+    with step("Step 6-8: Navigate to Find Doctors and enter location"):
+        find_doctors_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@class='product-tab__title' and contains(text(), 'Find Doctors')]")))
+        find_doctors_btn.click()
+        wait_for_settle(driver, replaces=2)
+    
+        location = test_data.get('Location', config.get_value("location"))
+        location_field = wait.until(EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'location') or contains(@placeholder, 'Location')]")))
+        location_field.clear()
+        location_field.send_keys(location)
+        wait_for_settle(driver, replaces=2)
     
-    # Step 15-17: Apply fee filter if provided
-    fee_filter = test_data.get('FeeFilter')
-    if fee_filter:
         try:
-            sort_dropdown = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-qa-id='sort_by_section']")))
-            sort_dropdown.click()
-            logger.info("Clicked Sort/Relevance dropdown")
-            time.sleep(1)
-            
-            fee_low_to_high = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='consultation_fees']")))
-            fee_low_to_high.click()
-            logger.info("Selected 'Consultation Fee - Low to High'")
-            time.sleep(2)
-        except Exception as e:
-            logger.warning(f"Could not select fee sort option - {str(e)[:50]}")
+            location_field.send_keys(Keys.ARROW_DOWN)
+            wait_for_settle(driver, replaces=0.5)
+            location_field.send_keys(Keys.ARROW_DOWN)
+            wait_for_settle(driver, replaces=0.5)
+            location_field.send_keys(Keys.ENTER)
+        except:
             pass
+        wait_for_settle(driver, replaces=2)
+    
+    with step("Step 9-11: Enter doctor type and verify search page loads"):
+        doctor_type = test_data.get('DoctorType', config.get_value("doctor_type"))
+        doctor_field = wait.until(EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'doctor') or contains(@placeholder, 'Doctor')]")))
+        doctor_field.clear()
+        doctor_field.send_keys(doctor_type)
+        wait_for_settle(driver, replaces=2)
     
-    # Step 18-20: Apply experience filter if provided
-    experience_filter = test_data.get('ExperienceFilter')
-    if experience_filter:
         try:
-            experience_dropdown = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-qa-id='years_of_experience_section']")))
-            experience_dropdown.click()
-            logger.info("Clicked Experience Filter dropdown")
-            time.sleep(1)
+            doctor_field.send_keys(Keys.ARROW_DOWN)
+            wait_for_settle(driver, replaces=0.5)
+        except:
+            pass
+        with budget("Search results visible", float(config.get_value("budget_search_results_seconds", "10"))) as search_budget:
+            try:
+                doctor_field.send_keys(Keys.ENTER)
+            except:
+                pass
+            wait_for_settle(driver, replaces=3)
+    
+            # Verify doctor list is displayed
+            try:
+                doctor_list = PolicyWait(driver, search_budget.remaining).until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'doctor-card') or contains(@class, 'doctor')]")))
+                assert doctor_list.is_displayed(), "Doctor list should be visible after search"
+            except:
+                logger.warning("Doctor list not found, continuing with booking flow")
+                pass
+        first_card = DoctorsPage(driver).time_to_first_doctor_card()
+        if first_card is not None:
+            logger.info(f"First doctor card rendered {first_card:.2f}s after navigation start")
+    
+    with step("Step 12-14: Apply gender filter if provided"):
+        gender_preference = test_data.get('Gender')
+        if gender_preference:
+            try:
+                gender_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//*[@id='container']/div/div[3]/div/div/header/div[1]/div/div[1]")))
+                gender_btn.click()
+                logger.info("Clicked Gender Filter button")
+                wait_for_settle(driver, replaces=1)
             
-            if "5+" in experience_filter:
-                experience_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='5,9999999']")))
-                logger.info("Selecting '5+ Years of experience' filter")
-            elif "10+" in experience_filter:
-                experience_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='10,9999999']")))
-                logger.info("Selecting '10+ Years of experience' filter")
-            elif "15+" in experience_filter:
-                experience_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='15,9999999']")))
-                logger.info("Selecting '15+ Years of experience' filter")
-            elif "20+" in experience_filter:
-                experience_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='20,9999999']")))
-                logger.info("Selecting '20+ Years of experience' filter")
-            else:
-                experience_option = None
+                if "Male" in gender_preference:
+                    gender_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='male']")))
+                    logger.info("Selecting 'Male Doctor' option")
+                elif "Female" in gender_preference:
+                    gender_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='female']")))
+                    logger.info("Selecting 'Female Doctor' option")
+                else:
+                    gender_option = None
             
-            if experience_option:
-                experience_option.click()
-                logger.info(f"Selected '{experience_filter}' filter")
-                time.sleep(2)
-                assert experience_option.is_displayed() or True, f"Experience filter '{experience_filter}' should be applied"
+                if gender_option:
+                    gender_option.click()
+                    logger.info(f"Selected '{gender_preference}' filter")
+                    wait_for_settle(driver, replaces=2)
+                    assert gender_option.is_displayed() or True, f"Gender filter '{gender_preference}' should be applied"
+            except Exception as e:
+                logger.warning(f"Could not apply gender filter - {str(e)[:50]}")
+                pass
+    
+    with step("Step 15-17: Apply fee filter if provided"):
+        fee_filter = test_data.get('FeeFilter')
+        if fee_filter:
+            try:
+                sort_dropdown = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-qa-id='sort_by_section']")))
+                sort_dropdown.click()
+                logger.info("Clicked Sort/Relevance dropdown")
+                wait_for_settle(driver, replaces=1)
+            
+                fee_low_to_high = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='consultation_fees']")))
+                fee_low_to_high.click()
+                logger.info("Selected 'Consultation Fee - Low to High'")
+                wait_for_settle(driver, replaces=2)
+            except Exception as e:
+                logger.warning(f"Could not select fee sort option - {str(e)[:50]}")
+                pass
+    
+    with step("Step 18-20: Apply experience filter if provided"):
+        experience_filter = test_data.get('ExperienceFilter')
+        if experience_filter:
+            try:
+                experience_dropdown = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-qa-id='years_of_experience_section']")))
+                experience_dropdown.click()
+                logger.info("Clicked Experience Filter dropdown")
+                wait_for_settle(driver, replaces=1)
+            
+                if "5+" in experience_filter:
+                    experience_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='5,9999999']")))
+                    logger.info("Selecting '5+ Years of experience' filter")
+                elif "10+" in experience_filter:
+                    experience_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='10,9999999']")))
+                    logger.info("Selecting '10+ Years of experience' filter")
+                elif "15+" in experience_filter:
+                    experience_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='15,9999999']")))
+                    logger.info("Selecting '15+ Years of experience' filter")
+                elif "20+" in experience_filter:
+                    experience_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//li[@data-qa-id='20,9999999']")))
+                    logger.info("Selecting '20+ Years of experience' filter")
+                else:
+                    experience_option = None
+            
+                if experience_option:
+                    experience_option.click()
+                    logger.info(f"Selected '{experience_filter}' filter")
+                    wait_for_settle(driver, replaces=2)
+                    assert experience_option.is_displayed() or True, f"Experience filter '{experience_filter}' should be applied"
+            except Exception as e:
+                logger.warning(f"Could not apply experience filter - {str(e)[:50]}")
+                pass
+    
+    with step("Step 21-23: Apply availability filter if provided"):
+        availability_filter = test_data.get('AvailabilityFilter')
+        if availability_filter:
+            try:
+                all_filters = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'u-d-inlineblock') and .//span[@data-qa-id='all_filters']]")))
+                all_filters.click()
+                logger.info("Clicked All Filters arrow")
+                wait_for_settle(driver, replaces=1)
+            
+                availability_tomorrow = wait.until(EC.element_to_be_clickable((By.XPATH, "//label[@for='Availability2']")))
+                availability_tomorrow.click()
+                logger.info("Selected 'Available Tomorrow' filter")
+                wait_for_settle(driver, replaces=2)
+                assert availability_tomorrow.is_displayed() or True, "Availability filter should be applied"
+            except Exception as e:
+                logger.warning(f"Could not apply availability filter - {str(e)[:50]}")
+                pass
+    
+    with step("Step 24-26: Click Book Clinic Visit button"):
+        try:
+            book_clinic_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@data-qa-id='book_button' and contains(text(), 'Book Clinic Visit')]")))
+            logger.info("Found 'Book Clinic Visit' button on first doctor card")
+            book_clinic_btn.click()
+            logger.info("Clicked 'Book Clinic Visit'")
+            clicked = True
         except Exception as e:
-            logger.warning(f"Could not apply experience filter - {str(e)[:50]}")
+            logger.warning(f"Could not click Book Clinic Visit - {str(e)[:50]}")
+            clicked = False
+        if clicked:
+            with budget("Slots visible after Book Clinic Visit", float(config.get_value("budget_slots_seconds", "8"))) as slots_budget:
+                wait_for_settle(driver, replaces=3)
+                # With budget_enforce=false missing slots are only a warning and the flow continues
+                slots_timeout = slots_budget.remaining if slots_budget.enforced else slots_budget.limit
+                PolicyWait(driver, slots_timeout).until(EC.visibility_of_element_located((By.XPATH, "//div[@data-qa-id='slot_time']")))
+    
+    with step("Step 27-29: Select date and time slot"):
+        driver.execute_script("window.scrollBy(0, 200);")
+        wait_for_settle(driver, replaces=1)
+    
+    with step("Step 30-32: Select date and verify date selection"):
+        try:
+            tomorrow_date = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-qa-id='date_selector' and contains(., 'tomorrow')]")))
+            tomorrow_date.click()
+            logger.info("Clicked 'tomorrow' date selector")
+            wait_for_settle(driver, replaces=2)
+            assert tomorrow_date.is_displayed() or True, "Tomorrow date should be selectable"
+        except Exception as e:
+            logger.warning(f"Could not click tomorrow date - {str(e)[:50]}")
             pass
     
-    # Step 21-23: Apply availability filter if provided
-    availability_filter = test_data.get('AvailabilityFilter')
-    if availability_filter:
+    with step("Step 33-35: Select time slot and verify selection"):
         try:
-            all_filters = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'u-d-inlineblock') and .//span[@data-qa-id='all_filters']]")))
-            all_filters.click()
-            logger.info("Clicked All Filters arrow")
-            time.sleep(1)
-            
-            availability_tomorrow = wait.until(EC.element_to_be_clickable((By.XPATH, "//label[@for='Availability2']")))
-            availability_tomorrow.click()
-            logger.info("Selected 'Available Tomorrow' filter")
-            time.sleep(2)
-            assert availability_tomorrow.is_displayed() or True, "Availability filter should be applied"
+            first_slot = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-qa-id='slot_time'][1]")))
+            first_slot.click()
+            logger.info("Clicked first available time slot")
+            wait_for_settle(driver, replaces=2)
+            assert first_slot.is_displayed() or True, "Time slot should be selectable"
         except Exception as e:
-            logger.warning(f"Could not apply availability filter - {str(e)[:50]}")
+            logger.warning(f"Could not click time slot - {str(e)[:50]}")
             pass
     
-    # Step 24-26: Click Book Clinic Visit button
-    try:
-        book_clinic_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@data-qa-id='book_button' and contains(text(), 'Book Clinic Visit')]")))
-        logger.info("Found 'Book Clinic Visit' button on first doctor card")
-        book_clinic_btn.click()
-        logger.info("Clicked 'Book Clinic Visit'")
-        time.sleep(3)
-        assert book_clinic_btn.is_displayed() or True, "Book button should be clickable"
-    except Exception as e:
-        logger.warning(f"Could not click Book Clinic Visit - {str(e)[:50]}")
-        pass
-    
-    # Step 27-29: Select date and time slot
-    driver.execute_script("window.scrollBy(0, 200);")
-    time.sleep(1)
-    
-    # Step 30-32: Select date and verify date selection
-    try:
-        tomorrow_date = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-qa-id='date_selector' and contains(., 'tomorrow')]")))
-        tomorrow_date.click()
-        logger.info("Clicked 'tomorrow' date selector")
-        time.sleep(2)
-        assert tomorrow_date.is_displayed() or True, "Tomorrow date should be selectable"
-    except Exception as e:
-        logger.warning(f"Could not click tomorrow date - {str(e)[:50]}")
-        pass
-    
-    # Step 33-35: Select time slot and verify selection
-    try:
-        first_slot = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-qa-id='slot_time'][1]")))
-        first_slot.click()
-        logger.info("Clicked first available time slot")
-        time.sleep(2)
-        assert first_slot.is_displayed() or True, "Time slot should be selectable"
-    except Exception as e:
-        logger.warning(f"Could not click time slot - {str(e)[:50]}")
-        pass
-    
-    # Step 36-38: Confirm booking and verify success
-    try:
-        confirm_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Confirm Clinic Visit')]")))
-        confirm_btn.click()
-        logger.info("Clicked Confirm Clinic Visit button")
-        time.sleep(2)
+    with step("Step 36-38: Confirm booking and verify success"):
+        try:
+            confirm_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Confirm Clinic Visit')]")))
+            confirm_btn.click()
+            logger.info("Clicked Confirm Clinic Visit button")
+            wait_for_settle(driver, replaces=2)
         
-        success_msg = wait.until(EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'success') or contains(text(), 'confirmed') or contains(text(), 'booked')]")))
-        assert success_msg.is_displayed(), "Booking confirmation message should be displayed"
-        logger.info("✓ Appointment booking confirmation received")
-    except Exception as e:
-        logger.warning(f"Booking confirmation check - {str(e)[:50]}")
-        pass
+            success_msg = wait.until(EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'success') or contains(text(), 'confirmed') or contains(text(), 'booked')]")))
+            assert success_msg.is_displayed(), "Booking confirmation message should be displayed"
+            logger.info("✓ Appointment booking confirmation received")
+        except Exception as e:
+            logger.warning(f"Booking confirmation check - {str(e)[:50]}")
+            pass
     
     logger.info(f"[PASS] Row {row_number} - {test_data.get('DoctorType', 'Unknown')}")
@@ -0,0 +1,100 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from utils import duration_gate, report_builder
+from utils.duration_gate import GateSettings, analyze, check
+
+SETTINGS = GateSettings(ratio=0.2, mad_k=3.0, min_delta=1.0, min_history=3, window=10)
+
+
+def test_check_needs_min_history():
+    """Fewer earlier runs than min_history never count as a regression"""
+    assert check("test", "t", 100.0, [10.0, 10.0], SETTINGS) is None
+
+
+def test_check_with_zero_mad():
+    """Identical history (MAD 0) still needs the ratio and min_delta to be exceeded"""
+    history = [10.0, 10.0, 10.0]
+    regression = check("test", "t", 12.5, history, SETTINGS)
+    assert regression is not None
+    assert regression.baseline == 10.0 and regression.mad == 0.0
+    assert regression.delta == pytest.approx(2.5)
+    # Above the ratio but below min_delta seconds
+    assert check("test", "t", 0.9, [0.5, 0.5, 0.5], SETTINGS) is None
+
+
+def test_check_noisy_history_is_not_a_regression():
+    """A slowdown within mad_k robust sigmas of a noisy history passes"""
+    assert check("test", "t", 16.0, [8.0, 12.0, 10.0, 14.0, 6.0], SETTINGS) is None
+
+
+def test_check_uses_only_the_window():
+    """Only the last `window` runs form the baseline"""
+    settings = GateSettings(min_history=3, window=3)
+    assert check("test", "t", 20.0, [20.0] * 10 + [10.0, 10.0, 10.0], settings) is not None
+
+
+def _write_summary(results_dir, results, history):
+    summary_dir = results_dir / "summary"
+    summary_dir.mkdir(parents=True)
+    (summary_dir / "summary.json").write_text(json.dumps({"results": results}), encoding="utf-8")
+    (summary_dir / "history.json").write_text(json.dumps(history), encoding="utf-8")
+
+
+def _result(history_id, status, start, duration_ms):
+    return {"history_id": history_id, "name": history_id, "status": status, "start": start, "duration_ms": duration_ms}
+
+
+def test_analyze_ranks_passed_test_regressions(tmp_path, monkeypatch):
+    """Passed tests are compared with earlier runs only; failed tests are skipped"""
+    monkeypatch.setattr(report_builder, "default_timeline_dir", lambda: str(tmp_path / "timelines"))
+    earlier = [[1000, 10000], [2000, 10000], [3000, 10000]]
+    _write_summary(tmp_path, [
+        _result("slow", "passed", 5000, 20000),
+        _result("slower", "passed", 5000, 30000),
+        _result("failed", "failed", 5000, 90000),
+    ], {"durations": {
+        # The current run already recorded in the history is not part of its own baseline
+        "slow": {"runs": earlier + [[5000, 20000]]},
+        "slower": {"runs": earlier},
+        "failed": {"runs": earlier},
+    }})
+
+    regressions = analyze(str(tmp_path), SETTINGS, allure_history=str(tmp_path / "missing.json"))
+    assert [r.name for r in regressions] == ["slower", "slow"]
+    assert regressions[1].runs == 3
+
+
+def test_analyze_checks_steps_from_timelines(tmp_path, monkeypatch):
+    """Step durations of the run's timelines are compared with the step history"""
+    timelines = tmp_path / "timelines"
+    timelines.mkdir()
+    monkeypatch.setattr(report_builder, "default_timeline_dir", lambda: str(timelines))
+    start_ms = 1_700_000_000_000
+    (timelines / "t.json").write_text(json.dumps({
+        "test": "t",
+        "started_at": datetime.fromtimestamp(start_ms / 1000).isoformat(timespec="milliseconds"),
+        "steps": [{"name": "Search", "seconds": 9.0, "depth": 0}],
+    }), encoding="utf-8")
+    _write_summary(tmp_path, [_result("t", "passed", start_ms, 9000)], {
+        "steps": {"t": {"Search": [[1000, 3.0], [2000, 3.0], [3000, 3.0]]}},
+    })
+
+    regressions = analyze(str(tmp_path), SETTINGS, allure_history=str(tmp_path / "missing.json"))
+    assert [(r.kind, r.name) for r in regressions] == [("step", "t > Search")]
+
+
+def test_analyze_without_summary(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        analyze(str(tmp_path), SETTINGS, allure_history=str(tmp_path / "missing.json"))
+
+
+def test_main_exit_codes(tmp_path, monkeypatch):
+    """Exit 2 without a summary, 0 without regressions"""
+    monkeypatch.setattr(report_builder, "default_timeline_dir", lambda: str(tmp_path / "timelines"))
+    missing = str(tmp_path / "missing.json")
+    assert duration_gate.main([str(tmp_path), "--allure-history", missing]) == 2
+    _write_summary(tmp_path, [_result("t", "passed", 5000, 10000)], {})
+    assert duration_gate.main([str(tmp_path), "--allure-history", missing]) == 0
@@ -5,28 +5,22 @@ from pages.doctor_profile_page import DoctorProfilePage
 from pages.login_page import LoginPage
 from pages.appointments_page import AppointmentsPage
 from pages.articles_page import ArticlesPage
+from pages.corporate_page import CorporatePage
+from utils.dom_settle import wait_for_settle
 from utils.logger import get_logger
 from utils.excel_reader import ExcelReader
-from utils.screenshot_util import ScreenshotUtil
+from utils.wait_policy import PolicyWait
 from utils.test_data_reader import (
-    get_all_test_rows,
     get_test_data_by_row,
-    get_all_tc_02_rows,
     get_test_data_tc_02_by_row,
-    get_all_tc_03_rows,
     get_test_data_tc_03_by_row,
-    get_all_tc_04_rows,
     get_test_data_tc_04_by_row,
-    get_all_tc_05_rows,
     get_test_data_tc_05_by_row,
-    get_all_tc_06_rows,
     get_test_data_tc_06_by_row,
 )
 import os
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
 from selenium.common.exceptions import TimeoutException
@@ -34,20 +28,20 @@ from selenium.common.exceptions import TimeoutException
 logger = get_logger("individual_features")
 
 @pytest.mark.smoke
-@pytest.mark.parametrize("row_number", get_all_tc_02_rows())
+@pytest.mark.datafile("test_data_tc_02.xlsx")
 def test_tc_02_for_providers_menu(driver, config, row_number):
     """TC_02: Verify For Providers dropdown, Practo Prime, and fill subscriber details"""
     
     test_data = get_test_data_tc_02_by_row(row_number)
     assert test_data is not None, f"Test data not found for TC_02 row {row_number}"
     
-    wait = WebDriverWait(driver, 15)
+    wait = PolicyWait(driver, 15)
     base_url = config.get_value("base_url")
     
     # Navigate to home page
     driver.get(base_url)
     logger.info(f"Navigated to {base_url}")
-    time.sleep(2)
+    wait_for_settle(driver, replaces=2)
     
     try:
         # Step 1: Click on "For Providers" dropdown
@@ -55,26 +49,26 @@ def test_tc_02_for_providers_menu(driver, config, row_number):
         assert for_providers_btn is not None, "For Providers button not found"
         for_providers_btn.click()
         logger.info("[STEP 1 PASS] Clicked 'For Providers' dropdown menu")
-        time.sleep(1)
+        wait_for_settle(driver, replaces=1)
         
         # Step 2: Select "Practo Prime" (second option from dropdown)
         practo_prime_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[@href='https://www.practo.com/providers/prime']")))
         assert practo_prime_option is not None, "Practo Prime option not found in dropdown"
         practo_prime_option.click()
         logger.info("[STEP 2 PASS] Selected 'Practo Prime' option from dropdown")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Assertion for Step 2: Verify navigation to Practo Prime page
         assert "practo.com/providers/prime" in driver.current_url, f"Should navigate to Practo Prime page, but URL is {driver.current_url}"
         logger.info("[STEP 2 ASSERTION PASS] Successfully navigated to Practo Prime page")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Step 3: Click on "Get free demo" button
         get_demo_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[@class='margin-v btn orange event' and contains(text(), 'Get free demo')]")))
         assert get_demo_btn is not None, "Get free demo button not found"
         get_demo_btn.click()
         logger.info("[STEP 3 PASS] Clicked 'Get free demo' button")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Assertion for Step 3: Verify demo form appeared
         try:
@@ -87,7 +81,7 @@ def test_tc_02_for_providers_menu(driver, config, row_number):
         # Scroll to the demo form if needed
         driver.execute_script("window.scrollBy(0, 300);")
         logger.info("Scrolled to free demo form section")
-        time.sleep(1)
+        wait_for_settle(driver, replaces=1)
         
         # Step 4: Select Category from dropdown
         category = test_data.get('Category')
@@ -112,7 +106,7 @@ def test_tc_02_for_providers_menu(driver, config, row_number):
             else:
                 raise AssertionError(f"Unknown category: {category}")
             
-            time.sleep(1)
+            wait_for_settle(driver, replaces=1)
             selected_option = select.first_selected_option.text
             assert selected_option in ["I own a clinic", "I own a hospital", "Other"], f"Category not properly selected. Selected: {selected_option}"
             logger.info(f"[STEP 4 ASSERTION PASS] Selected category: {category}")
@@ -126,7 +120,7 @@ def test_tc_02_for_providers_menu(driver, config, row_number):
             name_field.clear()
             name_field.send_keys(name)
             logger.info(f"[STEP 5 PASS] Entered name: {name}")
-            time.sleep(1)
+            wait_for_settle(driver, replaces=1)
             
             # Assertion: Verify name was entered
             entered_name = name_field.get_attribute('value')
@@ -142,7 +136,7 @@ def test_tc_02_for_providers_menu(driver, config, row_number):
             mobile_field.clear()
             mobile_field.send_keys(str(mobile_number))
             logger.info(f"[STEP 6 PASS] Entered mobile number: {mobile_number}")
-            time.sleep(1)
+            wait_for_settle(driver, replaces=1)
             
             # Assertion: Verify mobile number was entered
             entered_mobile = mobile_field.get_attribute('value')
@@ -158,14 +152,14 @@ def test_tc_02_for_providers_menu(driver, config, row_number):
             assert city_btn is not None, "City dropdown button not found"
             city_btn.click()
             logger.info("[STEP 7 PASS] Clicked city dropdown button")
-            time.sleep(1)
+            wait_for_settle(driver, replaces=1)
             
             # Select city from dropdown list
             city_option = wait.until(EC.element_to_be_clickable((By.XPATH, f"//ul[@class='selectbox cities dropdown-menu']//li[@data-city='{city}']")))
             assert city_option is not None, f"City option '{city}' not found in dropdown"
             city_option.click()
             logger.info(f"[STEP 7 PASS] Selected city: {city}")
-            time.sleep(1)
+            wait_for_settle(driver, replaces=1)
             
             # Assertion: Verify city was selected
             selected_city_btn = wait.until(EC.presence_of_element_located((By.XPATH, "//button[@class='active-city btn default dropdown-toggle']")))
@@ -178,7 +172,7 @@ def test_tc_02_for_providers_menu(driver, config, row_number):
         assert submit_btn is not None, "Submit button not found"
         submit_btn.click()
         logger.info("[STEP 8 PASS] Clicked 'Get Free Demo' submit button")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Assertion for Step 8: Verify successful form submission
         try:
@@ -196,21 +190,18 @@ def test_tc_02_for_providers_menu(driver, config, row_number):
         
     except Exception as e:
         logger.error(f"[FAIL] TC_02 Row {row_number} - Error: {str(e)}")
-        # Capture screenshot on failure
-        screenshot_util = ScreenshotUtil(driver)
-        screenshot_path = screenshot_util.capture_screenshot(f"TC_02_FAILURE_Row_{row_number}")
-        logger.error(f"Screenshot saved to: {screenshot_path}")
+        # The failure screenshot is taken and attached by pytest_runtest_makereport
         raise
 
 @pytest.mark.smoke
-@pytest.mark.parametrize("row_number", get_all_tc_03_rows())
+@pytest.mark.datafile("test_data_tc_03.xlsx")
 def test_tc_03_careers_search(driver, config, row_number):
     """TC_03: Verify Careers page - Find Doctors, Fortune, Careers, Search, and Job Category selection"""
     
     test_data = get_test_data_tc_03_by_row(row_number)
     assert test_data is not None, f"Test data not found for TC_03 row {row_number}"
     
-    wait = WebDriverWait(driver, 15)
+    wait = PolicyWait(driver, 15)
     base_url = config.get_value("base_url")
     
     try:
@@ -218,27 +209,27 @@ def test_tc_03_careers_search(driver, config, row_number):
         driver.get(base_url)
         assert "practo.com" in driver.current_url, f"Failed to navigate to home page. URL: {driver.current_url}"
         logger.info(f"[STEP 1 PASS] Navigated to {base_url}")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Step 2: Click on Find Doctors
         find_doctors_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Find Doctors')] | //div[contains(text(), 'Find Doctors')]")))
         assert find_doctors_btn is not None, "Find Doctors button not found"
         find_doctors_btn.click()
         logger.info("[STEP 2 PASS] Clicked 'Find Doctors' button")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Step 3: Click on "Fortune" button
         fortune_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//*[@id='container']/div[2]/div[4]/div/div/div[2]/a[1]")))
         assert fortune_btn is not None, "Fortune button not found"
         fortune_btn.click()
         logger.info("[STEP 3 PASS] Clicked 'Fortune' button")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Step 4: Click on "Careers" button from the header
         # Scroll down to see footer with Careers button
         driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
         logger.info("[STEP 4 PASS] Scrolled to footer")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Get current window handle before clicking
         current_window = driver.current_window_handle
@@ -248,7 +239,7 @@ def test_tc_03_careers_search(driver, config, row_number):
         assert careers_btn is not None, "Careers button not found in footer"
         careers_btn.click()
         logger.info("[STEP 4 PASS] Clicked 'Careers' button from header")
-        time.sleep(3)
+        wait_for_settle(driver, replaces=3)
         
         # Switch to new window/tab if it was opened
         if len(driver.window_handles) > 1:
@@ -258,21 +249,21 @@ def test_tc_03_careers_search(driver, config, row_number):
             current_url = driver.current_url.lower()
             assert "career" in current_url or "job" in current_url, f"Careers/Jobs page not loaded. URL: {driver.current_url}"
         
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Step 5: Click on search box
         try:
             search_box = wait.until(EC.presence_of_element_located((By.NAME, "search")))
             assert search_box is not None, "Search box not found on Careers page"
             driver.execute_script("arguments[0].scrollIntoView(true);", search_box)
-            time.sleep(1)
+            wait_for_settle(driver, replaces=1)
             search_box.click()
             logger.info("[STEP 5 PASS] Clicked on search box")
         except:
             logger.warning("Could not find search box, page may not have loaded completely")
             logger.info("Current URL: " + driver.current_url)
             raise
-        time.sleep(1)
+        wait_for_settle(driver, replaces=1)
         
         # Step 6: Select job category checkbox based on Excel data
         job_category = test_data.get('JobCategory', '')
@@ -286,7 +277,7 @@ def test_tc_03_careers_search(driver, config, row_number):
                 job_category_checkbox = wait.until(EC.presence_of_element_located((By.XPATH, checkbox_xpath)))
                 assert job_category_checkbox is not None, f"Checkbox for {job_category} not found"
                 driver.execute_script("arguments[0].scrollIntoView(true);", job_category_checkbox)
-                time.sleep(1)
+                wait_for_settle(driver, replaces=1)
                 job_category_checkbox.click()
                 logger.info(f"[STEP 6 PASS] Clicked checkbox for job category: {job_category}")
                 
@@ -301,7 +292,7 @@ def test_tc_03_careers_search(driver, config, row_number):
                     alt_checkbox_xpath = f"//input[@type='checkbox' and contains(@id, '{job_category}')]"
                     alt_checkbox = wait.until(EC.presence_of_element_located((By.XPATH, alt_checkbox_xpath)))
                     driver.execute_script("arguments[0].scrollIntoView(true);", alt_checkbox)
-                    time.sleep(1)
+                    wait_for_settle(driver, replaces=1)
                     alt_checkbox.click()
                     logger.info(f"[STEP 6 PASS] Clicked checkbox for job category using alternative locator: {job_category}")
                     
@@ -312,7 +303,7 @@ def test_tc_03_careers_search(driver, config, row_number):
                 except:
                     raise
         
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Step 7: Verify job category filter is applied - check if category appears in job results
         logger.info(f"[STEP 7 PASS] Verifying job category filter is applied for: {job_category}")
@@ -342,20 +333,17 @@ def test_tc_03_careers_search(driver, config, row_number):
         
     except Exception as e:
         logger.error(f"[FAIL] TC_03 Row {row_number} - Error: {str(e)}")
-        # Capture screenshot on failure
-        screenshot_util = ScreenshotUtil(driver)
-        screenshot_path = screenshot_util.capture_screenshot(f"TC_03_FAILURE_Row_{row_number}")
-        logger.error(f"Screenshot saved to: {screenshot_path}")
+        # The failure screenshot is taken and attached by pytest_runtest_makereport
         raise
 
 @pytest.mark.smoke
-@pytest.mark.parametrize("row_number", get_all_tc_04_rows())
-def test_tc_04_my_appointments(driver, config, row_number):
+@pytest.mark.datafile("test_data_tc_04.xlsx")
+def test_tc_04_my_appointments(driver, config, auth_state, row_number):
     """TC_04: Verify My Appointments page - Login and access from dropdown"""
     test_data = get_test_data_tc_04_by_row(row_number)
     assert test_data is not None, f"Test data not found for TC_04 row {row_number}"
     
-    wait = WebDriverWait(driver, 15)
+    wait = PolicyWait(driver, 15)
     base_url = config.get_value("base_url")
     
     try:
@@ -366,47 +354,12 @@ def test_tc_04_my_appointments(driver, config, row_number):
         assert password is not None and password != '', "Password not found in test data"
         logger.info(f"[STEP 0 PASS] Starting TC_04 with email: {email}")
         
-        # Navigate to the home page first, then look for login option or use accounts page
-        driver.get(base_url)
-        assert "practo.com" in driver.current_url, f"Failed to navigate to home page. URL: {driver.current_url}"
-        logger.info(f"[STEP 0 PASS] Navigated to home page: {base_url}")
-        time.sleep(2)
-        
-        # Look for login link/button on home page
-        try:
-            # Try to find and click a login link
-            login_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Login')] | //a[contains(text(), 'Sign in')] | //button[contains(text(), 'Login')]")))
-            login_link.click()
-            logger.info("[STEP 0 PASS] Clicked on login link")
-            time.sleep(2)
-        except:
-            # If no login link found, navigate directly to login URL
-            driver.get("https://accounts.practo.com/login")
-            logger.info("[STEP 0 PASS] Navigated to login page directly")
-            time.sleep(2)
-        
-        # Enter email
-        email_input = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@id='email'] | //input[@type='email'] | //input[contains(@placeholder, 'Email')]")))
-        assert email_input is not None, "Email input field not found"
-        email_input.send_keys(email)
-        logger.info(f"[STEP 0 PASS] Entered email: {email}")
-        time.sleep(1)
-        
-        # Enter password
-        password_input = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@id='password'] | //input[@type='password'] | //input[contains(@placeholder, 'Password')]")))
-        assert password_input is not None, "Password input field not found"
-        password_input.send_keys(password)
-        logger.info("[STEP 0 PASS] Entered password")
-        time.sleep(1)
-        
-        # Click login button
-        login_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Login')] | //button[contains(text(), 'login')] | //button[@type='submit']")))
-        assert login_btn is not None, "Login button not found"
-        login_btn.click()
-        logger.info("[STEP 0 PASS] Clicked login button")
-        time.sleep(3)
+        # Restore the saved login state for this account (UI login only when missing, expired or rejected)
+        logged_in = auth_state.ensure_authenticated(driver, email, password)
+        logger.info("[STEP 0 PASS] Authenticated session ready")
         
         # Assertion: Verify login successful
+        assert logged_in, f"Login failed for {email} - Practo login link still shown"
         assert "login" not in driver.current_url.lower(), f"Login failed - still on login page. URL: {driver.current_url}"
         logger.info("[STEP 0 ASSERTION PASS] Login successful")
         
@@ -414,7 +367,7 @@ def test_tc_04_my_appointments(driver, config, row_number):
         driver.get(base_url)
         assert "practo.com" in driver.current_url, f"Failed to navigate to home page. URL: {driver.current_url}"
         logger.info(f"[STEP 1 PASS] Navigated to home page: {base_url}")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Step 2: Click on "My Appointments" from dropdown
         # First click the dropdown toggle
@@ -422,14 +375,14 @@ def test_tc_04_my_appointments(driver, config, row_number):
         assert dropdown_toggle is not None, "User dropdown toggle not found"
         dropdown_toggle.click()
         logger.info("[STEP 2 PASS] Clicked on user dropdown toggle")
-        time.sleep(1)
+        wait_for_settle(driver, replaces=1)
         
         # Then click "My Appointments" link
         my_appointments_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[@class='nav-interact' and @href='https://drive.practo.com/appointments']")))
         assert my_appointments_link is not None, "My Appointments link not found in dropdown"
         my_appointments_link.click()
         logger.info("[STEP 2 PASS] Clicked on 'My Appointments' link")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Assertion: Verify navigation to My Appointments page
         assert "drive.practo.com" in driver.current_url or "appointments" in driver.current_url.lower(), f"Failed to navigate to My Appointments page. URL: {driver.current_url}"
@@ -441,7 +394,7 @@ def test_tc_04_my_appointments(driver, config, row_number):
             upcoming_section = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='appointment-card row']//div[@class='card-header text-left heading-four' and contains(text(), 'Upcoming')]")))
             assert upcoming_section is not None, "Upcoming section not found"
             logger.info("[STEP 3 PASS] Found Upcoming section")
-            time.sleep(1)
+            wait_for_settle(driver, replaces=1)
             
             # Try to find the first appointment card in the Upcoming section
             # Look for the appointment card body and then the View Details button
@@ -451,14 +404,14 @@ def test_tc_04_my_appointments(driver, config, row_number):
             
             # Scroll the appointment card into view
             driver.execute_script("arguments[0].scrollIntoView(true);", first_appointment_card)
-            time.sleep(1)
+            wait_for_settle(driver, replaces=1)
             
             # Click the View Details button for the first appointment
             view_details_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@class='appointment-card row']//div[@class='appointment-action-buttons col-xs-12 col-sm-6']/div[contains(@id, 'viewDetailsBtn')]")))
             assert view_details_btn is not None, "View Details button not found"
             view_details_btn.click()
             logger.info("[STEP 3 PASS] Clicked on View Details button for first appointment")
-            time.sleep(2)
+            wait_for_settle(driver, replaces=2)
             
             # Assertion: Verify appointment details page loaded
             appointment_details_visible = wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'appointment')] | //div[contains(@class, 'detail')]")))
@@ -470,7 +423,7 @@ def test_tc_04_my_appointments(driver, config, row_number):
             assert cancel_appointment_link is not None, "Cancel Appointment button not found"
             cancel_appointment_link.click()
             logger.info("[STEP 4 PASS] Clicked on 'Cancel Appointment' button")
-            time.sleep(2)
+            wait_for_settle(driver, replaces=2)
             
             # Step 5: Assert if the Cancel Appointment message is displayed
             # Look for success message or cancellation confirmation
@@ -493,20 +446,17 @@ def test_tc_04_my_appointments(driver, config, row_number):
         
     except Exception as e:
         logger.error(f"[FAIL] TC_04 Row {row_number} - Error: {str(e)}")
-        # Capture screenshot on failure
-        screenshot_util = ScreenshotUtil(driver)
-        screenshot_path = screenshot_util.capture_screenshot(f"TC_04_FAILURE_Row_{row_number}")
-        logger.error(f"Screenshot saved to: {screenshot_path}")
+        # The failure screenshot is taken and attached by pytest_runtest_makereport
         raise
 
 @pytest.mark.smoke
-@pytest.mark.parametrize("row_number", get_all_tc_05_rows())
+@pytest.mark.datafile("test_data_tc_05.xlsx")
 def test_tc_05_surgeries(driver, config, row_number):
     """TC_05: Verify Surgeries page - Navigate to homepage and click Surgeries"""
     test_data = get_test_data_tc_05_by_row(row_number)
     assert test_data is not None, f"Test data not found for TC_05 row {row_number}"
     
-    wait = WebDriverWait(driver, 15)
+    wait = PolicyWait(driver, 15)
     base_url = config.get_value("base_url")
     
     try:
@@ -514,14 +464,14 @@ def test_tc_05_surgeries(driver, config, row_number):
         driver.get(base_url)
         assert "practo.com" in driver.current_url, f"Failed to navigate to home page. URL: {driver.current_url}"
         logger.info(f"[STEP 1 PASS] Navigated to home page: {base_url}")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Step 2: Click on "Surgeries" tab
         surgeries_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@class='product-tab']//a[@class='nav-interact' and @href='https://www.practo.com/care']")))
         assert surgeries_link is not None, "Surgeries tab not found"
         surgeries_link.click()
         logger.info("[STEP 2 PASS] Clicked on 'Surgeries' tab")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
         # Assertion: Verify navigation to Surgeries page
         assert "practo.com/care" in driver.current_url, f"Should navigate to Surgeries page, but URL is {driver.current_url}"
@@ -537,13 +487,13 @@ def test_tc_05_surgeries(driver, config, row_number):
             try:
                 department_element = wait.until(EC.presence_of_element_located((By.XPATH, department_xpath)))
                 driver.execute_script("arguments[0].scrollIntoView(true);", department_element)
-                time.sleep(1)
+                wait_for_settle(driver, replaces=1)
                 
                 # Click on the department card (parent div)
                 department_card = driver.execute_script("return arguments[0].closest('.OurDepartments-module_item__jmn2-');", department_element)
                 driver.execute_script("arguments[0].click();", department_card)
                 logger.info(f"Clicked on department: {department}")
-                time.sleep(2)
+                wait_for_settle(driver, replaces=2)
                 
                 # Assertion: Verify department was selected - check if ailments modal/section appeared
                 try:
@@ -566,13 +516,13 @@ def test_tc_05_surgeries(driver, config, row_number):
                 ailment_xpath = f"//p[@data-qa-id='surgical-solution-ailment-name' and contains(text(), '{sub_type}')]"
                 ailment_element = wait.until(EC.presence_of_element_located((By.XPATH, ailment_xpath)))
                 driver.execute_script("arguments[0].scrollIntoView(true);", ailment_element)
-                time.sleep(1)
+                wait_for_settle(driver, replaces=1)
                 
                 # Click on the ailment item (parent div)
                 ailment_card = driver.execute_script("return arguments[0].closest('.flex.flex-col.items-center.text-center');", ailment_element)
                 driver.execute_script("arguments[0].click();", ailment_card)
                 logger.info(f"Clicked on SubType (ailment): {sub_type}")
-                time.sleep(2)
+                wait_for_settle(driver, replaces=2)
                 
                 # Assertion: Verify ailment selection - check if page content changed or results appeared
                 try:
@@ -592,43 +542,31 @@ def test_tc_05_surgeries(driver, config, row_number):
         
     except Exception as e:
         logger.error(f"[FAIL] TC_05 Row {row_number} - Error: {str(e)}")
-        # Capture screenshot on failure
-        screenshot_util = ScreenshotUtil(driver)
-        screenshot_path = screenshot_util.capture_screenshot(f"TC_05_FAILURE_Row_{row_number}")
-        logger.error(f"Screenshot saved to: {screenshot_path}")
+        # The failure screenshot is taken and attached by pytest_runtest_makereport
         raise
 
 @pytest.mark.smoke
-@pytest.mark.parametrize("row_number", get_all_tc_06_rows())
+@pytest.mark.datafile("test_data_tc_06.xlsx")
 def test_tc_06_for_corporates(driver, config, row_number):
     """TC_06: Verify For Corporates dropdown - Navigate and select option"""
     test_data = get_test_data_tc_06_by_row(row_number)
     assert test_data is not None, f"Test data not found for TC_06 row {row_number}"
     
-    wait = WebDriverWait(driver, 15)
+    wait = PolicyWait(driver, 15)
     base_url = config.get_value("base_url")
     
     try:
         # Step 1: Go to home page
         driver.get(base_url)
         logger.info(f"Navigated to home page: {base_url}")
-        time.sleep(2)
+        wait_for_settle(driver, replaces=2)
         
-        # Step 2: Click on "For Corporates" dropdown toggle
-        for_corporates_toggle = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'nav-items') and contains(@class, 'dropdown-toggle')]//span[@class='nav-interact' and contains(text(), 'For Corporates')]/..")))
-        for_corporates_toggle.click()
-        logger.info("Clicked on 'For Corporates' dropdown toggle")
-        time.sleep(1)
-        
-        # Step 3: Click on the first dropdown option "Health & Wellness Plans"
+        # Step 2-3: Open the "For Corporates" dropdown and click the corporate option from the test data
+        corporate_page = CorporatePage(driver)
         corporate_option = test_data.get('CorporateOption', 'Health & Wellness Plans')
         logger.info(f"Selecting corporate option: {corporate_option}")
-        
-        # Find and click the first option in the dropdown
-        first_option = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Health & Wellness Plans')]")))
-        first_option.click()
+        corporate_page.open_corporate_option(corporate_option)
         logger.info(f"Clicked on corporate option: {corporate_option}")
-        time.sleep(2)
         
         # Step 4: Fill demo details form
         # Get form data from Excel
@@ -640,59 +578,19 @@ def test_tc_06_for_corporates(driver, config, row_number):
         interested_in = test_data.get('InterestedIn', '')
         
         logger.info(f"Filling form with Name: {name}")
+        corporate_page.fill_demo_form(name, organization_name, contact_number, official_email,
+                                      organization_size, interested_in)
+        logger.info(f"Entered form details for {organization_name} (size {organization_size}, interested in {interested_in})")
         
-        # Fill Name field
-        name_input = wait.until(EC.presence_of_element_located((By.ID, "name")))
-        name_input.send_keys(name)
-        logger.info(f"Entered name: {name}")
-        time.sleep(1)
-        
-        # Fill Organization Name field
-        org_name_input = wait.until(EC.presence_of_element_located((By.ID, "organizationName")))
-        org_name_input.send_keys(organization_name)
-        logger.info(f"Entered organization name: {organization_name}")
-        time.sleep(1)
-        
-        # Fill Contact Number field
-        contact_input = wait.until(EC.presence_of_element_located((By.ID, "contactNumber")))
-        contact_input.send_keys(contact_number)
-        logger.info(f"Entered contact number: {contact_number}")
-        time.sleep(1)
-        
-        # Fill Official Email ID field
-        email_input = wait.until(EC.presence_of_element_located((By.ID, "officialEmailId")))
-        email_input.send_keys(official_email)
-        logger.info(f"Entered official email: {official_email}")
-        time.sleep(1)
-        
-        # Select Organization Size dropdown - 2nd option
-        org_size_select = wait.until(EC.presence_of_element_located((By.ID, "organizationSize")))
-        select_org_size = Select(org_size_select)
-        select_org_size.select_by_value(organization_size)
-        logger.info(f"Selected organization size: {organization_size}")
-        time.sleep(1)
-        
-        # Select Interested In dropdown - 2nd option
-        interested_select = wait.until(EC.presence_of_element_located((By.ID, "interestedIn")))
-        select_interested = Select(interested_select)
-        select_interested.select_by_value(interested_in)
-        logger.info(f"Selected interested in: {interested_in}")
-        time.sleep(1)
-        
-        # Click Schedule Demo button
-        schedule_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@type='submit' and contains(text(), 'Schedule')]")))
-        schedule_btn.click()
+        corporate_page.submit_demo_form()
         logger.info("Clicked 'Schedule a demo' button")
-        time.sleep(2)
         
         # Assertion: Verify form submission successful
-        try:
-            # Check for success message or page redirection
-            success_msg = wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'success')] | //div[contains(text(), 'success')] | //*[contains(text(), 'Thank you')] | //*[contains(text(), 'submitted')] | //*[contains(text(), 'scheduled')]")))
-            logger.info(f"Success message found: {success_msg.text}")
-            assert success_msg is not None, "Form submission success message not found"
+        success_text = corporate_page.get_submission_message(timeout=15)
+        if success_text is not None:
+            logger.info(f"Success message found: {success_text}")
             logger.info(f"[PASS] TC_06 - Corporate demo form submitted successfully with message")
-        except:
+        else:
             # Alternative: Check if URL changed
             current_url = driver.current_url
             logger.info(f"Current URL after form submission: {current_url}")
@@ -708,9 +606,6 @@ def test_tc_06_for_corporates(driver, config, row_number):
         
     except Exception as e:
         logger.error(f"[FAIL] TC_06 Row {row_number} - Error: {str(e)}")
-        # Capture screenshot on failure
-        screenshot_util = ScreenshotUtil(driver)
-        screenshot_path = screenshot_util.capture_screenshot(f"TC_06_FAILURE_Row_{row_number}")
-        logger.error(f"Screenshot saved to: {screenshot_path}")
+        # The failure screenshot is taken and attached by pytest_runtest_makereport
         raise
 
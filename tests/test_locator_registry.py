@@ -0,0 +1,54 @@
+import json
+
+from utils.locator_registry import LocatorRegistry, split_union
+
+
+def test_split_union_top_level_alternatives():
+    assert split_union("//button[@type='submit'] | //a[@id='go']|//input") == [
+        "//button[@type='submit']", "//a[@id='go']", "//input"]
+    assert split_union("//div[@class='card']") == ["//div[@class='card']"]
+
+
+def test_split_union_keeps_nested_brackets():
+    """`|` inside (nested) predicates and grouping parentheses is not a separator"""
+    xpath = "//div[.//span[@a='x' or (@b | @c)]]/a | (//a | //b)[1]"
+    assert split_union(xpath) == ["//div[.//span[@a='x' or (@b | @c)]]/a", "(//a | //b)[1]"]
+
+
+def test_split_union_keeps_quoted_pipes():
+    xpath = """//a[text()='A | B'] | //a[contains(., "it's | ok")] | //b"""
+    assert split_union(xpath) == ["//a[text()='A | B']", """//a[contains(., "it's | ok")]""", "//b"]
+
+
+def test_split_union_drops_empty_parts():
+    assert split_union(" | //a || //b | ") == ["//a", "//b"]
+
+
+def test_rank_by_wins_then_speed(tmp_path):
+    registry = LocatorRegistry(str(tmp_path / "locator_stats.json"))
+    registry.record("key", "//b", won=True, elapsed_ms=300)
+    registry.record("key", "//c", won=True, elapsed_ms=100)
+    registry.record("key", "//d", won=True, elapsed_ms=50)
+    registry.record("key", "//d", won=True, elapsed_ms=50)
+    registry.record("key", "//a", won=False)
+    assert registry.rank("key", ["//a", "//b", "//c", "//d", "//e"]) == ["//d", "//c", "//b", "//e", "//a"]
+    # Without stats the declared order is kept
+    assert registry.rank("other", ["//x", "//y"]) == ["//x", "//y"]
+
+
+def test_save_merges_with_other_workers(tmp_path):
+    """Each registry only adds its own run's counts to the stats file"""
+    path = str(tmp_path / "locator_stats.json")
+    first, second = LocatorRegistry(path), LocatorRegistry(path)
+    first.record("key", "//a", won=True, elapsed_ms=10)
+    second.record("key", "//a", won=True, elapsed_ms=30)
+    second.record("key", "//b", won=False)
+    first.save()
+    second.save()
+    second.save()
+
+    with open(path, encoding="utf-8") as f:
+        stats = json.load(f)
+    assert stats["key"]["//a"] == {"wins": 2, "misses": 0, "total_ms": 40.0}
+    assert stats["key"]["//b"]["misses"] == 1
+    assert LocatorRegistry(path).has_wins("key", "//a")
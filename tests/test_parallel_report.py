@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from utils.worker_context import WORKER_ENV_VAR
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE_TESTS = '''
+def test_first_shard():
+    assert True
+
+
+def test_second_shard():
+    assert True
+'''
+
+
+def test_workers_run_writes_report_summary(tmp_path):
+    """A --workers 2 run writes summary.json, index.html and history.json once the shards are merged"""
+    results_dir = tmp_path / "results"
+    # Inside the project so the root conftest (and its --workers handling) applies
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(__file__), prefix="_workers_") as sample_dir:
+        sample_file = os.path.join(sample_dir, "sample_tests.py")
+        with open(sample_file, "w", encoding="utf-8") as f:
+            f.write(SAMPLE_TESTS)
+
+        env = {k: v for k, v in os.environ.items() if k != WORKER_ENV_VAR}
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", sample_file, "--workers", "2", f"--alluredir={results_dir}",
+             "-p", "no:cacheprovider"],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=300,
+        )
+
+    assert result.returncode == 0, f"--workers run failed:\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}"
+    summary_dir = results_dir / "summary"
+    for name in ("summary.json", "index.html", "history.json"):
+        assert (summary_dir / name).is_file(), f"{name} not written by the --workers parent process"
+    summary = json.loads((summary_dir / "summary.json").read_text(encoding="utf-8"))
+    assert summary["tests"] == 2, f"Summary should cover both shards, got {summary['tests']} tests"
+    assert summary["totals"]["passed"] == 2
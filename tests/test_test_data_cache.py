@@ -0,0 +1,105 @@
+import os
+import pickle
+
+import openpyxl
+import pytest
+
+from utils import test_data_cache
+from utils.test_data_cache import get_manifest_rows, load_workbook_index
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Empty in-memory and on-disk caches, with testdata/ in tmp_path"""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(test_data_cache, "TESTDATA_DIR", str(tmp_path))
+    monkeypatch.setattr(test_data_cache, "CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(test_data_cache, "MANIFEST_PATH", str(cache_dir / "manifest.json"))
+    monkeypatch.setattr(test_data_cache, "_index_cache", {})
+    monkeypatch.setattr(test_data_cache, "_manifest", None)
+    return tmp_path
+
+
+def _write_workbook(path, rows, mtime=None):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet.append(["TestCaseID", "City"])
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def _forget_memory_cache(monkeypatch):
+    monkeypatch.setattr(test_data_cache, "_index_cache", {})
+    monkeypatch.setattr(test_data_cache, "_manifest", None)
+
+
+def test_index_rows_and_ids(cache):
+    path = _write_workbook(cache / "data.xlsx", [["TC_01", "Pune"], [None, "ignored"], ["TC_02"]])
+    index = load_workbook_index(path)
+    assert index.active_sheet == "Data"
+    assert index.row_numbers() == [2, 4]
+    assert index.row_by_id("TC_02") == 4
+    assert index.row_by_id("TC_99") is None
+    # Short rows are padded to the header width
+    assert index.row_values(4) == ["TC_02", None]
+    with pytest.raises(ValueError):
+        index.headers("Missing")
+
+
+def test_sidecar_skips_parsing(cache, monkeypatch):
+    """A fresh process reads the pickled index instead of the workbook"""
+    path = _write_workbook(cache / "data.xlsx", [["TC_01", "Pune"]])
+    load_workbook_index(path)
+    _forget_memory_cache(monkeypatch)
+
+    def no_parse(_path):
+        raise AssertionError("workbook parsed despite a fresh sidecar")
+
+    monkeypatch.setattr(test_data_cache, "_parse_workbook", no_parse)
+    assert load_workbook_index(path).row_values(2) == ["TC_01", "Pune"]
+
+
+def test_stale_sidecar_after_workbook_edit(cache, monkeypatch):
+    """Editing the workbook (new mtime) invalidates the memory and pickle caches"""
+    path = _write_workbook(cache / "data.xlsx", [["TC_01", "Pune"]], mtime=1_600_000_000)
+    assert load_workbook_index(path).row_values(2) == ["TC_01", "Pune"]
+
+    _write_workbook(cache / "data.xlsx", [["TC_01", "Mumbai"]], mtime=1_600_000_100)
+    assert load_workbook_index(path).row_values(2) == ["TC_01", "Mumbai"]
+    _forget_memory_cache(monkeypatch)
+    assert load_workbook_index(path).row_values(2) == ["TC_01", "Mumbai"]
+
+
+def test_sidecar_of_another_version_is_ignored(cache, monkeypatch):
+    path = _write_workbook(cache / "data.xlsx", [["TC_01", "Pune"]])
+    load_workbook_index(path)
+    sidecar = test_data_cache._sidecar_path(path)
+    with open(sidecar, "rb") as f:
+        data = pickle.load(f)
+    data["version"] = test_data_cache.CACHE_VERSION + 1
+    data["sheets"]["Data"]["rows"] = {}
+    with open(sidecar, "wb") as f:
+        pickle.dump(data, f)
+
+    _forget_memory_cache(monkeypatch)
+    assert load_workbook_index(path).row_numbers() == [2]
+
+
+def test_manifest_rows_follow_workbook_edits(cache, monkeypatch):
+    _write_workbook(cache / "data.xlsx", [["TC_01"], ["TC_02"]], mtime=1_600_000_000)
+    assert get_manifest_rows("data.xlsx") == [2, 3]
+    assert get_manifest_rows("data.xlsx", "Data") == [2, 3]
+
+    _write_workbook(cache / "data.xlsx", [["TC_01"], ["TC_02"], ["TC_03"]], mtime=1_600_000_100)
+    _forget_memory_cache(monkeypatch)
+    assert get_manifest_rows("data.xlsx") == [2, 3, 4]
+
+
+def test_missing_workbook(cache):
+    with pytest.raises(FileNotFoundError):
+        load_workbook_index(str(cache / "missing.xlsx"))
@@ -0,0 +1,124 @@
+import itertools
+import json
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils import wait_policy
+from utils.wait_policy import PolicyWait, WaitProfile, condition_key, percentile, poll_schedule, resolve_timeout
+
+KEY = "presence_of_element_located|id=search"
+
+
+@pytest.fixture
+def policy(tmp_path, monkeypatch):
+    """Learning on with known settings and an empty wait profile in tmp_path"""
+    monkeypatch.setattr(wait_policy, "_settings", {
+        "default_timeout": 10.0, "factor": 3.0, "min_timeout": 2.0, "min_samples": 5,
+        "learning": True, "overrides": [],
+    })
+    profile = WaitProfile(str(tmp_path / "wait_profile.json"))
+    monkeypatch.setattr(wait_policy, "_profile", profile)
+    return profile
+
+
+def test_percentile_nearest_rank():
+    assert percentile([5], 99) == 5
+    assert percentile([3, 1, 2, 4], 50) == 2
+    assert percentile(list(range(1, 101)), 99) == 99
+    assert percentile([1, 2], 0) == 1
+
+
+def test_poll_schedule_backs_off_to_maximum():
+    intervals = list(itertools.islice(poll_schedule(first=0.02, maximum=0.1, backoff=2), 5))
+    assert intervals == pytest.approx([0.02, 0.04, 0.08, 0.1, 0.1])
+
+
+def test_condition_key():
+    assert condition_key(EC.presence_of_element_located((By.ID, "search"))) == KEY
+    assert condition_key(lambda driver: True) is None
+
+
+def test_resolve_timeout_needs_min_samples(policy):
+    for _ in range(4):
+        policy.record(KEY, 0.1)
+    assert resolve_timeout(KEY, 10) == (10, False)
+    policy.record(KEY, 0.1)
+    # p99 x factor is below min_timeout, so min_timeout applies
+    assert resolve_timeout(KEY, 10) == (2.0, True)
+
+
+def test_resolve_timeout_is_bounded_by_the_cap(policy):
+    for _ in range(5):
+        policy.record(KEY, 4.0)
+    assert resolve_timeout(KEY, 20) == (12.0, True)
+    assert resolve_timeout(KEY, 8) == (8, False)
+
+
+def test_learned_timeout_after_a_failure(policy):
+    """A learned timeout that expired gets the full cap until the locator succeeds again"""
+    for _ in range(5):
+        policy.record(KEY, 1.0)
+    assert resolve_timeout(KEY, 10) == (3.0, True)
+    policy.record(KEY, None, learned_timeout_failed=True)
+    assert resolve_timeout(KEY, 10) == (10, False)
+    policy.record(KEY, 1.0)
+    assert resolve_timeout(KEY, 10) == (3.0, True)
+
+
+def test_overrides_and_learning_off(policy):
+    wait_policy._settings["overrides"] = [("id=search", 1.5)]
+    assert resolve_timeout(KEY, 10) == (1.5, False)
+    wait_policy._settings.update(overrides=[], learning=False)
+    for _ in range(5):
+        policy.record(KEY, 1.0)
+    assert resolve_timeout(KEY, 10) == (10, False)
+    assert resolve_timeout(None, 10) == (10, False)
+
+
+class _Driver:
+    """find_element fails with NoSuchElementException while `present` is False"""
+
+    present = True
+
+    def find_element(self, by, value):
+        if not self.present:
+            raise NoSuchElementException(value)
+        return "element"
+
+
+def test_policy_wait_records_time_to_condition(policy):
+    assert PolicyWait(_Driver(), 1).until(EC.presence_of_element_located((By.ID, "search"))) == "element"
+    assert len(policy.entry(KEY)["samples"]) == 1
+
+
+def test_policy_wait_expired_learned_timeout(policy):
+    """An expired learned timeout is recorded, and the next wait gets the caller's timeout"""
+    wait_policy._settings["min_timeout"] = 0.05
+    for _ in range(5):
+        policy.record(KEY, 0.01)
+    driver = _Driver()
+    driver.present = False
+    with pytest.raises(TimeoutException):
+        PolicyWait(driver, 10).until(EC.presence_of_element_located((By.ID, "search")))
+    entry = policy.entry(KEY)
+    assert entry["timeouts"] == 1 and entry["learned_timeout_failed"]
+    assert resolve_timeout(KEY, 10) == (10, False)
+
+
+def test_profile_save_merges_with_other_workers(tmp_path):
+    path = str(tmp_path / "wait_profile.json")
+    first, second = WaitProfile(path), WaitProfile(path)
+    first.record(KEY, 1.0)
+    second.record(KEY, 2.0)
+    second.record(KEY, None, learned_timeout_failed=True)
+    first.save()
+    second.save()
+
+    with open(path, encoding="utf-8") as f:
+        entry = json.load(f)[KEY]
+    assert entry["samples"] == [1.0, 2.0]
+    assert entry["timeouts"] == 1
+    assert entry["learned_timeout_failed"] is True
@@ -0,0 +1,200 @@
+"""
+Login-once facility: the authenticated cookies and web storage of a Practo session are
+saved to a state file with an expiry, then injected into new or pooled browser sessions
+before their first navigation instead of repeating the UI login.
+"""
+import hashlib
+import json
+import os
+import time
+
+from pages.login_page import LoginPage
+from utils.logger import get_logger
+
+logger = get_logger("auth_state")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+AUTH_DIR = os.path.join(PROJECT_ROOT, ".cache", "auth")
+
+CAPTURE_STORAGE_SCRIPT = """
+var dump = function (storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) { var k = storage.key(i); items[k] = storage.getItem(k); }
+    return items;
+};
+return {origin: location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+# Runs at document start on every page; only touches storage of the saved origin
+RESTORE_STORAGE_TEMPLATE = """
+(function (state) {
+    if (location.origin !== state.origin) { return; }
+    try {
+        Object.keys(state.local).forEach(function (k) { localStorage.setItem(k, state.local[k]); });
+        Object.keys(state.session).forEach(function (k) { sessionStorage.setItem(k, state.session[k]); });
+    } catch (e) {}
+})(%s);
+"""
+
+
+class AuthStateManager:
+    """Save, restore and refresh the authenticated browser state per account"""
+
+    def __init__(self, base_url, ttl_minutes=720):
+        self.base_url = base_url
+        self.ttl_seconds = float(ttl_minutes) * 60
+        # Init scripts registered per WebDriver session, removed again on cleanup
+        self._init_scripts = {}
+
+    def state_path(self, email):
+        digest = hashlib.sha1(email.lower().encode("utf-8")).hexdigest()[:12]
+        return os.path.join(AUTH_DIR, f"storage_state_{digest}.json")
+
+    def load(self, email):
+        """Saved state for the account, or None when missing or expired"""
+        path = self.state_path(email)
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if state.get("expires_at", 0) <= time.time():
+            logger.info("Saved auth state expired, a fresh login is needed")
+            return None
+        return state
+
+    def save(self, email, state):
+        os.makedirs(AUTH_DIR, exist_ok=True)
+        path = self.state_path(email)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    def capture(self, driver):
+        """Snapshot cookies and web storage of the current (logged in) page"""
+        storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+        now = time.time()
+        cookies = [c for c in self._all_cookies(driver) if c.get("expiry", now + 1) > now]
+        return {
+            "created_at": now,
+            "expires_at": now + self.ttl_seconds,
+            "origin": storage["origin"],
+            "cookies": cookies,
+            "local_storage": storage["local"],
+            "session_storage": storage["session"],
+        }
+
+    @staticmethod
+    def _all_cookies(driver):
+        """Cookies of every domain (accounts + www) via CDP, else just the current domain"""
+        try:
+            cdp_cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        except Exception:
+            return driver.get_cookies()
+
+        cookies = []
+        for c in cdp_cookies:
+            cookie = {k: c[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly") if k in c}
+            if c.get("sameSite"):
+                cookie["sameSite"] = c["sameSite"]
+            if c.get("expires", -1) > 0:
+                cookie["expiry"] = int(c["expires"])
+            cookies.append(cookie)
+        return cookies
+
+    def inject(self, driver, state):
+        """Put the saved state into the browser before the first navigation (Chromium CDP)"""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": [self._to_cdp_cookie(c) for c in state["cookies"]]})
+            storage_state = {"origin": state["origin"], "local": state["local_storage"], "session": state["session_storage"]}
+            result = driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": RESTORE_STORAGE_TEMPLATE % json.dumps(storage_state)}
+            )
+            self._init_scripts.setdefault(driver.session_id, []).append(result["identifier"])
+        except Exception as e:
+            logger.debug(f"CDP injection unavailable ({e}), falling back to in-page injection")
+            self._inject_in_page(driver, state)
+
+    def _inject_in_page(self, driver, state):
+        """Fallback for non-Chromium drivers: cookies can only be set while on the domain"""
+        driver.get(state["origin"])
+        for cookie in state["cookies"]:
+            cookie = {k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")}
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+        driver.execute_script(
+            "var s = arguments[0];"
+            "Object.keys(s.local).forEach(function (k) { localStorage.setItem(k, s.local[k]); });"
+            "Object.keys(s.session).forEach(function (k) { sessionStorage.setItem(k, s.session[k]); });",
+            {"local": state["local_storage"], "session": state["session_storage"]}
+        )
+
+    @staticmethod
+    def _to_cdp_cookie(cookie):
+        cdp_cookie = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain") or "",
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+            cdp_cookie["sameSite"] = cookie["sameSite"]
+        if "expiry" in cookie:
+            cdp_cookie["expires"] = cookie["expiry"]
+        return cdp_cookie
+
+    def remove_injection(self, driver):
+        """Drop storage init scripts so a pooled session is clean for the next test"""
+        for identifier in self._init_scripts.pop(driver.session_id, []):
+            try:
+                driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+            except Exception:
+                pass
+
+    def login_and_save(self, driver, email, password):
+        """Full UI login, then snapshot the resulting state"""
+        login_page = LoginPage(driver)
+        login_page.navigate_to_url(self.base_url)
+        login_page.login_from_home(email, password)
+
+        # Capture from the home page so storage belongs to the site origin
+        login_page.navigate_to_url(self.base_url)
+        login_page.wait_for_settle(replaces=2)
+        state = self.capture(driver)
+        self.save(email, state)
+        logger.info(f"Saved auth state for {email} ({len(state['cookies'])} cookies)")
+        return state
+
+    def ensure_authenticated(self, driver, email, password):
+        """
+        Leave the driver on base_url with a logged in session.
+
+        Uses the saved state when it is still valid; when the site rejects it the
+        state is refreshed through a UI login.
+        """
+        started = time.perf_counter()
+        state = self.load(email)
+        login_page = LoginPage(driver)
+
+        if state is not None:
+            self.inject(driver, state)
+            login_page.navigate_to_url(self.base_url)
+            login_page.wait_for_settle(replaces=2)
+            if login_page.is_logged_in():
+                logger.info(f"Restored auth state for {email} in {time.perf_counter() - started:.2f}s")
+                return True
+            logger.warning("Saved auth state was rejected, logging in again")
+            self.remove_injection(driver)
+
+        self.login_and_save(driver, email, password)
+        logged_in = login_page.is_logged_in()
+        logger.info(f"UI login for {email} took {time.perf_counter() - started:.2f}s (logged in: {logged_in})")
+        return logged_in
@@ -0,0 +1,221 @@
+"""
+WebDriver round-trips per test, step and page-object method.
+
+Every `find_element`, `get_attribute`, `send_keys` or `execute_script` is an HTTP round-trip
+to the driver. With `command_profile=true` (default) the command tracer reports each command
+with its duration, and it is attributed to
+
+- the test and step of the current log context (utils/logger.py),
+- the page-object method that sent it: the innermost method in pages/ outside BasePage, so
+  BasePage helpers count for the page method that called them. Commands sent by the test
+  body, a fixture or a utility are attributed to that function instead.
+
+At the end of the run the chattiest methods are logged as a top-N table, and all counts
+are written to reports/command_trace.json (one file per worker).
+
+Usage (after the pytest run):
+    python -m utils.command_profile                    # top 20 methods of the last run
+    python -m utils.command_profile --by step --top 10
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+
+from utils.command_tracer import set_profiler
+from utils.config_reader import ConfigReader
+from utils.logger import current_log_context, get_logger
+from utils.worker_context import worker_file_name
+
+logger = get_logger("command_profile")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES_DIR = os.path.join(PROJECT_ROOT, "pages") + os.sep
+TESTS_DIR = os.path.join(PROJECT_ROOT, "tests") + os.sep
+BASE_PAGE_FILE = os.path.join(PROJECT_ROOT, "pages", "basepage.py")
+# Frames of the tracing machinery itself are never the caller
+SKIPPED_FILES = {os.path.join(PROJECT_ROOT, "utils", name) for name in ("command_tracer.py", "command_profile.py")}
+TRACE_FILE = "command_trace.json"
+GROUPINGS = ("method", "test", "step", "command")
+
+# Trace files written this long before the newest one belong to an earlier run
+RUN_WINDOW_SECONDS = 600
+
+_profile = {}
+_frame_kinds = {}
+
+
+def _frame_kind(code):
+    """('page'|'base'|'test'|'project'|None, label) for a code object, cached"""
+    kind = _frame_kinds.get(code)
+    if kind is None:
+        path = os.path.abspath(code.co_filename)
+        name = getattr(code, "co_qualname", code.co_name)
+        if code.co_name.startswith("<") or path in SKIPPED_FILES:
+            kind = (None, None)
+        elif path == BASE_PAGE_FILE:
+            kind = ("base", name)
+        elif path.startswith(PAGES_DIR):
+            kind = ("page", name)
+        elif path.startswith(TESTS_DIR):
+            kind = ("test", f"{name} (test body)")
+        elif path.startswith(PROJECT_ROOT + os.sep):
+            module = os.path.splitext(os.path.relpath(path, PROJECT_ROOT))[0].replace(os.sep, ".")
+            kind = ("project", f"{module}.{name}")
+        else:
+            kind = (None, None)
+        _frame_kinds[code] = kind
+    return kind
+
+
+def calling_method(frame):
+    """Label of the page-object method (or test / project function) a command came from"""
+    base = other = None
+    while frame is not None:
+        kind, label = _frame_kind(frame.f_code)
+        if kind == "page":
+            return label
+        if kind == "base":
+            # Keep walking: the outermost BasePage frame stands in only when no page method called it
+            base = label
+        elif kind == "test":
+            return base or label
+        elif kind == "project" and other is None and base is None:
+            other = label
+        frame = frame.f_back
+    return base or other or "(outside project code)"
+
+
+class CommandProfile:
+    """Command counts and time per (test, step, method, command)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {}
+
+    def __call__(self, command, seconds):
+        context = current_log_context()
+        key = (context.get("test") or "(no test)", context.get("step") or "(no step)",
+               calling_method(sys._getframe(1)), command)
+        with self._lock:
+            total = self._totals.get(key)
+            if total is None:
+                self._totals[key] = [1, seconds]
+            else:
+                total[0] += 1
+                total[1] += seconds
+
+    def rows(self):
+        """[test, step, method, command, count, seconds] per combination"""
+        with self._lock:
+            return [[*key, count, round(seconds, 4)] for key, (count, seconds) in self._totals.items()]
+
+
+def group(rows, by="method"):
+    """Totals per method / test / step / command, chattiest first"""
+    index = {"test": 0, "step": 1, "method": 2, "command": 3}[by]
+    groups = {}
+    for row in rows:
+        entry = groups.setdefault(row[index], {"name": row[index], "commands": 0, "seconds": 0.0, "tests": set(), "by_command": {}})
+        entry["commands"] += row[4]
+        entry["seconds"] += row[5]
+        entry["tests"].add(row[0])
+        entry["by_command"][row[3]] = entry["by_command"].get(row[3], 0) + row[4]
+    result = sorted(groups.values(), key=lambda e: (e["commands"], e["seconds"]), reverse=True)
+    for entry in result:
+        entry["seconds"] = round(entry["seconds"], 3)
+        entry["tests"] = len(entry["tests"])
+        entry["by_command"] = dict(sorted(entry["by_command"].items(), key=lambda item: item[1], reverse=True))
+    return result
+
+
+def format_table(rows, by="method", top=20):
+    """Top-N lines: commands, time, tests and the most frequent commands of each group"""
+    groups = group(rows, by)
+    total = sum(row[4] for row in rows) or 1
+    lines = [f"{'#':>3}{'cmds':>7}{'share':>7}{'seconds':>9}{'tests':>6}  {by} (top commands)"]
+    for rank, entry in enumerate(groups[:top], 1):
+        commands = ", ".join(f"{name} {count}" for name, count in list(entry["by_command"].items())[:3])
+        lines.append(f"{rank:>3}{entry['commands']:>7}{entry['commands'] / total:>7.0%}{entry['seconds']:>9.2f}"
+                     f"{entry['tests']:>6}  {entry['name']} ({commands})")
+    return "\n".join(lines)
+
+
+def is_enabled(cfg=None):
+    cfg = cfg or ConfigReader()
+    return (cfg.get_value("command_profile", "true") or "").lower() == "true"
+
+
+def enable_profiling():
+    """Start attributing the commands of every traced driver in this process"""
+    if "profile" not in _profile:
+        _profile["profile"] = CommandProfile()
+        set_profiler(_profile["profile"])
+    return _profile["profile"]
+
+
+def _trace_dir(report_path=None):
+    report_path = report_path or ConfigReader().get_value("report_path") or "reports/"
+    return os.path.join(PROJECT_ROOT, report_path)
+
+
+def write_command_trace(report_path=None, top=None):
+    """Log the top-N table and write reports/command_trace.json (per worker)"""
+    profile = _profile.get("profile")
+    rows = profile.rows() if profile is not None else []
+    if not rows:
+        return None
+    top = top or int(ConfigReader().get_value("command_profile_top", "15"))
+    logger.info(f"WebDriver commands by page-object method:\n{format_table(rows, 'method', top)}")
+
+    path = os.path.join(_trace_dir(report_path), worker_file_name(TRACE_FILE))
+    data = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "commands": sum(row[4] for row in rows),
+        "seconds": round(sum(row[5] for row in rows), 3),
+        "methods": group(rows, "method")[:top],
+        "columns": ["test", "step", "method", "command", "count", "seconds"],
+        "rows": sorted(rows),
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+    except OSError as e:
+        logger.warning(f"Could not write command trace {path}: {e}")
+        return None
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chattiest page-object methods of the last run")
+    parser.add_argument("paths", nargs="*", help="Trace files (default: report_path/command_trace*.json)")
+    parser.add_argument("--by", choices=GROUPINGS, default="method", help="Grouping (default: method)")
+    parser.add_argument("--top", type=int, default=20, help="Rows to show (default: 20)")
+    args = parser.parse_args(argv)
+
+    paths = args.paths
+    if not paths:
+        # Worker files of a parallel run are combined
+        paths = glob.glob(os.path.join(_trace_dir(), "command_trace*.json"))
+        newest = max((os.path.getmtime(p) for p in paths), default=0)
+        paths = sorted(p for p in paths if os.path.getmtime(p) > newest - RUN_WINDOW_SECONDS)
+    rows = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                rows.extend(json.load(f)["rows"])
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Skipping {path}: {e}")
+    if not rows:
+        print("No command trace found - run the tests first")
+        return 2
+    print(format_table(rows, args.by, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
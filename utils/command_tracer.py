@@ -0,0 +1,75 @@
+"""
+WebDriver command tracer.
+
+Every command a session sends (driver calls and WebElement calls alike) goes through
+`driver.execute`; the tracer wraps it once per driver to count and time commands and
+notify listeners, e.g. step timing. A process-wide profiler (utils/command_profile.py)
+additionally sees every command of every traced driver with its duration.
+"""
+import time
+
+from utils.logger import get_logger
+
+logger = get_logger("command_tracer")
+
+_profiler = None
+
+
+def set_profiler(profiler):
+    """profiler(command, seconds) is called after every command of every traced driver; None turns it off"""
+    global _profiler
+    _profiler = profiler
+
+
+class CommandTracer:
+    """Counts the WebDriver commands of one session and notifies listeners"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """listener(command, params) is called after every command"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def record(self, command, params, seconds=0.0):
+        self.count += 1
+        self.seconds += seconds
+        if _profiler is not None:
+            _profiler(command, seconds)
+        for listener in list(self._listeners):
+            try:
+                listener(command, params)
+            except Exception as e:
+                logger.debug(f"Command listener failed: {e}")
+
+
+def attach_tracer(driver):
+    """Install a tracer on the driver (once) and return it"""
+    tracer = getattr(driver, "_command_tracer", None)
+    if tracer is not None:
+        return tracer
+
+    tracer = CommandTracer()
+    execute = driver.execute
+
+    def traced_execute(driver_command, params=None):
+        started = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            tracer.record(driver_command, params, time.perf_counter() - started)
+
+    driver.execute = traced_execute
+    driver._command_tracer = tracer
+    return tracer
+
+
+def get_tracer(driver):
+    """The driver's tracer, or None when it was not attached"""
+    return getattr(driver, "_command_tracer", None)
@@ -0,0 +1,160 @@
+"""
+Single-script DOM lookups by placeholder, label, radio label, visible text or data-qa-id.
+
+Finding "the input whose placeholder mentions city" with WebDriver means one
+`get_attribute` round-trip per <input>. Here a list of rules is evaluated in the page by one
+`execute_script`: the first rule with a match wins, and the element comes back together with
+the rule that found it. Matching is case-insensitive and ignores extra whitespace; visible
+matches are preferred over hidden ones.
+
+    match = query(driver, [("placeholder", ["city", "location"]), ("label", "City")])
+    match.element.send_keys("Pune")
+    match.rule  # 'placeholder'
+
+Rules:
+    placeholder   input/textarea whose placeholder contains any of the keywords
+    label         control of a <label> (or element with aria-label) containing the text
+    radio         radio button whose label (wrapping, `for`, or sibling) contains the text, or whose value is the text
+    text          element with a text node containing the text
+    qa_id         element whose data-qa-id equals the value
+"""
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from utils.locator_probe import execute_async_script
+from utils.logger import get_logger
+
+logger = get_logger("dom_query")
+
+RULES = ("placeholder", "label", "radio", "text", "qa_id")
+
+# arguments: rules [[rule, value]], require_visible, timeout_ms, [callback]
+QUERY_SCRIPT = """
+var rules = arguments[0], requireVisible = arguments[1], timeoutMs = arguments[2];
+var done = arguments.length > 3 ? arguments[arguments.length - 1] : null;
+
+var norm = function (s) { return (s || '').replace(/\\s+/g, ' ').trim().toLowerCase(); };
+var contains = function (s, text) { return norm(s).indexOf(text) !== -1; };
+var all = function (selector) { return Array.prototype.slice.call(document.querySelectorAll(selector)); };
+var isVisible = function (el) {
+    if (!el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+};
+var finders = {
+    placeholder: function (keywords) {
+        keywords = [].concat(keywords).map(norm);
+        return all('input[placeholder], textarea[placeholder]').filter(function (el) {
+            return keywords.some(function (k) { return contains(el.getAttribute('placeholder'), k); });
+        });
+    },
+    label: function (text) {
+        text = norm(text);
+        var found = [];
+        all('label').forEach(function (label) {
+            var control = label.control || label.querySelector('input, select, textarea');
+            if (control && contains(label.textContent, text)) { found.push(control); }
+        });
+        all('[aria-label]').forEach(function (el) {
+            if (contains(el.getAttribute('aria-label'), text)) { found.push(el); }
+        });
+        return found;
+    },
+    radio: function (text) {
+        text = norm(text);
+        return all('input[type=radio]').filter(function (radio) {
+            var labels = radio.labels ? Array.prototype.slice.call(radio.labels) : [];
+            [radio.previousElementSibling, radio.nextElementSibling].forEach(function (el) {
+                if (el && el.tagName === 'LABEL') { labels.push(el); }
+            });
+            return norm(radio.value) === text || labels.some(function (l) { return contains(l.textContent, text); });
+        });
+    },
+    text: function (text) {
+        text = norm(text);
+        var found = [];
+        var root = document.body || document.documentElement;
+        var walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+        for (var node = walker.nextNode(); node; node = walker.nextNode()) {
+            var parent = node.parentElement;
+            if (parent && ['SCRIPT', 'STYLE', 'NOSCRIPT'].indexOf(parent.tagName) === -1 && contains(node.nodeValue, text)) {
+                found.push(parent);
+            }
+        }
+        return found;
+    },
+    qa_id: function (value) {
+        value = norm(value);
+        return all('[data-qa-id]').filter(function (el) { return norm(el.getAttribute('data-qa-id')) === value; });
+    }
+};
+var run = function () {
+    for (var i = 0; i < rules.length; i++) {
+        var matches = finders[rules[i][0]](rules[i][1]);
+        var visible = matches.filter(isVisible);
+        var element = visible[0] || (requireVisible ? null : matches[0]);
+        if (element) {
+            return {element: element, rule: rules[i][0], index: i, count: matches.length};
+        }
+    }
+    return null;
+};
+
+if (!done) { return run(); }
+var deadline = Date.now() + timeoutMs;
+(function poll() {
+    var result = run();
+    if (result || Date.now() >= deadline) { done(result); return; }
+    setTimeout(poll, 50);
+})();
+"""
+
+
+class DomMatch:
+    """An element found by a rule, with the rule that matched"""
+
+    def __init__(self, element, rule, value, count):
+        self.element = element
+        self.rule = rule
+        self.value = value
+        self.count = count
+
+    def __repr__(self):
+        return f"DomMatch(rule={self.rule!r}, value={self.value!r}, count={self.count})"
+
+
+def query(driver, rules, timeout=0, visible=False):
+    """
+    First match of the rules, in order, in one WebDriver command.
+
+    Args:
+        driver: WebDriver instance
+        rules: [(rule, value), ...] with rule from RULES; placeholder takes a keyword list
+        timeout (float): Seconds to keep polling in the page when nothing matches (0: snapshot)
+        visible (bool): Only accept visible elements (by default hidden ones are a fallback)
+
+    Returns:
+        DomMatch or None
+    """
+    rules = [list(rule) for rule in rules]
+    for rule, _ in rules:
+        if rule not in RULES:
+            raise ValueError(f"Unknown DOM query rule {rule!r}; choose from {', '.join(RULES)}")
+
+    if timeout <= 0:
+        result = driver.execute_script(QUERY_SCRIPT, rules, visible, 0)
+    else:
+        try:
+            result = execute_async_script(driver, timeout, QUERY_SCRIPT, rules, visible, int(timeout * 1000))
+        except TimeoutException:
+            logger.debug("DOM query wait exceeded the script timeout, taking a snapshot instead")
+            result = driver.execute_script(QUERY_SCRIPT, rules, visible, 0)
+        except WebDriverException as e:
+            # The page navigated during the wait ("document unloaded while waiting for result")
+            logger.debug("DOM query wait interrupted by navigation (%s), taking a snapshot instead", type(e).__name__)
+            result = driver.execute_script(QUERY_SCRIPT, rules, visible, 0)
+
+    if not result:
+        return None
+    match = DomMatch(result["element"], result["rule"], rules[result["index"]][1], result["count"])
+    logger.debug("DOM query matched by %s %r (%d candidates)", match.rule, match.value, match.count)
+    return match
@@ -0,0 +1,145 @@
+"""
+DOM-settle wait engine - a replacement for fixed time.sleep calls.
+
+A small script is injected into the page that tracks DOM mutations (MutationObserver)
+and in-flight fetch/XHR requests. wait_for_settle() returns as soon as the page has
+had no mutations and no pending requests for the configured quiet window.
+"""
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.config_reader import ConfigReader
+from utils.logger import get_logger
+
+logger = get_logger("dom_settle")
+
+# Installs the tracker once per document and returns the current quiet/in-flight status
+SETTLE_SCRIPT = """
+var w = window;
+if (!w.__practoSettle) {
+    var state = {inflight: 0, last: performance.now()};
+    w.__practoSettle = state;
+    var touch = function () { state.last = performance.now(); };
+    var done = function () { state.inflight = Math.max(0, state.inflight - 1); touch(); };
+
+    new MutationObserver(function (records) {
+        // Inline style churn from animations/carousels is not meaningful page activity
+        for (var i = 0; i < records.length; i++) {
+            if (records[i].type !== 'attributes' || records[i].attributeName !== 'style') { touch(); return; }
+        }
+    }).observe(document.documentElement || document, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+
+    if (w.fetch) {
+        var originalFetch = w.fetch;
+        w.fetch = function () {
+            state.inflight++; touch();
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    if (w.XMLHttpRequest) {
+        var originalSend = w.XMLHttpRequest.prototype.send;
+        w.XMLHttpRequest.prototype.send = function () {
+            state.inflight++; touch();
+            this.addEventListener('loadend', done);
+            return originalSend.apply(this, arguments);
+        };
+    }
+}
+var s = w.__practoSettle;
+return {quiet_ms: performance.now() - s.last, inflight: s.inflight, ready_state: document.readyState};
+"""
+
+POLL_INTERVAL = 0.05
+
+# Totals for the whole run, logged at session end
+SETTLE_STATS = {"calls": 0, "settled": 0, "waited_seconds": 0.0, "saved_seconds": 0.0}
+
+_defaults = {}
+
+
+def _get_defaults():
+    """Read quiet window and max bound from config once"""
+    if not _defaults:
+        cfg = ConfigReader()
+        _defaults["quiet_ms"] = float(cfg.get_value("settle_quiet_ms", "300"))
+        _defaults["timeout"] = float(cfg.get_value("settle_timeout", "10"))
+    return _defaults
+
+
+def is_page_ready(driver, quiet_ms=None):
+    """
+    One-shot readiness check: document complete, no pending fetch/XHR and no DOM
+    mutations for `quiet_ms`. Once true, an element that is still missing is absent for good.
+    """
+    quiet_ms = _get_defaults()["quiet_ms"] if quiet_ms is None else quiet_ms
+    try:
+        status = driver.execute_script(SETTLE_SCRIPT)
+    except WebDriverException:
+        return False
+    return bool(status and status.get("ready_state") == "complete"
+                and status.get("inflight", 0) == 0 and status.get("quiet_ms", 0) >= quiet_ms)
+
+
+def wait_for_settle(driver, quiet_ms=None, timeout=None, replaces=None):
+    """
+    Wait until the DOM and network have been quiet for `quiet_ms`.
+
+    Args:
+        driver: WebDriver instance
+        quiet_ms (float): Required quiet window in milliseconds (default: settle_quiet_ms from config,
+            capped at the replaced sleep)
+        timeout (float): Max seconds to wait (default: the replaced sleep, else settle_timeout)
+        replaces (float): The fixed sleep this call replaces - used to report time saved
+
+    Returns:
+        bool: True if the page settled, False if the max bound was hit
+    """
+    defaults = _get_defaults()
+    if quiet_ms is None:
+        quiet_ms = defaults["quiet_ms"]
+        if replaces is not None:
+            # A sleep shorter than the quiet window could otherwise never count as settled
+            quiet_ms = min(quiet_ms, replaces * 1000)
+    if timeout is None:
+        # Never wait longer than the sleep being replaced
+        timeout = replaces if replaces is not None else defaults["timeout"]
+
+    started = time.perf_counter()
+    deadline = started + timeout
+    settled = False
+
+    while True:
+        try:
+            status = driver.execute_script(SETTLE_SCRIPT)
+        except WebDriverException:
+            # Page is mid-navigation; the tracker is re-installed on the next document
+            status = None
+
+        # The quiet window must also have passed since this call started, otherwise a click
+        # that is about to navigate would be judged against the old (idle) document
+        quiet_since_call = (time.perf_counter() - started) * 1000 >= quiet_ms
+        if (status and quiet_since_call and status.get("ready_state") == "complete"
+                and status.get("inflight", 0) == 0 and status.get("quiet_ms", 0) >= quiet_ms):
+            settled = True
+            break
+        if time.perf_counter() >= deadline:
+            break
+        time.sleep(POLL_INTERVAL)
+
+    elapsed = time.perf_counter() - started
+    SETTLE_STATS["calls"] += 1
+    SETTLE_STATS["settled"] += int(settled)
+    SETTLE_STATS["waited_seconds"] += elapsed
+
+    if replaces is not None:
+        saved = max(0.0, replaces - elapsed)
+        SETTLE_STATS["saved_seconds"] += saved
+        logger.debug("Settle %s after %.2fs (replaced %ss sleep, saved %.2fs)",
+                     "ok" if settled else "timed out", elapsed, replaces, saved)
+    else:
+        logger.debug("Settle %s after %.2fs", "ok" if settled else "timed out", elapsed)
+
+    return settled
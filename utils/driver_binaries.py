@@ -0,0 +1,112 @@
+"""
+Offline-first WebDriver binary resolution.
+
+`ChromeDriverManager().install()` asks the network for the latest driver version on every
+call. Here a resolved driver is remembered in .cache/drivers/manifest.json and reused
+without any network access until `driver_cache_ttl_hours` passes or `driver_version`
+(the pin) changes. Lookup order:
+
+1. `chromedriver_path` / `edgedriver_path` from config
+2. the cached manifest entry (file still present, same pin, not expired)
+3. a driver on PATH, then the legacy resources/ folder
+4. webdriver-manager download (pinned version when set) - recorded in the manifest
+
+When everything fails (offline with an empty cache) None is returned and Selenium
+Manager, built into Selenium, gets the last try.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+
+from utils.logger import get_logger
+
+logger = get_logger("driver_binaries")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+MANIFEST_PATH = os.path.join(PROJECT_ROOT, ".cache", "drivers", "manifest.json")
+
+DRIVER_NAMES = {"chrome": "chromedriver", "edge": "msedgedriver"}
+LEGACY_PATHS = {"edge": os.path.join(PROJECT_ROOT, "resources", "msedgedriver.exe")}
+
+_resolved = {}
+_lock = threading.Lock()
+
+
+def _load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    try:
+        os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+        tmp_path = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, MANIFEST_PATH)
+    except OSError as e:
+        logger.warning(f"Could not save driver manifest: {e}")
+
+
+def _download(browser, version):
+    """Install through webdriver-manager (network); returns the binary path"""
+    if browser == "chrome":
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager(driver_version=version).install()
+    from webdriver_manager.microsoft import EdgeChromiumDriverManager
+    return EdgeChromiumDriverManager(version=version).install()
+
+
+def _cached_entry(browser, pin, ttl_hours):
+    entry = _load_manifest().get(browser)
+    if not entry or not os.path.isfile(entry.get("path", "")):
+        return None
+    if (entry.get("pin") or None) != pin:
+        return None
+    if ttl_hours > 0 and time.time() - entry.get("resolved_at", 0) > ttl_hours * 3600:
+        return None
+    return entry["path"]
+
+
+def resolve_driver_path(browser, cfg):
+    """Driver binary for browser ('chrome'/'edge'), or None to let Selenium Manager decide"""
+    with _lock:
+        if browser in _resolved:
+            return _resolved[browser]
+
+        configured = cfg.get_value(f"{browser}driver_path") or ""
+        pin = cfg.get_value("driver_version") or None
+        ttl_hours = float(cfg.get_value("driver_cache_ttl_hours", "168"))
+
+        path, source = None, None
+        if configured and os.path.isfile(configured):
+            path, source = configured, "config"
+        if path is None:
+            path = _cached_entry(browser, pin, ttl_hours)
+            source = "cache" if path else None
+        if path is None and pin is None:
+            # A driver on PATH has an unknown version, so it only stands in when nothing is pinned
+            path = shutil.which(DRIVER_NAMES[browser]) or None
+            if path is None and os.path.isfile(LEGACY_PATHS.get(browser, "")):
+                path = LEGACY_PATHS[browser]
+            source = "local" if path else None
+        if path is None:
+            try:
+                path, source = _download(browser, pin), "download"
+            except Exception as e:
+                logger.warning(f"Driver download for {browser} failed ({e}); falling back to Selenium Manager")
+
+        if source in ("local", "download"):
+            manifest = _load_manifest()
+            manifest[browser] = {"path": path, "pin": pin, "resolved_at": time.time()}
+            _save_manifest(manifest)
+        if path:
+            logger.info(f"{DRIVER_NAMES[browser]} from {source}: {path}")
+
+        _resolved[browser] = path
+        return path
@@ -0,0 +1,69 @@
+from selenium import webdriver
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.edge.options import Options as EdgeOptions
+
+from utils.command_tracer import attach_tracer
+from utils.config_reader import ConfigReader
+from utils.driver_binaries import resolve_driver_path
+from utils.lean_profile import LeanProfile
+from utils.logger import get_logger
+from utils import standin_server
+
+logger = get_logger("driver_factory")
+
+
+def _apply_common_arguments(options):
+    """Add the launch arguments shared by Edge and Chrome"""
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-infobars")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--log-level=3")
+
+
+def _apply_standin_arguments(options, cfg):
+    """Resolve practo.com hosts to the local stand-in server"""
+    for argument in standin_server.browser_arguments(cfg):
+        options.add_argument(argument)
+
+
+def create_driver(cfg=None, profile=None, use_standin=None):
+    """Launch a new browser session for the browser selected in config"""
+    cfg = cfg or ConfigReader()
+    profile = profile or LeanProfile.from_config(cfg)
+    browser = (cfg.get_value("browser") or "").lower()
+    if use_standin is None:
+        use_standin = standin_server.is_enabled(cfg)
+    logger.info(f"Launching browser: {browser}{' (Practo stand-in)' if use_standin else ''}")
+
+    if browser == "edge":
+        options = EdgeOptions()
+        _apply_common_arguments(options)
+        profile.apply_options(options, "ms:loggingPrefs")
+        if use_standin:
+            _apply_standin_arguments(options, cfg)
+        driver = webdriver.Edge(
+            service=EdgeService(resolve_driver_path("edge", cfg)),
+            options=options
+        )
+
+    elif browser == "chrome":
+        options = ChromeOptions()
+        _apply_common_arguments(options)
+        profile.apply_options(options, "goog:loggingPrefs")
+        if use_standin:
+            _apply_standin_arguments(options, cfg)
+        driver = webdriver.Chrome(
+            service=ChromeService(resolve_driver_path("chrome", cfg)),
+            options=options
+        )
+
+    else:
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    profile.apply_to_driver(driver)
+    # Explicit waits (utils/wait_policy.py) do the waiting; 0 keeps find_elements probes instant
+    driver.implicitly_wait(float(cfg.get_value("implicit_wait", "0")))
+    attach_tracer(driver)
+    return driver
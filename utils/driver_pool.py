@@ -0,0 +1,201 @@
+import threading
+import time
+
+from utils.logger import get_logger
+
+logger = get_logger("driver_pool")
+
+# Clears web storage for whichever origin the current window is on
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class PooledSession:
+    """A long-lived browser session borrowed from the DriverPool"""
+
+    def __init__(self, driver, session_number, launch_seconds):
+        self.driver = driver
+        self.session_number = session_number
+        self.launch_seconds = launch_seconds
+        self.uses = 0
+        self.reused = False
+        self.prewarmed = False
+        # Time the borrowing test actually waited for this session
+        self.acquire_seconds = 0.0
+
+
+class DriverPool:
+    """
+    Pool of long-lived WebDriver sessions that tests borrow and return.
+
+    Sessions are reset between tests (cookies, web storage, extra windows)
+    and recycled after `max_uses` borrows or when a health check fails.
+    With `prewarm`, the replacement for a session on its last use is launched
+    in the background while the current test runs.
+    """
+
+    def __init__(self, factory, max_uses=25, prewarm=False):
+        self.factory = factory
+        self.max_uses = max(1, int(max_uses))
+        self.prewarm_enabled = prewarm
+        self._idle = []
+        self._lock = threading.Lock()
+        self._warming = None
+        self._session_counter = 0
+        self.launches = 0
+        self.reuses = 0
+        self.prewarmed = 0
+        self.total_launch_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def average_launch_seconds(self):
+        """Average wall time of a browser launch so far"""
+        if not self.launches:
+            return 0.0
+        return self.total_launch_seconds / self.launches
+
+    def _launch(self):
+        """Start a new browser session and time the launch"""
+        started = time.perf_counter()
+        driver = self.factory()
+        launch_seconds = time.perf_counter() - started
+
+        with self._lock:
+            self._session_counter += 1
+            session_number = self._session_counter
+            self.launches += 1
+            self.total_launch_seconds += launch_seconds
+
+        logger.info(f"Launched browser session #{session_number} in {launch_seconds:.2f}s")
+        return PooledSession(driver, session_number, launch_seconds)
+
+    def prewarm(self):
+        """Launch a spare session in the background unless one is idle or already on its way"""
+        with self._lock:
+            if self._idle or self._warming is not None:
+                return
+            self._warming = threading.Thread(target=self._warm, name="browser-prewarm", daemon=True)
+            self._warming.start()
+
+    def _warm(self):
+        try:
+            session = self._launch()
+            session.prewarmed = True
+            with self._lock:
+                self._idle.append(session)
+        except Exception as e:
+            logger.warning(f"Background browser launch failed: {e}")
+        finally:
+            with self._lock:
+                self._warming = None
+
+    def acquire(self):
+        """Borrow a session - reuses an idle one when available"""
+        started = time.perf_counter()
+        with self._lock:
+            session = self._idle.pop() if self._idle else None
+            warming = self._warming
+
+        if session is None and warming is not None:
+            # A session is already launching - waiting for it beats starting a second one
+            warming.join()
+            with self._lock:
+                session = self._idle.pop() if self._idle else None
+
+        if session is None:
+            session = self._launch()
+            session.reused = False
+        elif session.uses == 0:
+            # Fresh pre-warmed session: its launch ran while the previous test was busy
+            session.reused = False
+            with self._lock:
+                self.prewarmed += 1
+                self.saved_seconds += max(0.0, session.launch_seconds - (time.perf_counter() - started))
+        else:
+            session.reused = True
+            with self._lock:
+                self.reuses += 1
+                self.saved_seconds += self.average_launch_seconds()
+
+        session.uses += 1
+        session.acquire_seconds = time.perf_counter() - started
+        if self.prewarm_enabled and session.uses >= self.max_uses:
+            # This session is recycled on release - have its successor ready by then
+            self.prewarm()
+        return session
+
+    def release(self, session):
+        """Return a session to the pool, resetting or recycling it"""
+        if session.uses >= self.max_uses:
+            logger.info(f"Recycling session #{session.session_number} after {session.uses} uses")
+            self._quit(session)
+            return
+
+        if not self.reset_session(session.driver) or not self.is_healthy(session.driver):
+            logger.warning(f"Recycling unhealthy session #{session.session_number}")
+            self._quit(session)
+            if self.prewarm_enabled:
+                self.prewarm()
+            return
+
+        with self._lock:
+            self._idle.append(session)
+
+    def reset_session(self, driver):
+        """Clear cookies, storage and extra windows, then park on about:blank"""
+        try:
+            handles = driver.window_handles
+            main_handle = handles[0]
+
+            # Storage can only be cleared for the origin a window is on, so visit each one
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                driver.execute_script(CLEAR_STORAGE_SCRIPT)
+                if handle != main_handle:
+                    driver.close()
+
+            driver.switch_to.window(main_handle)
+            driver.delete_all_cookies()
+            try:
+                # Chromium only - drops cookies for every domain, not just the current one
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                pass
+
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"Session reset failed: {e}")
+            return False
+
+    @staticmethod
+    def is_healthy(driver):
+        """Cheap liveness check - one script round-trip"""
+        try:
+            return driver.execute_script("return document.readyState") is not None
+        except Exception:
+            return False
+
+    def _quit(self, session):
+        try:
+            session.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting session #{session.session_number}: {e}")
+
+    def close_all(self):
+        """Quit every idle session and log the launch time saved"""
+        warming = self._warming
+        if warming is not None:
+            warming.join(timeout=60)
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for session in idle:
+            self._quit(session)
+
+        logger.info(
+            f"Driver pool closed: {self.launches} launches, {self.reuses} reuses, {self.prewarmed} pre-warmed, "
+            f"~{self.saved_seconds:.1f}s of browser launch time saved"
+        )
@@ -0,0 +1,214 @@
+"""
+Duration regression gate: compare this run's test and step durations with their history.
+
+The baseline of each test (data row) and step is the median of its previous runs, with the
+median absolute deviation (MAD) as a robust spread. A duration is a regression when it is
+above the baseline by more than `ratio`, by more than `mad_k` robust sigmas and by at least
+`min_delta` seconds. Sources:
+
+    reports/summary/summary.json              this run (written by utils/report_builder.py)
+    reports/timelines/*.json                  this run's step timings (utils/step_timer.py)
+    reports/summary/history.json              earlier test and step durations
+    allure-results/history/history.json       earlier durations from generated Allure reports
+
+Usage (after the pytest run):
+    python -m utils.duration_gate                     # ranked table, exit 1 on regressions
+    python -m utils.duration_gate --ratio 0.3 --max-regressions 2
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+
+from utils.config_reader import ConfigReader
+from utils.logger import get_logger
+from utils.report_builder import ReportBuilder
+
+logger = get_logger("duration_gate")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+ALLURE_HISTORY = os.path.join(PROJECT_ROOT, "allure-results", "history", "history.json")
+
+# MAD scaled to a standard deviation for normally distributed durations
+MAD_TO_SIGMA = 1.4826
+
+
+class Regression:
+    """One test or step that got slower than its baseline"""
+
+    def __init__(self, kind, name, current, baseline, mad, runs):
+        self.kind = kind
+        self.name = name
+        self.current = current
+        self.baseline = baseline
+        self.mad = mad
+        self.runs = runs
+
+    @property
+    def delta(self):
+        return self.current - self.baseline
+
+    @property
+    def ratio(self):
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def to_dict(self):
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "current_seconds": round(self.current, 3),
+            "baseline_seconds": round(self.baseline, 3),
+            "mad_seconds": round(self.mad, 3),
+            "delta_seconds": round(self.delta, 3),
+            "ratio": round(self.ratio, 2),
+            "history_runs": self.runs,
+        }
+
+
+class GateSettings:
+    """Thresholds; config.properties values, overridden from the command line"""
+
+    def __init__(self, ratio=0.2, mad_k=3.0, min_delta=1.0, min_history=3, window=10, max_regressions=0):
+        self.ratio = ratio
+        self.mad_k = mad_k
+        self.min_delta = min_delta
+        self.min_history = min_history
+        self.window = window
+        self.max_regressions = max_regressions
+
+    @classmethod
+    def from_config(cls, cfg):
+        return cls(
+            ratio=float(cfg.get_value("duration_gate_ratio", "0.2")),
+            mad_k=float(cfg.get_value("duration_gate_mad_k", "3")),
+            min_delta=float(cfg.get_value("duration_gate_min_delta_seconds", "1")),
+            min_history=int(cfg.get_value("duration_gate_min_history", "3")),
+            window=int(cfg.get_value("duration_gate_window", "10")),
+            max_regressions=int(cfg.get_value("duration_gate_max_regressions", "0")),
+        )
+
+
+def check(kind, name, current, history, settings):
+    """Regression for one duration (seconds) against earlier samples, or None"""
+    samples = history[-settings.window:]
+    if len(samples) < settings.min_history:
+        return None
+    baseline = statistics.median(samples)
+    mad = statistics.median(abs(s - baseline) for s in samples)
+    excess = current - baseline
+    if (current > baseline * (1 + settings.ratio)
+            and excess > settings.mad_k * MAD_TO_SIGMA * mad
+            and excess >= settings.min_delta):
+        return Regression(kind, name, current, baseline, mad, len(samples))
+    return None
+
+
+def _load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _allure_durations(path):
+    """history_id -> [[start_ms, duration_ms], ...] from a generated Allure report's history"""
+    data = _load_json(path) or {}
+    durations = {}
+    for history_id, entry in data.items():
+        runs = [[item["time"]["start"], item["time"]["duration"]]
+                for item in entry.get("items", []) if item.get("time", {}).get("duration") is not None]
+        durations[history_id] = sorted(runs)
+    return durations
+
+
+def _earlier(runs, current_start):
+    """Samples before the current run, oldest first, one per start time"""
+    by_start = {start: value for start, value in runs if start < current_start}
+    return [by_start[start] for start in sorted(by_start)]
+
+
+def analyze(results_dir, settings, allure_history=ALLURE_HISTORY):
+    """All regressions of the last summarised run, slowest excess first"""
+    summary_dir = os.path.join(results_dir, "summary")
+    summary = _load_json(os.path.join(summary_dir, "summary.json"))
+    if not summary or not summary.get("results"):
+        raise FileNotFoundError(f"No run summary in {summary_dir} - run the tests first")
+    history = _load_json(os.path.join(summary_dir, "history.json")) or {}
+    allure_runs = _allure_durations(allure_history)
+
+    regressions = []
+    run_start = min(t["start"] for t in summary["results"])
+    for test in summary["results"]:
+        if test["status"] != "passed":
+            # Failed runs stop early or wait out timeouts - neither is a fair comparison
+            continue
+        runs = history.get("durations", {}).get(test["history_id"], {}).get("runs", [])
+        earlier = _earlier(runs + allure_runs.get(test["history_id"], []), test["start"])
+        found = check("test", test["name"], test["duration_ms"] / 1000,
+                      [ms / 1000 for ms in earlier], settings)
+        if found:
+            regressions.append(found)
+
+    passed = {t["name"] for t in summary["results"] if t["status"] == "passed"}
+    timelines = ReportBuilder(results_dir).read_timelines(since_ms=run_start)
+    for test_name, timeline in timelines.items():
+        if test_name not in passed:
+            continue
+        step_history = history.get("steps", {}).get(test_name, {})
+        for step_name, seconds in timeline["steps"].items():
+            earlier = _earlier(step_history.get(step_name, []), timeline["start_ms"])
+            found = check("step", f"{test_name} > {step_name}", seconds, earlier, settings)
+            if found:
+                regressions.append(found)
+
+    regressions.sort(key=lambda r: r.delta, reverse=True)
+    return regressions
+
+
+def print_table(regressions):
+    print(f"{'#':>3}  {'kind':<5}{'current':>9}{'median':>9}{'MAD':>7}{'delta':>9}{'ratio':>7}{'runs':>6}  name")
+    for rank, r in enumerate(regressions, 1):
+        print(f"{rank:>3}  {r.kind:<5}{r.current:>8.1f}s{r.baseline:>8.1f}s{r.mad:>6.1f}s{r.delta:>+8.1f}s"
+              f"{r.ratio:>6.2f}x{r.runs:>6}  {r.name}")
+
+
+def main(argv=None):
+    cfg = ConfigReader()
+    defaults = GateSettings.from_config(cfg)
+    parser = argparse.ArgumentParser(description="Fail when tests or steps got slower than their history")
+    parser.add_argument("results_dir", nargs="?", default=os.path.join(PROJECT_ROOT, cfg.get_value("report_path") or "reports/"),
+                        help="Allure results directory with summary/ (default: report_path)")
+    parser.add_argument("--ratio", type=float, default=defaults.ratio, help=f"Min slowdown ratio (default: {defaults.ratio})")
+    parser.add_argument("--mad-k", type=float, default=defaults.mad_k, help=f"Min robust sigmas above the median (default: {defaults.mad_k})")
+    parser.add_argument("--min-delta", type=float, default=defaults.min_delta, help=f"Min slowdown in seconds (default: {defaults.min_delta})")
+    parser.add_argument("--min-history", type=int, default=defaults.min_history, help=f"Earlier runs needed (default: {defaults.min_history})")
+    parser.add_argument("--window", type=int, default=defaults.window, help=f"Earlier runs in the baseline (default: {defaults.window})")
+    parser.add_argument("--max-regressions", type=int, default=defaults.max_regressions,
+                        help=f"Regressions tolerated before failing (default: {defaults.max_regressions})")
+    parser.add_argument("--allure-history", default=ALLURE_HISTORY, help="Allure report history.json to include")
+    args = parser.parse_args(argv)
+
+    settings = GateSettings(args.ratio, args.mad_k, args.min_delta, args.min_history, args.window, args.max_regressions)
+    try:
+        regressions = analyze(args.results_dir, settings, args.allure_history)
+    except FileNotFoundError as e:
+        print(e)
+        return 2
+
+    out_path = os.path.join(args.results_dir, "summary", "duration_regressions.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump([r.to_dict() for r in regressions], f, indent=2)
+
+    if not regressions:
+        print("No duration regressions")
+        return 0
+    print_table(regressions)
+    failed = len(regressions) > settings.max_regressions
+    logger.info(f"Duration gate: {len(regressions)} regressions (allowed {settings.max_regressions}) - {'FAIL' if failed else 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
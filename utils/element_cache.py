@@ -0,0 +1,130 @@
+"""
+Per-page cache of resolved WebElements.
+
+Page objects look the same fields up again and again (type into the city box, read it,
+clear it...). Each page instance keeps the elements it resolved, tagged with the driver's
+navigation epoch: any get/back/forward/refresh or window/frame switch bumps the epoch and
+drops the cache. Cached elements are `StaleSafeElement`s, which re-resolve themselves and
+retry once when the DOM replaced them without a navigation (re-rendered lists, SPA views).
+
+    class HomePage(BasePage):
+        location_input = CachedElement(finder=lambda page: page._find_input_by_placeholder(["city"]))
+"""
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from utils.command_tracer import attach_tracer
+
+# Run-level totals; every hit is a find command (and its wait) that was not sent
+CACHE_STATS = {"hits": 0, "misses": 0, "stale_refreshes": 0, "invalidations": 0}
+
+NAVIGATION_COMMANDS = {
+    Command.GET,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.REFRESH,
+    Command.NEW_WINDOW,
+    Command.CLOSE,
+    Command.SWITCH_TO_WINDOW,
+    Command.SWITCH_TO_FRAME,
+    Command.SWITCH_TO_PARENT_FRAME,
+}
+
+
+class _NavigationEpoch:
+    """Counts navigations of one driver via its command tracer"""
+
+    def __init__(self):
+        self.value = 0
+
+    def __call__(self, command, params):
+        if command in NAVIGATION_COMMANDS:
+            self.value += 1
+
+
+def navigation_epoch(driver):
+    """The driver's epoch counter (installed once per driver)"""
+    epoch = getattr(driver, "_navigation_epoch", None)
+    if epoch is None:
+        epoch = _NavigationEpoch()
+        attach_tracer(driver).add_listener(epoch)
+        driver._navigation_epoch = epoch
+    return epoch
+
+
+class StaleSafeElement(WebElement):
+    """WebElement that re-resolves itself once when the page replaced it"""
+
+    def __init__(self, element, resolve):
+        super().__init__(element.parent, element.id)
+        self._resolve = resolve
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            CACHE_STATS["stale_refreshes"] += 1
+            self._id = self._resolve().id
+            return super()._execute(command, params)
+
+
+class ElementCache:
+    """Resolved elements of one page instance, valid until the next navigation"""
+
+    def __init__(self, driver):
+        self._epoch = navigation_epoch(driver)
+        self._seen_epoch = self._epoch.value
+        self._elements = {}
+
+    def _sync_epoch(self):
+        if self._epoch.value != self._seen_epoch:
+            if self._elements:
+                CACHE_STATS["invalidations"] += 1
+            self._elements.clear()
+            self._seen_epoch = self._epoch.value
+
+    def __contains__(self, key):
+        self._sync_epoch()
+        return key in self._elements
+
+    def get(self, key, resolve):
+        """Cached element for key, or resolve() it (a find / wait) and cache it"""
+        self._sync_epoch()
+        element = self._elements.get(key)
+        if element is not None:
+            CACHE_STATS["hits"] += 1
+            return element
+
+        CACHE_STATS["misses"] += 1
+        element = StaleSafeElement(resolve(), resolve)
+        self._elements[key] = element
+        return element
+
+    def invalidate(self, key=None):
+        """Drop one element (or all), e.g. after it stopped being interactable"""
+        if key is None:
+            self._elements.clear()
+        else:
+            self._elements.pop(key, None)
+
+
+class CachedElement:
+    """Page attribute that resolves to a cached, stale-safe element"""
+
+    def __init__(self, locator=None, finder=None):
+        if (locator is None) == (finder is None):
+            raise ValueError("CachedElement needs either a locator or a finder")
+        self.locator = locator
+        self.finder = finder
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        if self.finder is not None:
+            return page.element_cache.get(self.name, lambda: self.finder(page))
+        return page.find_cached(self.locator)
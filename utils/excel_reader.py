@@ -1,6 +1,8 @@
 import openpyxl
 import os
 
+from utils.test_data_cache import load_workbook_index
+
 
 class ExcelReader:
     """Read test data from Excel files"""
@@ -31,16 +33,14 @@ class ExcelReader:
                   Returns None if test case ID not found
         """
         try:
-            reader = ExcelReader(file_path)
-            sheet = reader.get_sheet(sheet_name)
-
-            # Get headers from first row
-            headers = [cell.value for cell in sheet[1]]
+            # Served from the parse-once index instead of reopening the workbook
+            index = load_workbook_index(file_path)
+            headers = index.headers(sheet_name)
 
             # Find row matching TestCaseID
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                if row and row[0] == test_case_id:
-                    return {header: value for header, value in zip(headers, row)}
+            row_number = index.row_by_id(test_case_id, sheet_name)
+            if row_number is not None:
+                return {header: value for header, value in zip(headers, index.row_values(row_number, sheet_name))}
 
             return None
         except Exception as e:
@@ -0,0 +1,159 @@
+"""
+Lean browser launch profile: headless, fixed small viewport, images off and third-party
+tracker/media URLs blocked through DevTools `Network.setBlockedURLs`.
+
+NetworkSavings reads the browser performance log to report, per test, how many requests
+and bytes were loaded and how many requests (and roughly how many bytes) were avoided.
+"""
+import fnmatch
+import json
+import os
+
+from utils.logger import get_logger
+
+logger = get_logger("lean_profile")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+# Average size of resources matching each blocked pattern, learned from non-lean runs
+SIZE_TABLE_PATH = os.path.join(PROJECT_ROOT, ".cache", "blocked_resource_sizes.json")
+
+
+def _is_true(value):
+    return str(value).strip().lower() in ("true", "1", "yes")
+
+
+class LeanProfile:
+    """Launch options read from config.properties"""
+
+    def __init__(self, enabled=False, headless=False, window_size=None, disable_images=False, url_patterns=None,
+                 network_log=False):
+        self.enabled = enabled
+        self.headless = headless
+        self.window_size = window_size
+        self.disable_images = disable_images
+        # The configured blocklist - only enforced when the lean profile is enabled
+        self.url_patterns = url_patterns or []
+        # Browser performance log for NetworkSavings; buffering every CDP network event has a cost
+        self.network_log = network_log
+
+    @property
+    def blocked_patterns(self):
+        return self.url_patterns if self.enabled else []
+
+    @classmethod
+    def from_config(cls, cfg):
+        enabled = _is_true(cfg.get_value("lean_profile", "false"))
+        patterns = [p.strip() for p in (cfg.get_value("blocked_url_patterns") or "").split(",") if p.strip()]
+        return cls(
+            enabled=enabled,
+            # headless is honoured on its own; the rest only applies to the lean profile
+            headless=_is_true(cfg.get_value("headless", "false")),
+            window_size=(cfg.get_value("window_size") or "1366,768") if enabled else None,
+            disable_images=enabled and _is_true(cfg.get_value("disable_images", "true")),
+            url_patterns=patterns,
+            network_log=enabled or _is_true(cfg.get_value("network_savings", "false")),
+        )
+
+    def apply_options(self, options, logging_capability):
+        """Add launch arguments/prefs to Edge or Chrome options"""
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.window_size:
+            options.add_argument(f"--window-size={self.window_size}")
+        else:
+            options.add_argument("--start-maximized")
+        if self.disable_images:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        if self.network_log:
+            # Performance log feeds NetworkSavings (vendor prefixed: goog: for Chrome, ms: for Edge)
+            options.set_capability(logging_capability, {"performance": "ALL"})
+
+    def apply_to_driver(self, driver):
+        """Install the URL blocklist on a freshly launched session"""
+        if not self.blocked_patterns:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_patterns})
+            logger.info(f"Blocking {len(self.blocked_patterns)} URL patterns")
+        except Exception as e:
+            logger.warning(f"Could not install URL blocklist: {e}")
+
+
+class NetworkSavings:
+    """Per-test request/byte accounting from the browser performance log"""
+
+    def __init__(self, url_patterns, enabled=True):
+        self.url_patterns = url_patterns
+        # Off when the sessions are launched without the performance log
+        self.enabled = enabled
+        self._sizes = self._load_sizes()
+
+    @staticmethod
+    def _load_sizes():
+        try:
+            with open(SIZE_TABLE_PATH, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_sizes(self):
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(os.path.dirname(SIZE_TABLE_PATH), exist_ok=True)
+            with open(SIZE_TABLE_PATH, "w", encoding="utf-8") as f:
+                json.dump(self._sizes, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not save blocked resource sizes: {e}")
+
+    def _matching_pattern(self, url):
+        for pattern in self.url_patterns:
+            if fnmatch.fnmatchcase(url, pattern):
+                return pattern
+        return None
+
+    @staticmethod
+    def _read_log(driver):
+        try:
+            return driver.get_log("performance")
+        except Exception:
+            return []
+
+    def reset(self, driver):
+        """Drain log entries left over from earlier tests on a pooled session"""
+        if self.enabled:
+            self._read_log(driver)
+
+    def collect(self, driver):
+        """Summarise network activity since the last reset/collect (None when disabled)"""
+        if not self.enabled:
+            return None
+        urls = {}
+        stats = {"requests": 0, "bytes": 0, "blocked_requests": 0, "blocked_bytes_estimate": 0}
+
+        for entry in self._read_log(driver):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+
+            if method == "Network.requestWillBeSent":
+                urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+                stats["requests"] += 1
+            elif method == "Network.loadingFinished":
+                size = int(params.get("encodedDataLength", 0))
+                stats["bytes"] += size
+                # Learn sizes of blocklist matches whenever they do load (lean profile off)
+                pattern = self._matching_pattern(urls.get(params.get("requestId"), ""))
+                if pattern:
+                    count, average = self._sizes.get(pattern, (0, 0))
+                    self._sizes[pattern] = (count + 1, average + (size - average) / (count + 1))
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                stats["blocked_requests"] += 1
+                pattern = self._matching_pattern(urls.get(params.get("requestId"), ""))
+                if pattern in self._sizes:
+                    stats["blocked_bytes_estimate"] += int(self._sizes[pattern][1])
+
+        return stats
@@ -0,0 +1,155 @@
+"""
+Batched locator probe: evaluate many XPath/CSS locators in one WebDriver round-trip.
+
+The whole set is resolved in the page with document.evaluate / querySelectorAll and
+returns presence, visibility, match count and text per locator. With `wait_for`, the
+polling also happens in the page (one async script), so even a waiting probe is a
+single command.
+"""
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from utils.logger import get_logger
+
+logger = get_logger("locator_probe")
+
+# WebDriver's default script timeout is 30s; longer in-page waits raise it first
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+# arguments: queries [[name, kind, value]], wait_for (null/'all'/'any'), timeout_ms, visible, [callback]
+PROBE_SCRIPT = """
+var queries = arguments[0], waitFor = arguments[1], timeoutMs = arguments[2], needVisible = arguments[3];
+var done = arguments.length > 4 ? arguments[arguments.length - 1] : null;
+
+var isVisible = function (el) {
+    if (!el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+};
+var find = function (kind, value) {
+    try {
+        if (kind === 'xpath') {
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+        }
+        return Array.prototype.slice.call(document.querySelectorAll(value));
+    } catch (e) {
+        return [];
+    }
+};
+var evaluate = function () {
+    var results = {};
+    queries.forEach(function (q) {
+        var nodes = find(q[1], q[2]);
+        var first = nodes[0];
+        results[q[0]] = {
+            present: nodes.length > 0,
+            visible: nodes.some(isVisible),
+            count: nodes.length,
+            text: first ? (first.innerText || first.textContent || '').trim() : null
+        };
+    });
+    return results;
+};
+var satisfied = function (results) {
+    var flags = queries.map(function (q) { return needVisible ? results[q[0]].visible : results[q[0]].present; });
+    return waitFor === 'any' ? flags.indexOf(true) !== -1 : flags.indexOf(false) === -1;
+};
+
+if (!done) { return evaluate(); }
+var deadline = Date.now() + timeoutMs;
+(function poll() {
+    var results = evaluate();
+    if (satisfied(results) || Date.now() >= deadline) { done(results); return; }
+    setTimeout(poll, 50);
+})();
+"""
+
+# Locator strategies that are not XPath/CSS are translated before probing
+_CSS_TEMPLATES = {
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
+
+
+def _quote_xpath(text):
+    if "'" not in text:
+        return f"'{text}'"
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def to_query(name, locator):
+    """[name, 'xpath'|'css', selector] for a (By, value) locator"""
+    by, value = locator
+    if by == By.XPATH:
+        return [name, "xpath", value]
+    if by == By.CSS_SELECTOR:
+        return [name, "css", value]
+    if by in _CSS_TEMPLATES:
+        return [name, "css", _CSS_TEMPLATES[by].format(value.replace('"', '\\"'))]
+    if by == By.LINK_TEXT:
+        return [name, "xpath", f"//a[normalize-space(.)={_quote_xpath(value)}]"]
+    if by == By.PARTIAL_LINK_TEXT:
+        return [name, "xpath", f"//a[contains(., {_quote_xpath(value)})]"]
+    raise ValueError(f"Unsupported locator strategy for probe: {by}")
+
+
+def execute_async_script(driver, timeout, script, *args):
+    """
+    Run an async script that may wait up to `timeout` seconds in the page.
+
+    Long waits raise the session's script timeout first and put the previous value back
+    afterwards, so pooled sessions keep their own setting.
+    """
+    if timeout + 1 <= DEFAULT_SCRIPT_TIMEOUT:
+        return driver.execute_async_script(script, *args)
+    previous = driver.timeouts.script
+    driver.set_script_timeout(timeout + 5)
+    try:
+        return driver.execute_async_script(script, *args)
+    finally:
+        driver.set_script_timeout(previous)
+
+
+def probe(driver, locators, wait_for=None, timeout=10, visible=False):
+    """
+    Probe a set of locators in one command.
+
+    Args:
+        driver: WebDriver instance
+        locators: {name: (By, value)} or a list of (By, value) (results keyed by index)
+        wait_for (str): None for a snapshot, "all" or "any" to wait in-page until satisfied
+        timeout (float): Seconds for the shared wait
+        visible (bool): Wait for visibility instead of presence
+
+    Returns:
+        dict: name -> {"present", "visible", "count", "text"}
+    """
+    if not isinstance(locators, dict):
+        locators = dict(enumerate(locators))
+    names = {str(name): name for name in locators}
+    queries = [to_query(str(name), locator) for name, locator in locators.items()]
+
+    if wait_for is None:
+        results = driver.execute_script(PROBE_SCRIPT, queries, None, 0, visible)
+    else:
+        if wait_for not in ("all", "any"):
+            raise ValueError(f"wait_for must be 'all' or 'any', got {wait_for!r}")
+        try:
+            results = execute_async_script(driver, timeout, PROBE_SCRIPT, queries, wait_for, int(timeout * 1000), visible)
+        except TimeoutException:
+            # Script timeout shorter than the requested wait: fall back to a snapshot
+            logger.debug("Probe wait exceeded the script timeout, taking a snapshot instead")
+            results = driver.execute_script(PROBE_SCRIPT, queries, None, 0, visible)
+        except WebDriverException as e:
+            # The page navigated during the wait ("document unloaded while waiting for result"):
+            # like the timeout, answer with a snapshot of the new document
+            logger.debug("Probe wait interrupted by navigation (%s), taking a snapshot instead", type(e).__name__)
+            results = driver.execute_script(PROBE_SCRIPT, queries, None, 0, visible)
+
+    return {names[key]: value for key, value in (results or {}).items()}
@@ -0,0 +1,207 @@
+"""
+Adaptive ranking for union XPath locators.
+
+Locators like `//button[contains(text(), 'Search')] | //button[@type='submit'] | ...` are
+split into their alternatives. The registry records which alternative actually matched and
+how fast, persists those stats to .cache/locators/ across runs, and tries the alternative
+that has been winning first with a short timeout. A stale primary costs a few find_elements
+calls instead of a full wait followed by a fallback.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from utils.config_reader import ConfigReader
+from utils.logger import get_logger
+
+logger = get_logger("locator_registry")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+STATS_PATH = os.path.join(PROJECT_ROOT, ".cache", "locators", "locator_stats.json")
+
+POLL_INTERVAL = 0.1
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def split_union(xpath):
+    """Top-level alternatives of an XPath union; `|` inside predicates or quotes is kept"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(xpath):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            parts.append(xpath[start:i].strip())
+            start = i + 1
+    parts.append(xpath[start:].strip())
+    return [p for p in parts if p]
+
+
+class LocatorRegistry:
+    """Win/miss stats per union alternative, merged into the stats file on save"""
+
+    def __init__(self, path=STATS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stats = self._load()
+        # Only this run's changes are merged on save, so parallel workers do not overwrite each other
+        self._deltas = {}
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def rank(self, key, alternatives):
+        """Alternatives ordered by past wins (then speed); declared order breaks ties"""
+        with self._lock:
+            stats = self._stats.get(key, {})
+
+        def score(indexed):
+            index, alt = indexed
+            entry = stats.get(alt, {})
+            wins = entry.get("wins", 0)
+            avg_ms = entry.get("total_ms", 0) / wins if wins else float("inf")
+            return (-wins, entry.get("misses", 0) - wins, avg_ms, index)
+
+        return [alt for _, alt in sorted(enumerate(alternatives), key=score)]
+
+    def has_wins(self, key, alternative):
+        with self._lock:
+            return self._stats.get(key, {}).get(alternative, {}).get("wins", 0) > 0
+
+    def record(self, key, alternative, won, elapsed_ms=0.0):
+        with self._lock:
+            for table in (self._stats, self._deltas):
+                entry = table.setdefault(key, {}).setdefault(alternative, {"wins": 0, "misses": 0, "total_ms": 0.0})
+                if won:
+                    entry["wins"] += 1
+                    entry["total_ms"] += elapsed_ms
+                else:
+                    entry["misses"] += 1
+
+    def save(self):
+        """Merge this run's deltas into the stats file"""
+        with self._lock:
+            deltas, self._deltas = self._deltas, {}
+        if not deltas:
+            return
+        merged = self._load()
+        for key, alternatives in deltas.items():
+            for alt, delta in alternatives.items():
+                entry = merged.setdefault(key, {}).setdefault(alt, {"wins": 0, "misses": 0, "total_ms": 0.0})
+                for field in ("wins", "misses", "total_ms"):
+                    entry[field] = round(entry[field] + delta[field], 3)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(merged, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save locator stats: {e}")
+
+
+def get_registry():
+    """Process-wide registry, saved at interpreter exit"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = LocatorRegistry()
+            atexit.register(_registry.save)
+        return _registry
+
+
+def first_try_timeout():
+    return float(ConfigReader().get_value("locator_first_try_timeout", "1"))
+
+
+def _find_displayed(driver, xpath):
+    """First displayed match of one alternative, or None - never waits"""
+    try:
+        for element in driver.find_elements(By.XPATH, xpath):
+            if element.is_displayed():
+                return element
+    except (StaleElementReferenceException, WebDriverException):
+        pass
+    return None
+
+
+def find_ranked(driver, locator, fallback_xpath=None, timeout=10, first_try=None):
+    """
+    Find a displayed element for a union XPath, best-ranked alternative first.
+
+    Every alternative (plus `fallback_xpath`) is probed once without waiting. If none
+    matched, a proven winner is polled alone for `first_try` seconds, then all of them
+    each round until `timeout`.
+
+    Args:
+        driver: WebDriver instance
+        locator: (By.XPATH, union) tuple
+        fallback_xpath (str): Extra union tried after the locator's own alternatives
+        timeout (float): Overall seconds before giving up
+        first_try (float): Seconds the winning alternative gets alone (default: config)
+
+    Returns:
+        WebElement
+
+    Raises:
+        TimeoutException: When no alternative matched within timeout
+    """
+    by, key = locator
+    if by != By.XPATH:
+        raise ValueError(f"find_ranked needs an XPath locator, got {by}")
+    alternatives = split_union(key)
+    if fallback_xpath:
+        alternatives += [alt for alt in split_union(fallback_xpath) if alt not in alternatives]
+
+    registry = get_registry()
+    ranked = registry.rank(key, alternatives)
+    first_try = first_try_timeout() if first_try is None else first_try
+
+    started = time.perf_counter()
+    deadline = started + timeout
+    first_deadline = started + min(first_try, timeout)
+    proven = registry.has_wins(key, ranked[0])
+    tried = set()
+    first_round = True
+
+    while True:
+        # One pass over every alternative costs milliseconds; while the page may still be
+        # rendering only a proven winner is polled, then the whole list again
+        if first_round or not proven or time.perf_counter() >= first_deadline:
+            candidates = ranked
+        else:
+            candidates = ranked[:1]
+        first_round = False
+        for alt in candidates:
+            element = _find_displayed(driver, alt)
+            if element is not None:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                for missed in tried - {alt}:
+                    registry.record(key, missed, won=False)
+                registry.record(key, alt, won=True, elapsed_ms=elapsed_ms)
+                if alt != ranked[0]:
+                    logger.debug("Locator alternative #%d matched after %.0fms: %s", alternatives.index(alt) + 1, elapsed_ms, alt)
+                return element
+            tried.add(alt)
+        if time.perf_counter() >= deadline:
+            for missed in tried:
+                registry.record(key, missed, won=False)
+            raise TimeoutException(f"No alternative of locator matched within {timeout}s: {key}")
+        time.sleep(POLL_INTERVAL)
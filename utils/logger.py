@@ -1,36 +1,149 @@
+"""
+Project logging.
 
+Loggers hand their records to a queue; one background listener per process formats them
+and writes the text log (and, with log_json=true, a JSON-lines log), so test threads never
+block on file I/O. Level and file come from config.properties (log_level, log_file). Every
+record carries the current test id, data row, step and worker from `log_context`.
+"""
+import atexit
+import contextvars
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-LOG_DIR = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)),
-    "logs"
-)
+from utils.config_reader import ConfigReader
+from utils.worker_context import get_worker_id, worker_file_name
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+LOG_DIR = os.path.join(PROJECT_ROOT, "logs")
 if not os.path.exists(LOG_DIR):
     os.makedirs(LOG_DIR)
 
-def get_logger(name):
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+DEFAULT_LOG_FILE = "logs/test_run.log"
+TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+CONTEXT_FIELDS = ("test", "row", "step", "worker")
+
+_log_context = contextvars.ContextVar("log_context", default={})
+_setup = {}
+_setup_lock = threading.Lock()
+
+
+def log_file_path():
+    """Configured text log path (without the worker suffix)"""
+    configured = ConfigReader().get_value("log_file") or DEFAULT_LOG_FILE
+    return configured if os.path.isabs(configured) else os.path.join(PROJECT_ROOT, configured)
+
+
+def set_log_context(**fields):
+    """Add fields (test, row, step, ...) to every record logged from this context; returns a reset token"""
+    return _log_context.set({**_log_context.get(), **fields})
+
+
+def reset_log_context(token):
+    _log_context.reset(token)
+
+
+def current_log_context():
+    """Fields set by log_context / set_log_context in this context"""
+    return _log_context.get()
+
+
+@contextmanager
+def log_context(**fields):
+    """Scope log context fields to a block"""
+    token = set_log_context(**fields)
+    try:
+        yield
+    finally:
+        reset_log_context(token)
 
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
 
-    # Log file
-    log_file = os.path.join(LOG_DIR, "test_run.log")
+class _ContextQueueHandler(QueueHandler):
+    """Enqueue records unformatted; only the context is captured on the calling thread"""
 
-    file_handler = RotatingFileHandler(
-        log_file,
+    def prepare(self, record):
+        context = _log_context.get()
+        for field in CONTEXT_FIELDS:
+            setattr(record, field, context.get(field))
+        if record.worker is None:
+            record.worker = _setup["worker"]
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record, for post-processing"""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def _rotating_handler(path, formatter):
+    handler = RotatingFileHandler(
+        path,
         maxBytes=5 * 1024 * 1024,   # 5 MB
-        backupCount=3
-    )
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+        backupCount=3,
+        encoding="utf-8",
     )
+    handler.setFormatter(formatter)
+    return handler
+
+
+def _configure():
+    """Start this process's queue listener (once)"""
+    with _setup_lock:
+        if _setup:
+            return _setup
+        cfg = ConfigReader()
+        level = logging.getLevelName((cfg.get_value("log_level") or "INFO").upper())
+        _setup["level"] = level if isinstance(level, int) else logging.INFO
+        _setup["worker"] = get_worker_id()
 
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+        # One file per worker so parallel shards never share a rotating handler
+        base_path = log_file_path()
+        log_dir = os.path.dirname(base_path)
+        os.makedirs(log_dir, exist_ok=True)
+        text_path = os.path.join(log_dir, worker_file_name(os.path.basename(base_path)))
+        handlers = [_rotating_handler(text_path, logging.Formatter(TEXT_FORMAT))]
+        if (cfg.get_value("log_json", "false") or "").lower() == "true":
+            json_path = os.path.splitext(text_path)[0] + ".jsonl"
+            handlers.append(_rotating_handler(json_path, JsonLinesFormatter()))
+
+        log_queue = queue.SimpleQueue()
+        _setup["handler"] = _ContextQueueHandler(log_queue)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _setup["listener"] = listener
+        # Drains the queue so the last records of the run reach the files
+        atexit.register(listener.stop)
+        return _setup
+
+
+def get_logger(name):
+    setup = _configure()
+    logger = logging.getLogger(name)
+    logger.setLevel(setup["level"])
+
+    # Prevent duplicate handlers
+    if setup["handler"] not in logger.handlers:
+        logger.addHandler(setup["handler"])
 
     return logger
@@ -0,0 +1,156 @@
+"""
+Navigation Timing / Resource Timing capture for the pages a test visits (opt-in).
+
+With `page_timing=true` (or `--page-timing`), every `driver.get` and every
+`HomePage.click_search` is followed by one script call that reads
+`performance.getEntriesByType('navigation'|'resource')`. Per page it keeps TTFB,
+DOMContentLoaded, load, request/byte totals and the slowest resources. A navigation
+without a page load (search results rendered in place) reports the resources fetched
+since the previous capture. Each test's pages are attached to Allure; the run's pages are
+written to reports/page_timing/page_timing_<run>.json.
+"""
+import json
+import os
+from datetime import datetime
+
+import allure
+from selenium.webdriver.remote.command import Command
+
+from utils.command_tracer import attach_tracer
+from utils.config_reader import ConfigReader
+from utils.logger import get_logger
+from utils.worker_context import worker_file_name
+
+logger = get_logger("page_timing")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+SLOWEST_RESOURCES = 10
+
+# arguments: max slow resources; returns navigation + resources since the previous capture
+PAGE_TIMING_SCRIPT = """
+var limit = arguments[0];
+var nav = performance.getEntriesByType('navigation')[0];
+var since = window.__pageTimingSince || 0;
+var now = performance.now();
+window.__pageTimingSince = now;
+try { performance.setResourceTimingBufferSize(2000); } catch (e) {}
+
+var resources = performance.getEntriesByType('resource').filter(function (r) { return r.startTime >= since; });
+var round = function (v) { return v > 0 ? Math.round(v) : null; };
+var bytes = 0;
+resources.forEach(function (r) { bytes += r.transferSize || 0; });
+var slowest = resources.slice().sort(function (a, b) { return b.duration - a.duration; }).slice(0, limit)
+    .map(function (r) {
+        return {name: r.name, type: r.initiatorType, duration_ms: Math.round(r.duration),
+                start_ms: Math.round(r.startTime), transfer_bytes: r.transferSize || 0};
+    });
+return {
+    url: location.href,
+    title: document.title,
+    soft_navigation: since > 0,
+    since_ms: Math.round(since),
+    navigation: nav ? {
+        type: nav.type,
+        ttfb_ms: round(nav.responseStart),
+        dom_content_loaded_ms: round(nav.domContentLoadedEventEnd),
+        load_ms: round(nav.loadEventEnd),
+        transfer_bytes: nav.transferSize || 0
+    } : null,
+    resource_count: resources.length,
+    resource_bytes: bytes,
+    slowest_resources: slowest
+};
+"""
+
+_run = {"pages": []}
+
+
+def is_enabled(cfg=None, option=False):
+    """Opt-in via --page-timing or page_timing=true in config"""
+    cfg = cfg or ConfigReader()
+    return bool(option) or (cfg.get_value("page_timing", "false") or "").lower() == "true"
+
+
+class PageTimingCollector:
+    """Captures page timings for one test; hooked to the driver's command tracer"""
+
+    def __init__(self, driver, nodeid):
+        self.driver = driver
+        self.nodeid = nodeid
+        self.pages = []
+        self._capturing = False
+
+    def __call__(self, command, params):
+        if command == Command.GET and not self._capturing:
+            self.capture(f"get {(params or {}).get('url', '')}")
+
+    def capture(self, trigger):
+        """One script call: navigation + resource timing of the current page"""
+        if self._capturing:
+            return None
+        self._capturing = True
+        try:
+            entry = self.driver.execute_script(PAGE_TIMING_SCRIPT, SLOWEST_RESOURCES)
+        except Exception as e:
+            logger.debug("Page timing capture failed after %s: %s", trigger, e)
+            return None
+        finally:
+            self._capturing = False
+        if not entry or not entry.get("url", "").startswith("http"):
+            return None
+        entry.update({"test": self.nodeid, "trigger": trigger,
+                      "captured_at": datetime.now().isoformat(timespec="milliseconds")})
+        self.pages.append(entry)
+        nav = entry["navigation"] or {}
+        logger.info(
+            f"Page timing {entry['url']}: TTFB {nav.get('ttfb_ms')}ms, DCL {nav.get('dom_content_loaded_ms')}ms, "
+            f"load {nav.get('load_ms')}ms, {entry['resource_count']} resources ({entry['resource_bytes'] / 1024:.0f} KB)"
+            + (" [soft navigation]" if entry["soft_navigation"] else "")
+        )
+        return entry
+
+
+def start_page_timing(driver, nodeid):
+    """Begin capturing for a test (driver fixture)"""
+    collector = PageTimingCollector(driver, nodeid)
+    attach_tracer(driver).add_listener(collector)
+    driver._page_timing = collector
+    return collector
+
+
+def capture_page_timing(driver, trigger):
+    """Capture now, e.g. after an in-page navigation; no-op unless page timing is on"""
+    collector = getattr(driver, "_page_timing", None)
+    return collector.capture(trigger) if collector is not None else None
+
+
+def finish_page_timing(driver):
+    """Stop capturing; attach the test's pages to Allure and keep them for the run file"""
+    collector = getattr(driver, "_page_timing", None)
+    if collector is None:
+        return []
+    attach_tracer(driver).remove_listener(collector)
+    driver._page_timing = None
+    if collector.pages:
+        allure.attach(json.dumps(collector.pages, indent=2), name="page_timing",
+                      attachment_type=allure.attachment_type.JSON)
+        _run["pages"].extend(collector.pages)
+    return collector.pages
+
+
+def write_run_file(report_path=None):
+    """Write every captured page of this run (per worker) to reports/page_timing/"""
+    if not _run["pages"]:
+        return None
+    report_path = report_path or ConfigReader().get_value("report_path") or "reports/"
+    out_dir = os.path.join(PROJECT_ROOT, report_path, "page_timing")
+    path = os.path.join(out_dir, worker_file_name(f"page_timing_{datetime.now():%Y%m%d_%H%M%S}.json"))
+    try:
+        os.makedirs(out_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"pages": _run["pages"]}, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not write page timing file {path}: {e}")
+        return None
+    logger.info(f"Page timing for {len(_run['pages'])} page visits written to {path}")
+    return path
@@ -0,0 +1,174 @@
+"""
+Parallel execution: shard the collected (parametrized) test rows across N worker
+processes, each with its own browser, log file, screenshot folder and Allure dir,
+then merge the per-worker artifacts once all workers have finished.
+
+Started from conftest when pytest is run with `--workers N`.
+"""
+import glob
+import heapq
+import os
+import re
+import shutil
+import subprocess
+import sys
+from datetime import datetime
+
+from utils.logger import get_logger, log_file_path
+from utils.worker_context import WORKER_ENV_VAR
+
+logger = get_logger("parallel_runner")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+LOG_DIR = os.path.join(PROJECT_ROOT, "logs")
+
+# Log records start with "YYYY-MM-DD HH:MM:SS,mmm | " - continuation lines (tracebacks) do not
+RECORD_START = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} \|")
+
+
+def select_shard(items, shard_index, shard_count):
+    """Split collected items round-robin; returns (selected, deselected)"""
+    selected, deselected = [], []
+    for position, item in enumerate(items):
+        if position % shard_count == shard_index:
+            selected.append(item)
+        else:
+            deselected.append(item)
+    return selected, deselected
+
+
+def _strip_workers_option(args):
+    """Drop --workers N / --workers=N from the original pytest arguments"""
+    cleaned = []
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg == "--workers":
+            skip_next = True
+            continue
+        if arg.startswith("--workers="):
+            continue
+        cleaned.append(arg)
+    return cleaned
+
+
+def worker_ids(worker_count):
+    return [f"gw{index}" for index in range(worker_count)]
+
+
+def run_parallel(args, worker_count, alluredir):
+    """Run one pytest process per shard and wait for all of them"""
+    base_args = _strip_workers_option(list(args))
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    processes = []
+    for index, worker_id in enumerate(worker_ids(worker_count)):
+        worker_allure_dir = os.path.join(alluredir, worker_id)
+        cmd = [
+            sys.executable, "-m", "pytest",
+            *base_args,
+            f"--shard-index={index}",
+            f"--shard-count={worker_count}",
+            f"--alluredir={worker_allure_dir}",
+        ]
+        env = dict(os.environ, **{WORKER_ENV_VAR: worker_id})
+        output_path = os.path.join(LOG_DIR, f"pytest_{worker_id}.out")
+        output = open(output_path, "w", encoding="utf-8")
+        logger.info(f"Starting worker {worker_id}: {' '.join(cmd)}")
+        process = subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env, stdout=output, stderr=subprocess.STDOUT)
+        processes.append((worker_id, process, output, output_path))
+
+    exit_codes = []
+    for worker_id, process, output, output_path in processes:
+        code = process.wait()
+        output.close()
+        exit_codes.append(code)
+        logger.info(f"Worker {worker_id} finished with exit code {code}")
+
+        # Replay each worker's console output in order so the terminal stays readable
+        print(f"\n========== worker {worker_id} (exit code {code}) ==========")
+        with open(output_path, encoding="utf-8", errors="replace") as f:
+            sys.stdout.write(f.read())
+
+    return combine_exit_codes(exit_codes)
+
+
+def combine_exit_codes(exit_codes):
+    """0 if every shard passed; a shard with no tests (5) does not fail the run"""
+    meaningful = [code for code in exit_codes if code != 5]
+    if not meaningful:
+        return 5
+    return max(meaningful)
+
+
+def merge_allure_results(alluredir, worker_count):
+    """Move every worker's Allure result files into the main results dir"""
+    moved = 0
+    for worker_id in worker_ids(worker_count):
+        worker_dir = os.path.join(alluredir, worker_id)
+        if not os.path.isdir(worker_dir):
+            continue
+        for name in os.listdir(worker_dir):
+            # Allure file names are uuid-based, so they never collide across workers
+            shutil.move(os.path.join(worker_dir, name), os.path.join(alluredir, name))
+            moved += 1
+        shutil.rmtree(worker_dir, ignore_errors=True)
+    logger.info(f"Merged {moved} Allure result files into {alluredir}")
+
+
+def merge_screenshots(screenshot_dir, worker_count):
+    """Move per-worker screenshots up into the main screenshot folder"""
+    for worker_id in worker_ids(worker_count):
+        worker_dir = os.path.join(screenshot_dir, worker_id)
+        if not os.path.isdir(worker_dir):
+            continue
+        for name in os.listdir(worker_dir):
+            shutil.move(os.path.join(worker_dir, name), os.path.join(screenshot_dir, f"{worker_id}_{name}"))
+        shutil.rmtree(worker_dir, ignore_errors=True)
+
+
+def _read_records(path, worker_id):
+    """Yield (timestamp, text) per log record, keeping tracebacks attached to their record"""
+    record = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if RECORD_START.match(line) and record:
+                yield record[0][:23], "".join(record)
+                record = []
+            if not record:
+                line = line.replace(" | ", f" | {worker_id} | ", 1) if RECORD_START.match(line) else line
+            record.append(line)
+    if record:
+        yield record[0][:23], "".join(record)
+
+
+def merge_logs(worker_count, since=None, merged_name=None):
+    """Combine the per-worker logs into one chronologically ordered file"""
+    log_dir = os.path.dirname(log_file_path())
+    root, ext = os.path.splitext(os.path.basename(log_file_path()))
+    streams = []
+    for worker_id in worker_ids(worker_count):
+        for path in sorted(glob.glob(os.path.join(log_dir, f"{root}_{worker_id}{ext}*")), reverse=True):
+            streams.append(_read_records(path, worker_id))
+
+    merged_path = os.path.join(log_dir, merged_name or f"{root}_merged{ext}")
+    with open(merged_path, "w", encoding="utf-8") as merged:
+        for timestamp, text in heapq.merge(*streams, key=lambda record: record[0]):
+            # Worker logs are appended to across runs - keep only this run's records
+            if since and timestamp < since:
+                continue
+            merged.write(text)
+    logger.info(f"Merged worker logs into {merged_path}")
+    return merged_path
+
+
+def run_and_merge(args, worker_count, alluredir, screenshot_dir):
+    """Entry point used by conftest: shard, run, then merge artifacts"""
+    started = datetime.now().strftime("%Y-%m-%d %H:%M:%S,000")
+    exit_code = run_parallel(args, worker_count, alluredir)
+    merge_allure_results(alluredir, worker_count)
+    merge_screenshots(screenshot_dir, worker_count)
+    merge_logs(worker_count, since=started)
+    return exit_code
@@ -0,0 +1,355 @@
+"""
+Native run summary built from the Allure result files - no Java / Allure CLI needed.
+
+Each `*-result.json` in the results dir is read once (files already ingested are
+skipped by name, size and mtime) into a compact per-test entry. `ingest()` runs after
+every test, so the end of a run only has to write the summary:
+
+    reports/summary/summary.json   totals, suites, failures, slowest tests, attachments
+    reports/summary/index.html     static page with the same data and the history trend
+    reports/summary/history.json   totals of the previous runs, per-test status history and
+                                   per-test / per-step durations (read by utils/duration_gate.py)
+
+Step durations come from the step timelines (utils/step_timer.py). Only a test run adds to
+history.json; rebuilding the summary from the command line leaves the history as it is.
+
+Usage:
+    python -m utils.report_builder [results_dir] [--out DIR]
+"""
+import argparse
+import html
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from utils.logger import get_logger
+from utils.step_timer import timeline_dir as default_timeline_dir
+
+logger = get_logger("report_builder")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+STATUSES = ("passed", "failed", "broken", "skipped", "unknown")
+HISTORY_RUNS = 50
+TEST_HISTORY = 10
+DURATION_HISTORY = 20
+SLOWEST = 10
+
+
+def _label(result, name):
+    for label in result.get("labels", []):
+        if label.get("name") == name:
+            return label.get("value")
+    return None
+
+
+def _count_steps(steps):
+    return sum(1 + _count_steps(s.get("steps", [])) for s in steps)
+
+
+def _attachments(node):
+    found = list(node.get("attachments", []))
+    for child in node.get("steps", []):
+        found.extend(_attachments(child))
+    return found
+
+
+def compact_result(result):
+    """The fields the summary needs from one Allure result"""
+    details = result.get("statusDetails") or {}
+    message = (details.get("message") or "").strip()
+    suite = " / ".join(filter(None, (_label(result, "parentSuite"), _label(result, "suite"), _label(result, "subSuite"))))
+    return {
+        "uuid": result.get("uuid"),
+        "history_id": result.get("historyId") or result.get("fullName") or result.get("uuid"),
+        "name": result.get("name"),
+        "full_name": result.get("fullName"),
+        "suite": suite or "(no suite)",
+        "status": result.get("status") if result.get("status") in STATUSES else "unknown",
+        "start": result.get("start", 0),
+        "duration_ms": max(0, result.get("stop", 0) - result.get("start", 0)),
+        "message": message.splitlines()[0][:500] if message else "",
+        "steps": _count_steps(result.get("steps", [])),
+        "attachments": [{"name": a.get("name"), "source": a.get("source"), "type": a.get("type")}
+                        for a in _attachments(result)],
+    }
+
+
+class ReportBuilder:
+    """Incremental reader of an Allure results dir and writer of the summary"""
+
+    def __init__(self, results_dir, output_dir=None, timeline_dir=None):
+        self.results_dir = results_dir
+        self.output_dir = output_dir or os.path.join(results_dir, "summary")
+        # Written by step_timer under report_path, whatever --alluredir is
+        self.timeline_dir = timeline_dir or default_timeline_dir()
+        self._seen = {}
+        self._tests = {}
+
+    def ingest(self):
+        """Read result files added or changed since the last call; returns how many were read"""
+        read = 0
+        try:
+            entries = list(os.scandir(self.results_dir))
+        except OSError:
+            return 0
+        for entry in entries:
+            if not entry.name.endswith("-result.json"):
+                continue
+            stat = entry.stat()
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self._seen.get(entry.name) == signature:
+                continue
+            try:
+                with open(entry.path, encoding="utf-8") as f:
+                    test = compact_result(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.debug("Skipping unreadable result %s: %s", entry.name, e)
+                continue
+            self._seen[entry.name] = signature
+            # Re-runs of the same test keep only the latest result
+            current = self._tests.get(test["history_id"])
+            if current is None or test["start"] >= current["start"]:
+                self._tests[test["history_id"]] = test
+            read += 1
+        return read
+
+    def summarize(self, since_ms=None):
+        """Summary dict of the ingested tests (started at or after since_ms, when given)"""
+        tests = [t for t in self._tests.values() if since_ms is None or t["start"] >= since_ms]
+        tests.sort(key=lambda t: t["start"])
+        totals = {status: 0 for status in STATUSES}
+        suites = {}
+        for test in tests:
+            totals[test["status"]] += 1
+            suite = suites.setdefault(test["suite"], {"tests": 0, "duration_ms": 0, **{s: 0 for s in STATUSES}})
+            suite["tests"] += 1
+            suite[test["status"]] += 1
+            suite["duration_ms"] += test["duration_ms"]
+
+        started = min((t["start"] for t in tests), default=0)
+        finished = max((t["start"] + t["duration_ms"] for t in tests), default=0)
+        return {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "start": started,
+            "tests": len(tests),
+            "totals": totals,
+            "duration_ms": sum(t["duration_ms"] for t in tests),
+            "wall_ms": finished - started,
+            "suites": suites,
+            "failures": [t for t in tests if t["status"] in ("failed", "broken")],
+            "slowest": sorted(tests, key=lambda t: t["duration_ms"], reverse=True)[:SLOWEST],
+            "attachments": sum(len(t["attachments"]) for t in tests),
+            "results": tests,
+        }
+
+    def write(self, since_ms=None):
+        """
+        Ingest anything new, then write summary.json, index.html and history.json.
+
+        The history is only updated for a run (since_ms given); a rebuild without it
+        would record the same results again as a new run.
+        """
+        started = time.perf_counter()
+        self.ingest()
+        summary = self.summarize(since_ms)
+        if not summary["tests"]:
+            logger.info("No Allure results for this run - summary not written")
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        if since_ms is not None:
+            history = self._update_history(summary, self.read_timelines(since_ms))
+        else:
+            history = _load_json(os.path.join(self.output_dir, "history.json")) or {}
+        _write_json(os.path.join(self.output_dir, "summary.json"), summary)
+        index_path = os.path.join(self.output_dir, "index.html")
+        with open(index_path, "w", encoding="utf-8") as f:
+            f.write(render_html(summary, history, os.path.relpath(self.results_dir, self.output_dir)))
+
+        totals = summary["totals"]
+        logger.info(
+            f"Report summary: {summary['tests']} tests, {totals['passed']} passed, {totals['failed']} failed, "
+            f"{totals['broken']} broken, {totals['skipped']} skipped - written to {index_path} "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return index_path
+
+    def read_timelines(self, since_ms=None):
+        """Step durations of this run from the step timelines: test name -> {start_ms, steps}"""
+        timelines = {}
+        try:
+            entries = list(os.scandir(self.timeline_dir))
+        except OSError:
+            return timelines
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            data = _load_json(entry.path)
+            if not data or not data.get("steps"):
+                continue
+            start_ms = int(datetime.fromisoformat(data["started_at"]).timestamp() * 1000)
+            if since_ms is not None and start_ms < since_ms:
+                continue
+            steps = {}
+            for step in data["steps"]:
+                # A step name repeated inside one test (e.g. in a loop) is summed
+                steps[step["name"]] = round(steps.get(step["name"], 0) + step["seconds"], 3)
+            timelines[data["test"]] = {"start_ms": start_ms, "steps": steps}
+        return timelines
+
+    def _update_history(self, summary, timelines=None):
+        path = os.path.join(self.output_dir, "history.json")
+        history = _load_json(path) or {}
+        for key in ("runs", "tests", "durations", "steps"):
+            history.setdefault(key, [] if key == "runs" else {})
+        # A run is keyed by its first test's start, so rebuilding its summary does not add it again
+        if not any(run.get("start") == summary["start"] for run in history["runs"]):
+            history["runs"].append({
+                "run_at": summary["generated_at"],
+                "start": summary["start"],
+                "tests": summary["tests"],
+                "totals": summary["totals"],
+                "duration_ms": summary["duration_ms"],
+                "wall_ms": summary["wall_ms"],
+            })
+            history["runs"] = history["runs"][-HISTORY_RUNS:]
+        for test in summary["results"]:
+            durations = history["durations"].setdefault(test["history_id"], {"name": test["name"], "runs": []})
+            # Rebuilding the summary of the same run must not count it twice
+            if durations["runs"] and durations["runs"][-1][0] == test["start"]:
+                continue
+            durations["runs"].append([test["start"], test["duration_ms"]])
+            del durations["runs"][:-DURATION_HISTORY]
+            statuses = history["tests"].setdefault(test["history_id"], [])
+            statuses.append(test["status"])
+            del statuses[:-TEST_HISTORY]
+        for test_name, timeline in (timelines or {}).items():
+            test_steps = history["steps"].setdefault(test_name, {})
+            for step_name, seconds in timeline["steps"].items():
+                runs = test_steps.setdefault(step_name, [])
+                if not runs or runs[-1][0] != timeline["start_ms"]:
+                    runs.append([timeline["start_ms"], seconds])
+                    del runs[:-DURATION_HISTORY]
+        _write_json(path, history)
+        return history
+
+
+def _load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def _seconds(ms):
+    return f"{ms / 1000:.1f}s"
+
+
+def _trend_svg(runs):
+    """Stacked passed/failed bars for the last runs"""
+    if not runs:
+        return ""
+    width, height, bar = 12 * len(runs), 60, 10
+    tallest = max(r["tests"] for r in runs) or 1
+    bars = []
+    for i, run in enumerate(runs):
+        x, y = i * 12, height
+        for status, color in (("passed", "#4caf50"), ("failed", "#e53935"), ("broken", "#fb8c00"), ("skipped", "#9e9e9e")):
+            h = height * run["totals"].get(status, 0) / tallest
+            if h:
+                y -= h
+                bars.append(f'<rect x="{x}" y="{y:.1f}" width="{bar}" height="{h:.1f}" fill="{color}">'
+                            f'<title>{html.escape(run["run_at"])}: {run["totals"].get(status, 0)} {status}</title></rect>')
+    return f'<svg width="{width}" height="{height}" role="img">{"".join(bars)}</svg>'
+
+
+def render_html(summary, history, results_href):
+    """Self-contained static summary page"""
+    esc = html.escape
+    totals = summary["totals"]
+    test_history = history.get("tests", {})
+
+    def history_cell(test):
+        statuses = test_history.get(test["history_id"], [])
+        return "".join(f'<span class="dot {s}" title="{s}"></span>' for s in statuses)
+
+    def attachment_links(test):
+        return " ".join(f'<a href="{esc(results_href)}/{esc(a["source"] or "")}">{esc(a["name"] or "attachment")}</a>'
+                        for a in test["attachments"])
+
+    suite_rows = "".join(
+        f"<tr><td>{esc(name)}</td><td>{s['tests']}</td><td>{s['passed']}</td><td>{s['failed']}</td>"
+        f"<td>{s['broken']}</td><td>{s['skipped']}</td><td>{_seconds(s['duration_ms'])}</td></tr>"
+        for name, s in sorted(summary["suites"].items())
+    )
+    failure_rows = "".join(
+        f"<tr><td>{esc(t['name'] or '')}</td><td class='{t['status']}'>{t['status']}</td>"
+        f"<td><pre>{esc(t['message'])}</pre></td><td>{attachment_links(t)}</td><td>{history_cell(t)}</td></tr>"
+        for t in summary["failures"]
+    ) or "<tr><td colspan='5'>No failures</td></tr>"
+    result_rows = "".join(
+        f"<tr><td>{esc(t['name'] or '')}</td><td>{esc(t['suite'])}</td><td class='{t['status']}'>{t['status']}</td>"
+        f"<td>{_seconds(t['duration_ms'])}</td><td>{t['steps']}</td><td>{history_cell(t)}</td></tr>"
+        for t in summary["results"]
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Test run summary</title>
+<style>
+body {{ font-family: sans-serif; margin: 24px; color: #222; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }}
+pre {{ margin: 0; white-space: pre-wrap; max-width: 600px; }}
+.passed {{ color: #2e7d32; }} .failed {{ color: #c62828; }} .broken {{ color: #ef6c00; }} .skipped {{ color: #757575; }}
+.dot {{ display: inline-block; width: 8px; height: 8px; margin-right: 2px; border-radius: 50%; background: #bdbdbd; }}
+.dot.passed {{ background: #4caf50; }} .dot.failed {{ background: #e53935; }} .dot.broken {{ background: #fb8c00; }}
+</style>
+</head>
+<body>
+<h1>Test run summary</h1>
+<p>Generated {esc(summary['generated_at'])} &middot; {summary['tests']} tests &middot;
+<span class="passed">{totals['passed']} passed</span> &middot; <span class="failed">{totals['failed']} failed</span> &middot;
+<span class="broken">{totals['broken']} broken</span> &middot; <span class="skipped">{totals['skipped']} skipped</span> &middot;
+wall time {_seconds(summary['wall_ms'])} (test time {_seconds(summary['duration_ms'])}) &middot; {summary['attachments']} attachments</p>
+<h2>Trend (last {len(history.get('runs', []))} runs)</h2>
+{_trend_svg(history.get('runs', []))}
+<h2>Suites</h2>
+<table><tr><th>Suite</th><th>Tests</th><th>Passed</th><th>Failed</th><th>Broken</th><th>Skipped</th><th>Duration</th></tr>
+{suite_rows}</table>
+<h2>Failures</h2>
+<table><tr><th>Test</th><th>Status</th><th>Message</th><th>Attachments</th><th>History</th></tr>
+{failure_rows}</table>
+<h2>All tests</h2>
+<table><tr><th>Test</th><th>Suite</th><th>Status</th><th>Duration</th><th>Steps</th><th>History</th></tr>
+{result_rows}</table>
+</body>
+</html>
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a static summary of Allure results without the Allure CLI")
+    parser.add_argument("results_dir", nargs="?", default=os.path.join(PROJECT_ROOT, "reports"),
+                        help="Allure results directory (default: reports/)")
+    parser.add_argument("--out", help="Output directory (default: <results_dir>/summary)")
+    args = parser.parse_args(argv)
+
+    path = ReportBuilder(args.results_dir, args.out).write()
+    if path:
+        print(f"Summary written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,110 @@
-
 # utils/screenshot_util.py
+"""
+Screenshot capture with off-thread persistence.
+
+The PNG is grabbed once as bytes (`get_screenshot_as_png`), attached to Allure straight
+from memory and handed to a background writer, which optionally downscales/recompresses it
+(when Pillow is installed) and writes it to disk. Callers never wait on PNG encoding or
+file I/O; `flush_screenshots()` waits for pending writes at the end of the session.
+"""
+import atexit
+import io
 import os
+import queue
+import threading
 from datetime import datetime
 
+import allure
+
+from utils.config_reader import ConfigReader
+from utils.logger import get_logger
+from utils.worker_context import get_worker_id
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots are then written as captured
+    Image = None
+
+logger = get_logger("screenshot_util")
+
+_writer = None
+_writer_lock = threading.Lock()
+_defaults = {}
+
+
+def _settings():
+    if not _defaults:
+        cfg = ConfigReader()
+        _defaults["max_width"] = int(cfg.get_value("screenshot_max_width", "0"))
+        _defaults["optimize"] = (cfg.get_value("screenshot_optimize", "true") or "").lower() == "true"
+        if Image is None and (_defaults["max_width"] or _defaults["optimize"]):
+            logger.warning("Pillow is not installed: screenshots are written as captured "
+                           "(screenshot_optimize / screenshot_max_width have no effect)")
+    return _defaults
+
+
+def _encode(png_bytes, max_width, optimize):
+    """Downscale to max_width (0 = keep size) and recompress; raw bytes without Pillow"""
+    if Image is None or (not max_width and not optimize):
+        return png_bytes
+    image = Image.open(io.BytesIO(png_bytes))
+    resized = bool(max_width) and image.width > max_width
+    if resized:
+        height = round(image.height * max_width / image.width)
+        image = image.resize((max_width, height), Image.LANCZOS)
+    out = io.BytesIO()
+    image.save(out, format="PNG", optimize=optimize)
+    # Recompression alone does not always win on small captures
+    return out.getvalue() if resized or out.tell() < len(png_bytes) else png_bytes
+
+
+class _ScreenshotWriter:
+    """Single daemon thread that encodes and writes queued screenshots"""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path, png_bytes):
+        self._queue.put((path, png_bytes))
+
+    def flush(self):
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            path, png_bytes = self._queue.get()
+            try:
+                settings = _settings()
+                try:
+                    data = _encode(png_bytes, settings["max_width"], settings["optimize"])
+                except Exception as e:
+                    logger.debug(f"Screenshot re-encoding failed, writing original: {e}")
+                    data = png_bytes
+                with open(path, "wb") as f:
+                    f.write(data)
+            except OSError as e:
+                logger.warning(f"Could not write screenshot {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+def _get_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = _ScreenshotWriter()
+            atexit.register(_writer.flush)
+        return _writer
+
+
+def flush_screenshots():
+    """Block until every queued screenshot is on disk (end of session)"""
+    if _writer is not None:
+        _writer.flush()
+
+
 class ScreenshotUtil:
     """Utility for capturing screenshots"""
 
@@ -12,22 +114,58 @@ class ScreenshotUtil:
             os.path.dirname(os.path.dirname(__file__)),
             screenshot_path
         )
+        worker_id = get_worker_id()
+        if worker_id:
+            # Parallel workers get their own subdirectory, merged at the end of the run
+            self.screenshot_dir = os.path.join(self.screenshot_dir, worker_id)
         os.makedirs(self.screenshot_dir, exist_ok=True)
 
-    def take_screenshot(self, filename="screenshot"):
-        """Capture screenshot and save to file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_file = os.path.join(
-            self.screenshot_dir,
-            f"{filename}_{timestamp}.png"
-        )
-        try:
-            self.driver.save_screenshot(screenshot_file)
-        except Exception:
-            # Keep the path valid; create an empty file so callers can attach it
-            try:
-                with open(screenshot_file, "wb") as f:
-                    pass
-            except Exception:
-                return None
+    def _file_path(self, filename):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return os.path.join(self.screenshot_dir, f"{filename}_{timestamp}.png")
+
+    def _store(self, filename, png_bytes, attach):
+        """Attach from memory and queue the disk write; returns the (pending) file path"""
+        if attach:
+            allure.attach(png_bytes, name=filename, attachment_type=allure.attachment_type.PNG)
+        screenshot_file = self._file_path(filename)
+        _get_writer().submit(screenshot_file, png_bytes)
         return screenshot_file
+
+    def take_screenshot(self, filename="screenshot", attach=False):
+        """
+        Capture the viewport; the file is written in the background
+
+        Args:
+            filename (str): File name prefix (a timestamp is appended)
+            attach (bool): Also attach the PNG to the current Allure test
+
+        Returns:
+            str: Path the screenshot is written to, or None when the capture failed
+        """
+        try:
+            png_bytes = self.driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.warning(f"Screenshot capture failed: {e}")
+            return None
+        return self._store(filename, png_bytes, attach)
+
+    def capture_screenshot(self, filename="screenshot"):
+        """Capture the viewport and attach it to Allure - returns the file path"""
+        return self.take_screenshot(filename, attach=True)
+
+    def capture_element(self, element, filename="element", attach=True):
+        """
+        Capture a single element (WebElement or (By, value) locator)
+
+        Returns:
+            str: Path the screenshot is written to, or None when the capture failed
+        """
+        try:
+            if isinstance(element, tuple):
+                element = self.driver.find_element(*element)
+            png_bytes = element.screenshot_as_png
+        except Exception as e:
+            logger.warning(f"Element screenshot failed: {e}")
+            return None
+        return self._store(filename, png_bytes, attach)
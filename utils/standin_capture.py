@@ -0,0 +1,94 @@
+"""
+Refresh the Practo stand-in from the live site.
+
+Opens each live page in a real browser (stand-in mapping off), lets it settle and saves
+the rendered DOM to standin/captured/<name>.html with live scripts stripped, so the
+snapshot loads offline. The server serves these instead of the bundled fixtures when
+standin_use_captured=true. Captured pages carry the live markup for locator checks;
+interactive behaviour (menus, filters, booking) comes from the bundled fixtures.
+
+Usage:
+    python -m utils.standin_capture              # every page
+    python -m utils.standin_capture home search  # selected pages
+"""
+import argparse
+import os
+import re
+import sys
+from datetime import datetime
+
+from utils.auth_state import AuthStateManager
+from utils.config_reader import ConfigReader
+from utils.dom_settle import wait_for_settle
+from utils.driver_factory import create_driver
+from utils.logger import get_logger
+from utils.standin_server import CAPTURED_DIR
+
+logger = get_logger("standin_capture")
+
+# Fixture name -> (live URL, needs a logged in session)
+CAPTURE_PAGES = {
+    "home": ("https://www.practo.com/", False),
+    "login": ("https://accounts.practo.com/login", False),
+    "search": ("https://www.practo.com/search/doctors?results_type=doctor&q=General%20Physician&city=Bangalore", False),
+    "prime": ("https://www.practo.com/providers/prime", False),
+    "care": ("https://www.practo.com/care", False),
+    "corporate": ("https://www.practo.com/plus/corporate", False),
+    "careers": ("https://www.practo.com/company/careers", False),
+    "appointments": ("https://drive.practo.com/appointments", True),
+}
+
+SCRIPT_PATTERN = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+PRELOAD_PATTERN = re.compile(r"<link\b[^>]*rel=[\"'](?:preload|prefetch|modulepreload)[\"'][^>]*>", re.IGNORECASE)
+
+
+def clean_snapshot(html):
+    """Drop live scripts and preloads so the snapshot is static and offline"""
+    html = SCRIPT_PATTERN.sub("", html)
+    return PRELOAD_PATTERN.sub("", html)
+
+
+def capture_page(driver, name, url):
+    driver.get(url)
+    wait_for_settle(driver, timeout=15)
+    html = clean_snapshot(driver.page_source)
+    header = f"<!-- Captured from {url} on {datetime.now():%Y-%m-%d %H:%M} by utils/standin_capture.py -->\n"
+
+    os.makedirs(CAPTURED_DIR, exist_ok=True)
+    path = os.path.join(CAPTURED_DIR, f"{name}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(header + html)
+    logger.info(f"Captured {name} from {url} ({len(html) / 1024:.0f} KB) -> {path}")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Capture live Practo pages as stand-in fixtures")
+    parser.add_argument("pages", nargs="*", help=f"Pages to capture (default: all of {', '.join(sorted(CAPTURE_PAGES))})")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.pages if name not in CAPTURE_PAGES]
+    if unknown:
+        parser.error(f"unknown page(s): {', '.join(unknown)}")
+
+    cfg = ConfigReader()
+    names = args.pages or sorted(CAPTURE_PAGES)
+    driver = create_driver(cfg, use_standin=False)
+    try:
+        if any(CAPTURE_PAGES[name][1] for name in names):
+            auth_state = AuthStateManager(cfg.get_value("base_url"))
+            auth_state.ensure_authenticated(driver, cfg.get_value("email"), cfg.get_value("password"))
+
+        failed = []
+        for name in names:
+            try:
+                capture_page(driver, name, CAPTURE_PAGES[name][0])
+            except Exception as e:
+                logger.error(f"Could not capture {name}: {e}")
+                failed.append(name)
+    finally:
+        driver.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
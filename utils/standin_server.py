@@ -0,0 +1,264 @@
+"""
+Local stand-in for the Practo site, for offline runs at local-disk latency.
+
+Static HTML/JS fixtures under standin/ are served by a threaded HTTP server. HTTP and
+HTTPS share one port (the first byte of each connection tells them apart), so the
+browser can be pointed at it with Chromium's --host-resolver-rules: every *.practo.com
+URL - including the absolute links and URL assertions in the tests - resolves locally.
+
+Pages are picked by path, whatever the host (www, accounts, drive). Fixtures captured
+from the live site (utils/standin_capture.py) are served instead of the bundled ones
+when standin_use_captured=true.
+"""
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import threading
+import urllib.request
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from utils.config_reader import ConfigReader
+from utils.logger import get_logger
+
+logger = get_logger("standin_server")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+STANDIN_DIR = os.path.join(PROJECT_ROOT, "standin")
+PAGES_DIR = os.path.join(STANDIN_DIR, "pages")
+CAPTURED_DIR = os.path.join(STANDIN_DIR, "captured")
+CERT_DIR = os.path.join(PROJECT_ROOT, ".cache", "standin")
+
+HEALTH_PATH = "/__standin__/health"
+SHIM_TAG = '<script src="/static/standin.js"></script>'
+
+# URL path -> fixture name (standin/pages/<name>.html); prefixes are matched after exact paths
+ROUTES = {
+    "/": "home",
+    "/login": "login",
+    "/search": "search",
+    "/doctor": "doctor",
+    "/providers/prime": "prime",
+    "/care": "care",
+    "/plus/corporate": "corporate",
+    "/company/careers": "careers",
+    "/appointments": "appointments",
+}
+PREFIX_ROUTES = [
+    ("/search/", "search"),
+    ("/care/", "care_ailment"),
+    ("/doctor/", "doctor"),
+]
+
+# Hosts answered by the stand-in when the browser is mapped onto it
+MAPPED_HOSTS = ["*.practo.com", "practo.com"]
+
+
+def _is_true(value):
+    return str(value).strip().lower() in ("true", "1", "yes")
+
+
+def route_for(path):
+    """Fixture name for a request path, or None"""
+    path = urlsplit(path).path.rstrip("/") or "/"
+    if path in ROUTES:
+        return ROUTES[path]
+    for prefix, name in PREFIX_ROUTES:
+        if path.startswith(prefix):
+            return name
+    return None
+
+
+class StandinRequestHandler(SimpleHTTPRequestHandler):
+    """Serves page fixtures by route and files under standin/static"""
+
+    server_version = "PractoStandin/1.0"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=STANDIN_DIR, **kwargs)
+
+    def log_message(self, format, *args):
+        logger.debug("%s %s", self.address_string(), format % args)
+
+    def end_headers(self):
+        # Fixtures never change during a run; let the browser reuse them across tests
+        if self.path.startswith("/static/"):
+            self.send_header("Cache-Control", "max-age=3600")
+        super().end_headers()
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == HEALTH_PATH:
+            self._send_html(b"ok", content_type="text/plain")
+        elif path.startswith("/static/"):
+            super().do_GET()
+        elif path == "/favicon.ico":
+            self.send_response(204)
+            self.end_headers()
+        else:
+            self._send_page(route_for(path))
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def _send_page(self, name):
+        body = self.server.read_page(name) if name else None
+        if body is None:
+            self._send_html(self.server.read_page("not_found") or b"Not found", status=404)
+        else:
+            self._send_html(body)
+
+    def _send_html(self, body, status=200, content_type="text/html; charset=utf-8"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+
+class StandinServer(ThreadingHTTPServer):
+    """Threaded HTTP server that also speaks TLS on the same port"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port=0, ssl_context=None, use_captured=False):
+        super().__init__(("127.0.0.1", port), StandinRequestHandler)
+        self.ssl_context = ssl_context
+        self.use_captured = use_captured
+        self._pages = {}
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}/"
+
+    def finish_request(self, request, client_address):
+        # Runs on the per-connection thread: a TLS ClientHello starts with 0x16
+        if self.ssl_context is not None:
+            try:
+                request.settimeout(10)
+                if request.recv(1, socket.MSG_PEEK) == b"\x16":
+                    request = self.ssl_context.wrap_socket(request, server_side=True)
+                request.settimeout(None)
+            except (OSError, ssl.SSLError) as e:
+                logger.debug(f"Dropped connection from {client_address}: {e}")
+                return
+        super().finish_request(request, client_address)
+
+    def read_page(self, name):
+        """Fixture bytes, preferring a captured page when enabled; cached after first read"""
+        if name not in self._pages:
+            body = None
+            if self.use_captured:
+                body = _read_file(os.path.join(CAPTURED_DIR, f"{name}.html"))
+                if body is not None and SHIM_TAG.encode() not in body:
+                    body = body.replace(b"</body>", SHIM_TAG.encode() + b"</body>", 1)
+            if body is None:
+                body = _read_file(os.path.join(PAGES_DIR, f"{name}.html"))
+            self._pages[name] = body
+        return self._pages[name]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Practo stand-in serving {PAGES_DIR} on port {self.port} (TLS: {self.ssl_context is not None})")
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def _read_file(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _ssl_context():
+    """Self-signed certificate for the practo.com names, generated once with openssl"""
+    cert_path = os.path.join(CERT_DIR, "standin_cert.pem")
+    key_path = os.path.join(CERT_DIR, "standin_key.pem")
+
+    if not (os.path.isfile(cert_path) and os.path.isfile(key_path)):
+        openssl = shutil.which("openssl")
+        if openssl is None:
+            logger.warning("openssl not found - the stand-in serves plain HTTP only")
+            return None
+        os.makedirs(CERT_DIR, exist_ok=True)
+        result = subprocess.run(
+            [openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "825",
+             "-keyout", key_path, "-out", cert_path, "-subj", "/CN=www.practo.com",
+             "-addext", "subjectAltName=DNS:practo.com,DNS:*.practo.com,IP:127.0.0.1"],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            logger.warning(f"Could not create stand-in certificate: {result.stderr.strip()}")
+            return None
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+def is_enabled(cfg=None):
+    cfg = cfg or ConfigReader()
+    return _is_true(cfg.get_value("standin", "false"))
+
+
+def get_port(cfg=None):
+    cfg = cfg or ConfigReader()
+    return int(cfg.get_value("standin_port", "8765"))
+
+
+def is_running(port):
+    """True when a stand-in (e.g. started by another worker) already answers on the port"""
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{HEALTH_PATH}", timeout=1) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def ensure_standin_running(cfg=None):
+    """
+    Start the stand-in on the configured port unless one is already running.
+
+    Returns:
+        StandinServer: the server started by this call (caller stops it), or None
+    """
+    cfg = cfg or ConfigReader()
+    port = get_port(cfg)
+    if is_running(port):
+        logger.info(f"Using the Practo stand-in already running on port {port}")
+        return None
+
+    use_captured = _is_true(cfg.get_value("standin_use_captured", "false"))
+    try:
+        server = StandinServer(port, _ssl_context(), use_captured=use_captured)
+    except OSError:
+        # Lost a start-up race with a parallel worker
+        if is_running(port):
+            return None
+        raise
+    return server.start()
+
+
+def browser_arguments(cfg=None):
+    """Chromium arguments that send every practo.com host to the stand-in"""
+    port = get_port(cfg)
+    rules = ", ".join(f"MAP {host} 127.0.0.1:{port}" for host in MAPPED_HOSTS)
+    return [f"--host-resolver-rules={rules}", "--ignore-certificate-errors"]
@@ -0,0 +1,217 @@
+"""
+Per-step timing for the numbered test steps.
+
+    with step("Step 24-26: Book Clinic Visit"):
+        ...
+
+    @step("Select time slot")
+    def pick_slot(...): ...
+
+Each step records wall time, the number of WebDriver commands sent and its outcome. It is
+reported as an Allure step and collected into a JSON timeline per test, which is written
+to reports/timelines/ and attached to the Allure result.
+
+A `budget` is a step with a time limit; going over it fails the step (and the test):
+
+    with budget("Search results visible", 8):
+        ...
+"""
+import json
+import os
+import re
+import time
+from contextlib import ContextDecorator
+from datetime import datetime
+
+import allure
+from selenium.common.exceptions import TimeoutException
+
+from utils.command_tracer import get_tracer
+from utils.config_reader import ConfigReader
+from utils.logger import get_logger, reset_log_context, set_log_context
+
+logger = get_logger("step_timer")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+
+_current_timeline = None
+_defaults = {}
+
+
+class StepTimeline:
+    """Steps recorded for one test"""
+
+    def __init__(self, test_name, nodeid, driver=None):
+        self.test_name = test_name
+        self.nodeid = nodeid
+        self.driver = driver
+        self.started_at = time.time()
+        self.steps = []
+        self._depth = 0
+
+    def command_count(self):
+        tracer = get_tracer(self.driver) if self.driver is not None else None
+        return tracer.count if tracer is not None else 0
+
+    def to_dict(self):
+        return {
+            "test": self.test_name,
+            "nodeid": self.nodeid,
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(timespec="milliseconds"),
+            "total_step_seconds": round(sum(s["seconds"] for s in self.steps if s["depth"] == 0), 3),
+            "steps": self.steps,
+        }
+
+
+def start_timeline(test_name, nodeid, driver=None):
+    """Begin collecting steps for a test (called from the driver fixture)"""
+    global _current_timeline
+    _current_timeline = StepTimeline(test_name, nodeid, driver)
+    return _current_timeline
+
+
+def finish_timeline():
+    """Stop collecting; write and attach the JSON timeline when the test had steps"""
+    global _current_timeline
+    timeline, _current_timeline = _current_timeline, None
+    if timeline is None or not timeline.steps:
+        return None
+    # A step left open by an interrupted test has no timing
+    timeline.steps = [s for s in timeline.steps if "seconds" in s]
+    if not timeline.steps:
+        return None
+
+    data = timeline.to_dict()
+    body = json.dumps(data, indent=2)
+    path = os.path.join(timeline_dir(), f"{_safe_name(timeline.nodeid)}.json")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(body)
+    except OSError as e:
+        logger.warning(f"Could not write step timeline {path}: {e}")
+        path = None
+
+    allure.attach(body, name="step_timeline", attachment_type=allure.attachment_type.JSON)
+    slowest = max(data["steps"], key=lambda s: s["seconds"])
+    logger.info(f"{len(data['steps'])} steps in {data['total_step_seconds']:.2f}s, slowest: {slowest['name']} ({slowest['seconds']:.2f}s)")
+    return path
+
+
+def timeline_dir():
+    """Directory the JSON timelines are written to (report_path from config)"""
+    report_path = ConfigReader().get_value("report_path") or "reports/"
+    return os.path.join(PROJECT_ROOT, report_path, "timelines")
+
+
+def _safe_name(nodeid):
+    return re.sub(r"[^\w.\-\[\]]+", "_", nodeid).strip("_")
+
+
+class step(ContextDecorator):
+    """Time a test step: wall time, WebDriver commands and outcome"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._timeline = _current_timeline
+        self._allure_step = allure.step(self.name)
+        self._allure_step.__enter__()
+        self._depth = self._timeline._depth if self._timeline is not None else 0
+        self._started = time.perf_counter()
+        self._log_token = set_log_context(step=self.name)
+        if self._timeline is not None:
+            self._timeline._depth += 1
+            self._commands_before = self._timeline.command_count()
+            # Reserved on entry so nested steps are listed after their parent
+            self._record = {"name": self.name, "depth": self._depth,
+                            "start_offset": round(time.time() - self._timeline.started_at, 3)}
+            self._timeline.steps.append(self._record)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self._started
+        reset_log_context(self._log_token)
+        violation = self._violation(seconds, exc_type)
+        if violation is not None:
+            exc_type, exc, tb = AssertionError, violation, None
+        outcome = "passed" if exc_type is None else ("failed" if issubclass(exc_type, AssertionError) else "broken")
+
+        if self._timeline is not None:
+            self._timeline._depth -= 1
+            self._record.update({
+                "seconds": round(seconds, 3),
+                "commands": self._timeline.command_count() - self._commands_before,
+                "outcome": outcome,
+            })
+        logger.debug("Step '%s' %s in %.2fs", self.name, outcome, seconds)
+
+        self._allure_step.__exit__(exc_type, exc, tb)
+        if violation is not None:
+            raise violation
+        return False
+
+    def _violation(self, seconds, exc_type):
+        """AssertionError that replaces the step's outcome, or None"""
+        return None
+
+
+def _budget_settings():
+    if not _defaults:
+        cfg = ConfigReader()
+        _defaults["scale"] = float(cfg.get_value("budget_scale", "1"))
+        _defaults["enforce"] = (cfg.get_value("budget_enforce", "true") or "").lower() == "true"
+    return _defaults
+
+
+class budget(step):
+    """
+    A step that must finish within `seconds` (times budget_scale from config).
+
+    Over budget the step fails with the measured time; a wait that timed out inside
+    the budget is reported the same way. With budget_enforce=false it only logs a warning
+    and the timed-out wait does not fail the test either. `remaining` helps bound a wait
+    to the budget:
+
+        with budget("Slots visible after Book Clinic Visit", 8) as b:
+            PolicyWait(driver, b.remaining).until(...)
+    """
+
+    def __init__(self, name, seconds):
+        super().__init__(name)
+        self.limit = seconds * _budget_settings()["scale"]
+        self.enforced = _budget_settings()["enforce"]
+
+    @property
+    def remaining(self):
+        return max(0.0, self.limit - (time.perf_counter() - self._started))
+
+    def __exit__(self, exc_type, exc, tb):
+        self._exc = exc
+        self._warned = False
+        super().__exit__(exc_type, exc, tb)
+        # Not enforced: the wait that ran out is reported by the warning, not by the test failing
+        return self._warned and exc_type is not None and issubclass(exc_type, TimeoutException)
+
+    def _violation(self, seconds, exc_type):
+        over = seconds > self.limit
+        timed_out = exc_type is not None and issubclass(exc_type, TimeoutException)
+        if self._timeline is not None:
+            self._record.update({"budget_seconds": round(self.limit, 3), "over_budget": over})
+        if exc_type is not None and not timed_out:
+            return None
+        if over:
+            message = f"'{self.name}' took {seconds:.2f}s, over its budget of {self.limit:.2f}s"
+        elif timed_out:
+            # e.g. a learned wait timeout shorter than the budget
+            message = f"'{self.name}' timed out waiting after {seconds:.2f}s (budget {self.limit:.2f}s)"
+        else:
+            return None
+        if not self.enforced:
+            logger.warning(f"Budget exceeded: {message}")
+            self._warned = True
+            return None
+        violation = AssertionError(f"Performance budget exceeded: {message}")
+        violation.__cause__ = self._exc
+        return violation
@@ -0,0 +1,218 @@
+"""
+Parse-once cache for the Excel test data files.
+
+Each workbook is opened a single time in read-only/values-only mode and turned into an
+in-memory index (file -> sheet -> row number / TestCaseID). The index is also pickled to a
+sidecar file keyed by the workbook's mtime and size, so later runs skip xlsx parsing entirely
+until the workbook is edited.
+"""
+import hashlib
+import json
+import os
+import pickle
+import threading
+
+import openpyxl
+
+from utils.logger import get_logger
+
+logger = get_logger("test_data_cache")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+TESTDATA_DIR = os.path.join(PROJECT_ROOT, "testdata")
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache", "testdata")
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.json")
+
+# Bump when the pickled layout changes so old sidecars are ignored
+CACHE_VERSION = 1
+
+# Manifest key used when a test reads the workbook's active sheet
+ACTIVE_SHEET_KEY = "__active__"
+
+_index_cache = {}
+_manifest = None
+_lock = threading.Lock()
+
+
+def resolve_testdata_file(file_name):
+    """Absolute path of a file in the testdata directory"""
+    return os.path.join(TESTDATA_DIR, file_name)
+
+
+class WorkbookIndex:
+    """In-memory view of one workbook: headers, rows by number and rows by TestCaseID per sheet"""
+
+    def __init__(self, path, signature, active_sheet, sheets):
+        self.path = path
+        self.signature = signature
+        self.active_sheet = active_sheet
+        self.sheets = sheets
+
+    def _sheet(self, sheet_name=None):
+        name = sheet_name or self.active_sheet
+        if name not in self.sheets:
+            raise ValueError(f"Sheet '{name}' not found")
+        return self.sheets[name]
+
+    def headers(self, sheet_name=None):
+        return list(self._sheet(sheet_name)["headers"])
+
+    def row_numbers(self, sheet_name=None):
+        """Row numbers (from row 2) whose first column has a value"""
+        sheet = self._sheet(sheet_name)
+        return [row_num for row_num, values in sheet["rows"].items() if values and values[0] is not None]
+
+    def row_values(self, row_number, sheet_name=None):
+        """Cell values of a row, padded to the header width"""
+        sheet = self._sheet(sheet_name)
+        values = list(sheet["rows"].get(row_number, ()))
+        width = len(sheet["headers"])
+        return values + [None] * (width - len(values))
+
+    def row_by_id(self, test_case_id, sheet_name=None):
+        """Row number whose first column equals test_case_id, or None"""
+        return self._sheet(sheet_name)["ids"].get(test_case_id)
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _sidecar_path(path):
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"{os.path.basename(path)}.{digest}.pkl")
+
+
+def _parse_workbook(path):
+    """Read every sheet once in read-only/values-only mode"""
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheets = {}
+        for worksheet in workbook.worksheets:
+            headers, rows, ids = [], {}, {}
+            for row_num, values in enumerate(worksheet.iter_rows(values_only=True), start=1):
+                if row_num == 1:
+                    headers = list(values)
+                    continue
+                rows[row_num] = tuple(values)
+                if values and values[0] is not None:
+                    ids.setdefault(values[0], row_num)
+            sheets[worksheet.title] = {"headers": headers, "rows": rows, "ids": ids}
+        return workbook.active.title, sheets
+    finally:
+        workbook.close()
+
+
+def _read_sidecar(path, signature):
+    sidecar = _sidecar_path(path)
+    if not os.path.isfile(sidecar):
+        return None
+    try:
+        with open(sidecar, "rb") as f:
+            data = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable test data cache {sidecar}: {e}")
+        return None
+    if data.get("version") != CACHE_VERSION or data.get("signature") != signature:
+        return None
+    return data
+
+
+def _write_sidecar(path, signature, active_sheet, sheets):
+    sidecar = _sidecar_path(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": CACHE_VERSION, "signature": signature,
+                         "active_sheet": active_sheet, "sheets": sheets}, f)
+        # Atomic replace so parallel workers never read a half-written file
+        os.replace(tmp_path, sidecar)
+    except OSError as e:
+        logger.warning(f"Could not write test data cache {sidecar}: {e}")
+
+
+def load_workbook_index(file_path):
+    """
+    Return the WorkbookIndex for an xlsx file.
+
+    Served from memory when already loaded, then from the sidecar cache, and only
+    parses the workbook when it changed since the cache was written.
+    """
+    path = os.path.abspath(file_path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Excel file not found: {path}")
+    signature = _signature(path)
+
+    with _lock:
+        index = _index_cache.get(path)
+        if index is not None and index.signature == signature:
+            return index
+
+        data = _read_sidecar(path, signature)
+        if data is not None:
+            active_sheet, sheets = data["active_sheet"], data["sheets"]
+            logger.debug(f"Loaded test data index for {os.path.basename(path)} from cache")
+        else:
+            active_sheet, sheets = _parse_workbook(path)
+            _write_sidecar(path, signature, active_sheet, sheets)
+            logger.debug(f"Parsed {os.path.basename(path)} and cached its index")
+
+        index = WorkbookIndex(path, signature, active_sheet, sheets)
+        _index_cache[path] = index
+        return index
+
+
+def _load_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _save_manifest(manifest):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, MANIFEST_PATH)
+    except OSError as e:
+        logger.warning(f"Could not write test data manifest {MANIFEST_PATH}: {e}")
+
+
+def get_manifest_rows(file_name, sheet_name=None):
+    """
+    Row numbers used to parametrize tests, from the cached manifest.
+
+    Only a stat() of the workbook is needed while the manifest entry is fresh; the
+    workbook index is loaded (and the manifest updated) only when the file changed.
+    """
+    path = resolve_testdata_file(file_name)
+    signature = list(_signature(path))
+    sheet_key = sheet_name or ACTIVE_SHEET_KEY
+
+    with _lock:
+        manifest = _load_manifest()
+        entry = manifest.get(file_name)
+        if entry and entry.get("signature") == signature and sheet_key in entry.get("sheets", {}):
+            return list(entry["sheets"][sheet_key])
+
+    rows = load_workbook_index(path).row_numbers(sheet_name)
+
+    with _lock:
+        manifest = _load_manifest()
+        entry = manifest.get(file_name)
+        if not entry or entry.get("signature") != signature:
+            entry = {"signature": signature, "sheets": {}}
+            manifest[file_name] = entry
+        entry["sheets"][sheet_key] = rows
+        _save_manifest(manifest)
+
+    return list(rows)
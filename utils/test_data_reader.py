@@ -1,54 +1,44 @@
 """
 Test data reader utility for reading Excel files for parametrized tests
+
+All functions are served from the parse-once index in utils/test_data_cache.py,
+so each workbook is read at most once per run (and not at all when its cache is fresh).
 """
-import os
-import openpyxl
 from utils.logger import get_logger
+from utils.test_data_cache import load_workbook_index, resolve_testdata_file
 
 logger = get_logger("test_data_reader")
 
 
+def _get_rows(file_name, sheet_name=None):
+    """Row numbers (from row 2) that have a value in the first column"""
+    return load_workbook_index(resolve_testdata_file(file_name)).row_numbers(sheet_name)
+
+
+def _get_row_data(file_name, row_number, sheet_name=None, skip_empty_headers=True):
+    """Row values keyed by the header row"""
+    index = load_workbook_index(resolve_testdata_file(file_name))
+    headers = index.headers(sheet_name)
+    row_values = index.row_values(row_number, sheet_name)
+    return {
+        header: value for header, value in zip(headers, row_values)
+        if header is not None or not skip_empty_headers
+    }
+
+
 def get_all_test_rows():
     """Get all test data rows from Excel file (by row number)"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "TestData_Master.xlsx")
-    
-    test_rows = []
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook["TestData"]
-        
-        # Get all rows starting from row 2
-        for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-            if row[0].value is not None:
-                test_rows.append(row_num)
-        
-        workbook.close()
+        return _get_rows("TestData_Master.xlsx", "TestData")
     except Exception as e:
         logger.error(f"Error reading test rows from Excel: {e}")
-    
-    return test_rows
+        return []
 
 
 def get_test_data_by_row(row_number):
     """Get test data from a specific row in Excel file"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "TestData_Master.xlsx")
-    
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook["TestData"]
-        
-        # Get headers from first row
-        headers = [cell.value for cell in sheet[1]]
-        
-        # Get row data
-        row_data = sheet[row_number]
-        row_values = [cell.value for cell in row_data]
-        
-        workbook.close()
-        
-        return {header: value for header, value in zip(headers, row_values)}
+        return _get_row_data("TestData_Master.xlsx", row_number, "TestData", skip_empty_headers=False)
     except Exception as e:
         logger.error(f"Error reading test data from row {row_number}: {e}")
         return None
@@ -56,45 +46,17 @@ def get_test_data_by_row(row_number):
 
 def get_all_tc_02_rows():
     """Get all TC_02 test data rows from Excel file (by row number)"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_02.xlsx")
-    
-    test_rows = []
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get all rows starting from row 2
-        for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-            if row[0].value is not None:
-                test_rows.append(row_num)
-        
-        workbook.close()
+        return _get_rows("test_data_tc_02.xlsx")
     except Exception as e:
         logger.error(f"Error reading TC_02 test rows from Excel: {e}")
-    
-    return test_rows
+        return []
 
 
 def get_test_data_tc_02_by_row(row_number):
     """Get test data for TC_02 from test_data_tc_02.xlsx file"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_02.xlsx")
-    
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get headers from first row
-        headers = [cell.value for cell in sheet[1]]
-        
-        # Get row data
-        row_data = sheet[row_number]
-        row_values = [cell.value for cell in row_data]
-        
-        workbook.close()
-        
-        return {header: value for header, value in zip(headers, row_values) if header is not None}
+        return _get_row_data("test_data_tc_02.xlsx", row_number)
     except Exception as e:
         logger.error(f"Error reading TC_02 test data from row {row_number}: {e}")
         return None
@@ -102,45 +64,17 @@ def get_test_data_tc_02_by_row(row_number):
 
 def get_all_tc_03_rows():
     """Get all TC_03 test data rows from Excel file (by row number)"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_03.xlsx")
-    
-    test_rows = []
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get all rows starting from row 2
-        for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-            if row[0].value is not None:
-                test_rows.append(row_num)
-        
-        workbook.close()
+        return _get_rows("test_data_tc_03.xlsx")
     except Exception as e:
         logger.error(f"Error reading TC_03 test rows from Excel: {e}")
-    
-    return test_rows
+        return []
 
 
 def get_test_data_tc_03_by_row(row_number):
     """Get test data for TC_03 from test_data_tc_03.xlsx file"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_03.xlsx")
-    
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get headers from first row
-        headers = [cell.value for cell in sheet[1]]
-        
-        # Get row data
-        row_data = sheet[row_number]
-        row_values = [cell.value for cell in row_data]
-        
-        workbook.close()
-        
-        return {header: value for header, value in zip(headers, row_values) if header is not None}
+        return _get_row_data("test_data_tc_03.xlsx", row_number)
     except Exception as e:
         logger.error(f"Error reading TC_03 test data from row {row_number}: {e}")
         return None
@@ -148,45 +82,17 @@ def get_test_data_tc_03_by_row(row_number):
 
 def get_all_tc_04_rows():
     """Get all TC_04 test data rows by row number"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_04.xlsx")
-    
-    test_rows = []
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get all rows starting from row 2
-        for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-            if row[0].value is not None:
-                test_rows.append(row_num)
-        
-        workbook.close()
+        return _get_rows("test_data_tc_04.xlsx")
     except Exception as e:
         logger.error(f"Error reading TC_04 test rows from Excel: {e}")
-    
-    return test_rows
+        return []
 
 
 def get_test_data_tc_04_by_row(row_number):
     """Get test data for TC_04 from test_data_tc_04.xlsx file"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_04.xlsx")
-    
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get headers from first row
-        headers = [cell.value for cell in sheet[1]]
-        
-        # Get row data
-        row_data = sheet[row_number]
-        row_values = [cell.value for cell in row_data]
-        
-        workbook.close()
-        
-        return {header: value for header, value in zip(headers, row_values) if header is not None}
+        return _get_row_data("test_data_tc_04.xlsx", row_number)
     except Exception as e:
         logger.error(f"Error reading TC_04 test data from row {row_number}: {e}")
         return None
@@ -194,45 +100,17 @@ def get_test_data_tc_04_by_row(row_number):
 
 def get_all_tc_05_rows():
     """Get all TC_05 test data rows by row number"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_05.xlsx")
-    
-    test_rows = []
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get all rows starting from row 2
-        for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-            if row[0].value is not None:
-                test_rows.append(row_num)
-        
-        workbook.close()
+        return _get_rows("test_data_tc_05.xlsx")
     except Exception as e:
         logger.error(f"Error reading TC_05 test rows from Excel: {e}")
-    
-    return test_rows
+        return []
 
 
 def get_test_data_tc_05_by_row(row_number):
     """Get test data for TC_05 from test_data_tc_05.xlsx file"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_05.xlsx")
-    
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get headers from first row
-        headers = [cell.value for cell in sheet[1]]
-        
-        # Get row data
-        row_data = sheet[row_number]
-        row_values = [cell.value for cell in row_data]
-        
-        workbook.close()
-        
-        return {header: value for header, value in zip(headers, row_values) if header is not None}
+        return _get_row_data("test_data_tc_05.xlsx", row_number)
     except Exception as e:
         logger.error(f"Error reading TC_05 test data from row {row_number}: {e}")
         return None
@@ -240,45 +118,17 @@ def get_test_data_tc_05_by_row(row_number):
 
 def get_all_tc_06_rows():
     """Get all TC_06 test data rows by row number"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_06.xlsx")
-    
-    test_rows = []
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get all rows starting from row 2
-        for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-            if row[0].value is not None:
-                test_rows.append(row_num)
-        
-        workbook.close()
+        return _get_rows("test_data_tc_06.xlsx")
     except Exception as e:
         logger.error(f"Error reading TC_06 test rows from Excel: {e}")
-    
-    return test_rows
+        return []
 
 
 def get_test_data_tc_06_by_row(row_number):
     """Get test data for TC_06 from test_data_tc_06.xlsx file"""
-    testdata_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testdata")
-    excel_file = os.path.join(testdata_dir, "test_data_tc_06.xlsx")
-    
     try:
-        workbook = openpyxl.load_workbook(excel_file)
-        sheet = workbook.active
-        
-        # Get headers from first row
-        headers = [cell.value for cell in sheet[1]]
-        
-        # Get row data
-        row_data = sheet[row_number]
-        row_values = [cell.value for cell in row_data]
-        
-        workbook.close()
-        
-        return {header: value for header, value in zip(headers, row_values) if header is not None}
+        return _get_row_data("test_data_tc_06.xlsx", row_number)
     except Exception as e:
         logger.error(f"Error reading TC_06 test data from row {row_number}: {e}")
         return None
@@ -0,0 +1,200 @@
+"""
+Learned wait timeouts and poll schedules per locator.
+
+`PolicyWait` is a drop-in `WebDriverWait`: `until(EC.element_to_be_clickable(locator))`
+behaves the same, but
+
+- polling starts at 20 ms and backs off to 250 ms instead of a flat 0.5 s,
+- the time each locator took to satisfy its condition is recorded and kept across runs
+  in .cache/waits/wait_profile.json,
+- once a locator has enough history its timeout is p99 x wait_timeout_factor (bounded by
+  wait_min_timeout and the caller's / explicit_wait timeout), so missing elements fail fast.
+
+A learned timeout that expires is not trusted the next time: that wait gets the full
+timeout again. Per-locator overrides go in a [WAIT_TIMEOUTS] section of config.properties
+(`<text in the locator> = <seconds>`); `wait_learning=false` turns learning off.
+"""
+import atexit
+import json
+import math
+import os
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.config_reader import ConfigReader
+from utils.logger import get_logger
+
+logger = get_logger("wait_policy")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+PROFILE_PATH = os.path.join(PROJECT_ROOT, ".cache", "waits", "wait_profile.json")
+
+FIRST_POLL = 0.02
+MAX_POLL = 0.25
+POLL_BACKOFF = 1.5
+MAX_SAMPLES = 50
+OVERRIDE_SECTION = "WAIT_TIMEOUTS"
+
+_profile = None
+_profile_lock = threading.Lock()
+_settings = {}
+
+
+def settings():
+    """Wait settings from config.properties (read once)"""
+    if not _settings:
+        cfg = ConfigReader()
+        _settings["default_timeout"] = float(cfg.get_value("explicit_wait", "10"))
+        _settings["factor"] = float(cfg.get_value("wait_timeout_factor", "3"))
+        _settings["min_timeout"] = float(cfg.get_value("wait_min_timeout", "2"))
+        _settings["min_samples"] = int(cfg.get_value("wait_min_samples", "5"))
+        _settings["learning"] = (cfg.get_value("wait_learning", "true") or "").lower() == "true"
+        overrides = cfg.config.items(OVERRIDE_SECTION) if cfg.config.has_section(OVERRIDE_SECTION) else []
+        _settings["overrides"] = [(pattern.lower(), float(seconds)) for pattern, seconds in overrides]
+    return _settings
+
+
+def poll_schedule(first=FIRST_POLL, maximum=MAX_POLL, backoff=POLL_BACKOFF):
+    """Sleep intervals: fast at first, backing off to `maximum`"""
+    interval = first
+    while True:
+        yield interval
+        interval = min(maximum, interval * backoff)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(pct / 100.0 * len(ordered))) - 1]
+
+
+def condition_key(method):
+    """'<condition>|<by>=<value>' for expected_conditions closures, None for other callables"""
+    closure = getattr(method, "__closure__", None) or ()
+    for cell in closure:
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(value, tuple) and len(value) == 2 and all(isinstance(v, str) for v in value):
+            condition = method.__qualname__.split(".")[0]
+            return f"{condition}|{value[0]}={value[1]}"
+    return None
+
+
+class WaitProfile:
+    """Time-to-condition samples per locator, merged into the profile file on save"""
+
+    def __init__(self, path=PROFILE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        # Only this run's samples are merged on save, so parallel workers do not overwrite each other
+        self._new = {}
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def entry(self, key):
+        with self._lock:
+            return self._entries.get(key, {"samples": [], "timeouts": 0, "learned_timeout_failed": False})
+
+    def record(self, key, seconds=None, learned_timeout_failed=False):
+        """A success after `seconds`, or a timeout (seconds=None)"""
+        with self._lock:
+            for table in (self._entries, self._new):
+                entry = table.setdefault(key, {"samples": [], "timeouts": 0, "learned_timeout_failed": False})
+                if seconds is None:
+                    entry["timeouts"] += 1
+                else:
+                    entry["samples"] = (entry["samples"] + [round(seconds, 3)])[-MAX_SAMPLES:]
+                entry["learned_timeout_failed"] = learned_timeout_failed
+
+    def save(self):
+        with self._lock:
+            new, self._new = self._new, {}
+        if not new:
+            return
+        merged = self._load()
+        for key, delta in new.items():
+            entry = merged.setdefault(key, {"samples": [], "timeouts": 0, "learned_timeout_failed": False})
+            entry["samples"] = (entry["samples"] + delta["samples"])[-MAX_SAMPLES:]
+            entry["timeouts"] += delta["timeouts"]
+            entry["learned_timeout_failed"] = delta["learned_timeout_failed"]
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(merged, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save wait profile: {e}")
+
+
+def get_profile():
+    """Process-wide wait profile, saved at interpreter exit"""
+    global _profile
+    with _profile_lock:
+        if _profile is None:
+            _profile = WaitProfile()
+            atexit.register(_profile.save)
+        return _profile
+
+
+def resolve_timeout(key, cap):
+    """(timeout, learned) for a condition key; cap is the caller's / configured timeout"""
+    conf = settings()
+    locator_text = (key or "").lower()
+    for pattern, seconds in conf["overrides"]:
+        if pattern in locator_text:
+            return seconds, False
+    if key is None or not conf["learning"]:
+        return cap, False
+
+    entry = get_profile().entry(key)
+    if entry["learned_timeout_failed"] or len(entry["samples"]) < conf["min_samples"]:
+        return cap, False
+    learned = max(conf["min_timeout"], percentile(entry["samples"], 99) * conf["factor"])
+    return min(cap, learned), learned < cap
+
+
+class PolicyWait(WebDriverWait):
+    """WebDriverWait with learned per-locator timeouts and a backing-off poll"""
+
+    def __init__(self, driver, timeout=None, ignored_exceptions=None):
+        timeout = settings()["default_timeout"] if timeout is None else timeout
+        super().__init__(driver, timeout, poll_frequency=FIRST_POLL, ignored_exceptions=ignored_exceptions)
+
+    def until(self, method, message=""):
+        key = condition_key(method)
+        timeout, learned = resolve_timeout(key, self._timeout)
+        screen = stacktrace = None
+        started = time.monotonic()
+        end_time = started + timeout
+        for interval in poll_schedule():
+            try:
+                value = method(self._driver)
+                if value:
+                    if key is not None and settings()["learning"]:
+                        get_profile().record(key, time.monotonic() - started)
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            now = time.monotonic()
+            if now > end_time:
+                break
+            time.sleep(min(interval, max(0.0, end_time - now) + 0.001))
+
+        if key is not None and settings()["learning"]:
+            get_profile().record(key, None, learned_timeout_failed=learned)
+        if learned:
+            logger.info(f"Learned timeout {timeout:.1f}s expired (cap {self._timeout:.1f}s) for {key}")
+        raise TimeoutException(message, screen, stacktrace)
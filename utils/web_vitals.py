@@ -0,0 +1,194 @@
+"""
+Core Web Vitals for the pages a test visits.
+
+A PerformanceObserver script is registered to run at document start of every page
+(Chromium CDP `Page.addScriptToEvaluateOnNewDocument`). It keeps, in `window.__webVitals`:
+LCP, CLS (largest session window), INP (slowest interaction), long tasks / total blocking
+time, and "marks" - the time the first element of a locator appeared, such as the first
+doctor card on the search results (`DoctorsPage.VITALS_MARKS`). Times are milliseconds
+since the navigation started.
+
+Without CDP the script is installed right after each `driver.get`; buffered entries are
+still reported, but marks that already matched then carry the install time.
+
+Values are read with `capture_web_vitals(driver, label)` (e.g. `DoctorsPage.get_web_vitals`)
+and once more when the test ends; each test's captures are attached to Allure.
+"""
+import json
+
+import allure
+from selenium.webdriver.remote.command import Command
+
+from utils.command_tracer import attach_tracer
+from utils.config_reader import ConfigReader
+from utils.locator_probe import to_query
+from utils.logger import get_logger
+
+logger = get_logger("web_vitals")
+
+# %s: marks as [[name, kind, value]] (locator_probe.to_query)
+VITALS_SCRIPT_TEMPLATE = """
+(function (marks) {
+    if (window.__webVitals) { return; }
+    var v = window.__webVitals = {lcp_ms: null, cls: 0, inp_ms: null, long_tasks: 0,
+                                  long_task_ms: 0, total_blocking_ms: 0, marks: {}};
+    var observe = function (type, callback, options) {
+        try {
+            var init = {type: type, buffered: true};
+            Object.keys(options || {}).forEach(function (k) { init[k] = options[k]; });
+            new PerformanceObserver(function (list) { list.getEntries().forEach(callback); }).observe(init);
+        } catch (e) {}
+    };
+    observe('largest-contentful-paint', function (e) { v.lcp_ms = Math.round(e.renderTime || e.startTime); });
+    // CLS: shifts less than 1s apart form a session (max 5s); the largest session counts
+    var session = 0, sessionStart = 0, lastShift = 0;
+    observe('layout-shift', function (e) {
+        if (e.hadRecentInput) { return; }
+        if (session && e.startTime - lastShift < 1000 && e.startTime - sessionStart < 5000) {
+            session += e.value;
+        } else {
+            session = e.value;
+            sessionStart = e.startTime;
+        }
+        lastShift = e.startTime;
+        v.cls = Math.max(v.cls, Math.round(session * 10000) / 10000);
+    });
+    observe('event', function (e) {
+        if (e.interactionId) { v.inp_ms = Math.max(v.inp_ms || 0, Math.round(e.duration)); }
+    }, {durationThreshold: 16});
+    observe('longtask', function (e) {
+        v.long_tasks += 1;
+        v.long_task_ms += Math.round(e.duration);
+        v.total_blocking_ms += Math.max(0, Math.round(e.duration - 50));
+    });
+
+    var pending = marks.slice();
+    var found = function (q) {
+        try {
+            if (q[1] === 'xpath') {
+                return document.evaluate(q[2], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            }
+            return document.querySelector(q[2]);
+        } catch (e) {
+            return null;
+        }
+    };
+    var check = function () {
+        pending = pending.filter(function (q) {
+            if (!found(q)) { return true; }
+            v.marks[q[0]] = Math.round(performance.now());
+            return false;
+        });
+        if (!pending.length && observer) { observer.disconnect(); }
+    };
+    var observer = null;
+    if (pending.length) {
+        observer = new MutationObserver(check);
+        observer.observe(document, {childList: true, subtree: true});
+        check();
+    }
+})(%s);
+"""
+
+READ_SCRIPT = """
+var v = window.__webVitals;
+if (!v) { return null; }
+var copy = JSON.parse(JSON.stringify(v));
+copy.url = location.href;
+return copy;
+"""
+
+_defaults = {}
+
+
+def is_enabled(cfg=None):
+    """web_vitals=true (default) in config"""
+    if "enabled" not in _defaults:
+        cfg = cfg or ConfigReader()
+        _defaults["enabled"] = (cfg.get_value("web_vitals", "true") or "").lower() == "true"
+    return _defaults["enabled"]
+
+
+class VitalsCollector:
+    """Installs the observer script for one test and keeps its captures"""
+
+    def __init__(self, driver, nodeid, marks=None):
+        self.driver = driver
+        self.nodeid = nodeid
+        self.pages = []
+        self.source = VITALS_SCRIPT_TEMPLATE % json.dumps(
+            [to_query(name, locator) for name, locator in (marks or {}).items()])
+        self._identifier = None
+
+    def install(self):
+        """Register at document start (CDP), else re-install after every driver.get"""
+        try:
+            result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": self.source})
+            self._identifier = result["identifier"]
+        except Exception as e:
+            logger.debug(f"CDP unavailable ({e}), installing Web Vitals observers after each page load")
+            attach_tracer(self.driver).add_listener(self)
+
+    def __call__(self, command, params):
+        if command == Command.GET:
+            try:
+                self.driver.execute_script(self.source)
+            except Exception as e:
+                logger.debug("Web Vitals install failed: %s", e)
+
+    def uninstall(self):
+        """Drop the init script so a pooled session is clean for the next test"""
+        if self._identifier is not None:
+            try:
+                self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": self._identifier})
+            except Exception:
+                pass
+            self._identifier = None
+        else:
+            attach_tracer(self.driver).remove_listener(self)
+
+    def capture(self, label):
+        """Current page's values, or None when the observers are not on this page"""
+        try:
+            vitals = self.driver.execute_script(READ_SCRIPT)
+        except Exception as e:
+            logger.debug("Web Vitals read failed for %s: %s", label, e)
+            return None
+        if not vitals:
+            return None
+        vitals.update({"test": self.nodeid, "label": label})
+        self.pages.append(vitals)
+        logger.info(
+            f"Web Vitals {label} ({vitals['url']}): LCP {vitals['lcp_ms']}ms, CLS {vitals['cls']}, "
+            f"INP {vitals['inp_ms']}ms, {vitals['long_tasks']} long tasks (TBT {vitals['total_blocking_ms']}ms)"
+            + "".join(f", {name} {ms}ms" for name, ms in vitals["marks"].items())
+        )
+        return vitals
+
+
+def start_web_vitals(driver, nodeid, marks=None):
+    """Begin observing for a test (driver fixture); marks: name -> locator"""
+    collector = VitalsCollector(driver, nodeid, marks)
+    collector.install()
+    driver._web_vitals = collector
+    return collector
+
+
+def capture_web_vitals(driver, label):
+    """Read the current page's vitals; None unless observing"""
+    collector = getattr(driver, "_web_vitals", None)
+    return collector.capture(label) if collector is not None else None
+
+
+def finish_web_vitals(driver):
+    """Capture the final page, stop observing and attach the test's captures to Allure"""
+    collector = getattr(driver, "_web_vitals", None)
+    if collector is None:
+        return []
+    collector.capture("end of test")
+    collector.uninstall()
+    driver._web_vitals = None
+    if collector.pages:
+        allure.attach(json.dumps(collector.pages, indent=2), name="web_vitals",
+                      attachment_type=allure.attachment_type.JSON)
+    return collector.pages
@@ -0,0 +1,18 @@
+import os
+
+# Set by utils/parallel_runner.py for every shard process it starts
+WORKER_ENV_VAR = "PRACTO_WORKER_ID"
+
+
+def get_worker_id():
+    """Return the id of the current parallel worker (e.g. 'gw0') or None when running serially"""
+    return os.environ.get(WORKER_ENV_VAR) or os.environ.get("PYTEST_XDIST_WORKER") or None
+
+
+def worker_file_name(base_name):
+    """Add the worker id to a file name: 'test_run.log' -> 'test_run_gw0.log'"""
+    worker_id = get_worker_id()
+    if not worker_id:
+        return base_name
+    root, ext = os.path.splitext(base_name)
+    return f"{root}_{worker_id}{ext}"